@@ -20,7 +20,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import FastAPI, HTTPException, Query, Request
-from fastapi.responses import JSONResponse, RedirectResponse, StreamingResponse
+from fastapi.responses import JSONResponse, RedirectResponse, Response, StreamingResponse
 from pydantic import BaseModel
 
 from agent.core.dedup import compute_dedup_key, compute_rollout_workload_key, utcnow
@@ -2523,7 +2523,7 @@ async def execute_case_action(case_id: str, action_id: str, req: CaseActionTrans
 
 
 @app.post("/api/v1/cases/{case_id}/chat")
-async def case_chat(case_id: str, req: Dict[str, Any]) -> Dict[str, Any]:
+async def case_chat(case_id: str, req: Dict[str, Any]) -> Response:
     """
     Tool-using chat endpoint for the case detail page.
 
@@ -2589,7 +2589,9 @@ async def case_chat(case_id: str, req: Dict[str, Any]) -> Dict[str, Any]:
             run_id=str(creq.run_id),
         )
         out = ChatResponse(reply=res.reply, tool_events=res.tool_events, updated_analysis=res.updated_analysis)
-        return out.model_dump(mode="json")
+        # Serialize once with pydantic-core; returning a dict would re-walk the (possibly large)
+        # rerun analysis through jsonable_encoder + json.dumps.
+        return Response(content=out.model_dump_json(), media_type="application/json")
     finally:
         conn.close()
 
@@ -2941,6 +2943,8 @@ async def alerts(request: Request) -> JSONResponse:
         seen_keys: set[str] = set()
         now_utc = utcnow()
         env_cluster = (os.getenv("CLUSTER_NAME") or "").strip() or None
+        # Per-batch constant for workload msg-ids
+        hour_bucket = compute_utc_hour_bucket_label(now=now_utc)
         enqueued = 0
         skipped_resolved = 0
         skipped_allowlist = 0
@@ -3001,8 +3005,9 @@ async def alerts(request: Request) -> JSONResponse:
                                 include_container=(a == "KubernetesContainerOomKiller"),
                             )
                             if wk:
-                                hb = compute_utc_hour_bucket_label(now=now_utc)
-                                msg_id = compute_queue_msg_id_for_workload_hour(workload_key=wk, hour_bucket=hb)
+                                msg_id = compute_queue_msg_id_for_workload_hour(
+                                    workload_key=wk, hour_bucket=hour_bucket
+                                )
                         except Exception:
                             msg_id = None
 
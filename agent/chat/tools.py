@@ -5,11 +5,12 @@ import logging
 import re
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from agent.authz.policy import ActionPolicy, ChatPolicy, redact_text
 from agent.core.models import AlertInstance, Investigation, TargetRef, TimeWindow
-from agent.dump import investigation_to_json_dict
+from agent.core.time_window import parse_time_window
+from agent.dump import analysis_to_json_dict
 from agent.memory.case_retrieval import find_similar_runs
 from agent.memory.skills import match_skills
 from agent.pipeline.pipeline import run_investigation
@@ -244,1266 +245,1426 @@ class ToolResult:
     updated_analysis: Optional[Dict[str, Any]] = None
 
 
-def run_tool(
-    *,
-    policy: ChatPolicy,
-    action_policy: Optional[ActionPolicy],
-    tool: str,
-    args: Dict[str, Any],
-    analysis_json: Dict[str, Any],
-    case_id: Optional[str] = None,
-    run_id: Optional[str] = None,
-    caller_logger: Optional[logging.Logger] = None,
-) -> ToolResult:
-    """
-    Execute a single chat tool call with policy enforcement.
+@dataclass(frozen=True)
+class _ToolCall:
+    """Per-call context handed to each tool handler."""
+
+    tool: str
+    args: Dict[str, Any]
+    policy: ChatPolicy
+    action_policy: Optional[ActionPolicy]
+    analysis_json: Dict[str, Any]
+    tgt: Dict[str, Any]
+    namespace: Optional[str]
+    cluster: Optional[str]
+    case_id: Optional[str]
+    run_id: Optional[str]
+    log: logging.Logger
+
+
+# --------------------
+# promql.*
+# --------------------
+
+
+def _tool_promql_instant(call: _ToolCall) -> ToolResult:
+    args, policy, log = call.args, call.policy, call.log
+    if not policy.allow_promql:
+        return ToolResult(ok=False, error="tool_not_allowed")
+    q = str(args.get("query") or "").strip()
+    if not q:
+        return ToolResult(ok=False, error="query_required")
+    at = _parse_iso(str(args.get("at") or "")) or datetime.now(timezone.utc)
+    try:
+        res = query_prometheus_instant(q, at)
+        res = _cap_list(res, policy.max_promql_series)
+        return ToolResult(ok=True, result=_compact({"at": at.isoformat(), "query": q, "result": res}))
+    except Exception as e:
+        log.warning(f"PromQL query failed: query={q[:100]} error={str(e)[:200]}")
+        return ToolResult(ok=False, error=f"promql_error:{type(e).__name__}")
+
+
+# --------------------
+# k8s.*
+# --------------------
+
+
+def _tool_k8s_pod_context(call: _ToolCall) -> ToolResult:
+    args, policy, tgt, log = call.args, call.policy, call.tgt, call.log
+    if not policy.allow_k8s_read:
+        return ToolResult(ok=False, error="tool_not_allowed")
+    pod = str(args.get("pod") or "").strip() or (tgt.get("pod") if isinstance(tgt, dict) else None)
+    ns = str(args.get("namespace") or "").strip() or (tgt.get("namespace") if isinstance(tgt, dict) else None)
+
+    # Support Jobs: if no pod but we have a Job workload, find the pods created by the Job
+    if not pod and ns and isinstance(tgt, dict):
+        workload_kind = tgt.get("kind")
+        workload_name = tgt.get("workload")
+        if workload_kind == "Job" and workload_name:
+            try:
+                k8s = get_k8s_provider()
+                # Find pods created by this Job using label selector
+                pods = k8s.list_pods(namespace=ns, label_selector=f"job-name={workload_name}")
+                if pods:
+                    # Use the most recent pod (Jobs may have multiple pods if they failed and restarted)
+                    pod = (
+                        max(pods, key=lambda p: p.get("metadata", {}).get("creationTimestamp", ""))
+                        .get("metadata", {})
+                        .get("name")
+                    )
+            except Exception:
+                pass  # Fall through to error below
+
+    if not pod or not ns:
+        missing = []
+        if not pod:
+            missing.append("pod_name")
+        if not ns:
+            missing.append("namespace")
+        return ToolResult(ok=False, error=f"missing_required_args:{','.join(missing)}")
+    try:
+        from agent.playbooks.k8s_context import gather_pod_context
+
+        out = gather_pod_context(str(pod), str(ns), events_limit=int(args.get("events_limit") or 20))
+        return ToolResult(ok=True, result=_compact(out))
+    except Exception as e:
+        log.warning(f"K8s pod context failed: pod={pod} ns={ns} error={str(e)[:200]}")
+        return ToolResult(ok=False, error=f"k8s_error:{type(e).__name__}")
+
+
+def _tool_k8s_rollout_status(call: _ToolCall) -> ToolResult:
+    args, policy, tgt, log = call.args, call.policy, call.tgt, call.log
+    if not policy.allow_k8s_read:
+        return ToolResult(ok=False, error="tool_not_allowed")
+    ns = str(args.get("namespace") or "").strip() or (tgt.get("namespace") if isinstance(tgt, dict) else None)
+    kind = str(args.get("kind") or "").strip() or (tgt.get("workload_kind") if isinstance(tgt, dict) else None)
+    name = str(args.get("name") or "").strip() or (tgt.get("workload_name") if isinstance(tgt, dict) else None)
+    if not ns or not kind or not name:
+        return ToolResult(ok=False, error="namespace_kind_name_required")
+    try:
+        k8s = get_k8s_provider()
+        rs = k8s.get_workload_rollout_status(namespace=str(ns), kind=str(kind), name=str(name))
+        return ToolResult(ok=True, result=_compact(rs))
+    except Exception as e:
+        # Include error message for debugging, not just exception type
+        error_msg = str(e)[:200]  # Truncate to avoid token bloat
+        log.warning(f"K8s rollout status failed: ns={ns} kind={kind} name={name} error={error_msg}")
+        return ToolResult(ok=False, error=f"k8s_error:{type(e).__name__}:{error_msg}")
+
+
+def _tool_k8s_events(call: _ToolCall) -> ToolResult:
+    args, policy, tgt, log = call.args, call.policy, call.tgt, call.log
+    if not policy.allow_k8s_events:
+        return ToolResult(ok=False, error="tool_not_allowed")
+    ns = str(args.get("namespace") or "").strip() or (tgt.get("namespace") if isinstance(tgt, dict) else None)
+    if not ns:
+        return ToolResult(ok=False, error="namespace_required")
+
+    # Optional resource_type and resource_name (defaults to namespace-wide events)
+    resource_type = str(args.get("resource_type") or "").strip() or None
+    resource_name = str(args.get("resource_name") or "").strip() or None
+
+    # If no resource specified, try to default to investigation target
+    if not resource_type and not resource_name and isinstance(tgt, dict):
+        # Try pod first
+        pod = tgt.get("pod")
+        if pod:
+            resource_type = "pod"
+            resource_name = str(pod)
+        else:
+            # Try workload
+            workload_kind = tgt.get("workload_kind")
+            workload_name = tgt.get("workload_name")
+            if workload_kind and workload_name:
+                resource_type = str(workload_kind).lower()
+                resource_name = str(workload_name)
 
-    Args:
-        caller_logger: Optional logger to use instead of the default chat logger.
-                      This allows RCA and other callers to use their own logger
-                      for clearer log attribution.
-    """
-    tool = (tool or "").strip()
-    if not tool:
-        return ToolResult(ok=False, error="tool_missing")
+    limit = int(args.get("limit") or 30)
+    limit = max(5, min(limit, 100))  # Clamp between 5-100
 
-    # Use caller's logger if provided, otherwise use module logger
-    log = caller_logger or logger
+    try:
+        k8s = get_k8s_provider()
+        events = k8s.get_events(
+            namespace=str(ns), resource_type=resource_type, resource_name=resource_name, limit=limit
+        )
+        return ToolResult(
+            ok=True,
+            result=_compact(
+                {
+                    "namespace": ns,
+                    "resource_type": resource_type or "namespace-wide",
+                    "resource_name": resource_name or "all",
+                    "events": events,
+                }
+            ),
+        )
+    except Exception as e:
+        log.warning(f"K8s events query failed: ns={ns} type={resource_type} name={resource_name} error={str(e)[:200]}")
+        return ToolResult(ok=False, error=f"k8s_error:{type(e).__name__}")
 
-    # Log tool invocation with compact args (for debugging)
-    compact_args = {
-        k: v for k, v in (args or {}).items() if k in ["namespace", "pod", "kind", "name", "query", "limit", "repo"]
-    }
-    log.info(f"Tool call: {tool} args={compact_args} case_id={case_id}")
 
-    tgt = analysis_json.get("target") if isinstance(analysis_json.get("target"), dict) else {}
-    namespace = tgt.get("namespace") if isinstance(tgt, dict) else None
-    cluster = tgt.get("cluster") if isinstance(tgt, dict) else None
-    ok_scope, why_scope = _ensure_allowed_scope(
-        policy, namespace=str(namespace) if namespace else None, cluster=str(cluster) if cluster else None
-    )
-    if not ok_scope and tool.startswith(("k8s.", "logs.", "rerun.", "memory.")):
-        log.warning(f"Tool {tool} blocked by scope policy: {why_scope}")
-        return ToolResult(ok=False, error=why_scope)
+# --------------------
+# aws.*
+# --------------------
 
-    # --------------------
-    # promql.*
-    # --------------------
-    if tool == "promql.instant":
-        if not policy.allow_promql:
-            return ToolResult(ok=False, error="tool_not_allowed")
-        q = str(args.get("query") or "").strip()
-        if not q:
-            return ToolResult(ok=False, error="query_required")
-        at = _parse_iso(str(args.get("at") or "")) or datetime.now(timezone.utc)
-        try:
-            res = query_prometheus_instant(q, at)
-            res = _cap_list(res, policy.max_promql_series)
-            return ToolResult(ok=True, result=_compact({"at": at.isoformat(), "query": q, "result": res}))
-        except Exception as e:
-            log.warning(f"PromQL query failed: query={q[:100]} error={str(e)[:200]}")
-            return ToolResult(ok=False, error=f"promql_error:{type(e).__name__}")
-
-    # --------------------
-    # k8s.*
-    # --------------------
-    if tool == "k8s.pod_context":
-        if not policy.allow_k8s_read:
-            return ToolResult(ok=False, error="tool_not_allowed")
-        pod = str(args.get("pod") or "").strip() or (tgt.get("pod") if isinstance(tgt, dict) else None)
-        ns = str(args.get("namespace") or "").strip() or (tgt.get("namespace") if isinstance(tgt, dict) else None)
-
-        # Support Jobs: if no pod but we have a Job workload, find the pods created by the Job
-        if not pod and ns and isinstance(tgt, dict):
-            workload_kind = tgt.get("kind")
-            workload_name = tgt.get("workload")
-            if workload_kind == "Job" and workload_name:
-                try:
-                    k8s = get_k8s_provider()
-                    # Find pods created by this Job using label selector
-                    pods = k8s.list_pods(namespace=ns, label_selector=f"job-name={workload_name}")
-                    if pods:
-                        # Use the most recent pod (Jobs may have multiple pods if they failed and restarted)
-                        pod = (
-                            max(pods, key=lambda p: p.get("metadata", {}).get("creationTimestamp", ""))
-                            .get("metadata", {})
-                            .get("name")
-                        )
-                except Exception:
-                    pass  # Fall through to error below
-
-        if not pod or not ns:
-            missing = []
-            if not pod:
-                missing.append("pod_name")
-            if not ns:
-                missing.append("namespace")
-            return ToolResult(ok=False, error=f"missing_required_args:{','.join(missing)}")
-        try:
-            from agent.playbooks.k8s_context import gather_pod_context
-
-            out = gather_pod_context(str(pod), str(ns), events_limit=int(args.get("events_limit") or 20))
-            return ToolResult(ok=True, result=_compact(out))
-        except Exception as e:
-            log.warning(f"K8s pod context failed: pod={pod} ns={ns} error={str(e)[:200]}")
-            return ToolResult(ok=False, error=f"k8s_error:{type(e).__name__}")
-
-    if tool == "k8s.rollout_status":
-        if not policy.allow_k8s_read:
-            return ToolResult(ok=False, error="tool_not_allowed")
-        ns = str(args.get("namespace") or "").strip() or (tgt.get("namespace") if isinstance(tgt, dict) else None)
-        kind = str(args.get("kind") or "").strip() or (tgt.get("workload_kind") if isinstance(tgt, dict) else None)
-        name = str(args.get("name") or "").strip() or (tgt.get("workload_name") if isinstance(tgt, dict) else None)
-        if not ns or not kind or not name:
-            return ToolResult(ok=False, error="namespace_kind_name_required")
-        try:
-            k8s = get_k8s_provider()
-            rs = k8s.get_workload_rollout_status(namespace=str(ns), kind=str(kind), name=str(name))
-            return ToolResult(ok=True, result=_compact(rs))
-        except Exception as e:
-            # Include error message for debugging, not just exception type
-            error_msg = str(e)[:200]  # Truncate to avoid token bloat
-            log.warning(f"K8s rollout status failed: ns={ns} kind={kind} name={name} error={error_msg}")
-            return ToolResult(ok=False, error=f"k8s_error:{type(e).__name__}:{error_msg}")
-
-    if tool == "k8s.events":
-        if not policy.allow_k8s_events:
-            return ToolResult(ok=False, error="tool_not_allowed")
-        ns = str(args.get("namespace") or "").strip() or (tgt.get("namespace") if isinstance(tgt, dict) else None)
-        if not ns:
-            return ToolResult(ok=False, error="namespace_required")
-
-        # Optional resource_type and resource_name (defaults to namespace-wide events)
-        resource_type = str(args.get("resource_type") or "").strip() or None
-        resource_name = str(args.get("resource_name") or "").strip() or None
-
-        # If no resource specified, try to default to investigation target
-        if not resource_type and not resource_name and isinstance(tgt, dict):
-            # Try pod first
-            pod = tgt.get("pod")
-            if pod:
-                resource_type = "pod"
-                resource_name = str(pod)
-            else:
-                # Try workload
-                workload_kind = tgt.get("workload_kind")
-                workload_name = tgt.get("workload_name")
-                if workload_kind and workload_name:
-                    resource_type = str(workload_kind).lower()
-                    resource_name = str(workload_name)
-
-        limit = int(args.get("limit") or 30)
-        limit = max(5, min(limit, 100))  # Clamp between 5-100
 
-        try:
-            k8s = get_k8s_provider()
-            events = k8s.get_events(
-                namespace=str(ns), resource_type=resource_type, resource_name=resource_name, limit=limit
-            )
-            return ToolResult(
-                ok=True,
-                result=_compact(
-                    {
-                        "namespace": ns,
-                        "resource_type": resource_type or "namespace-wide",
-                        "resource_name": resource_name or "all",
-                        "events": events,
-                    }
-                ),
-            )
-        except Exception as e:
-            log.warning(
-                f"K8s events query failed: ns={ns} type={resource_type} name={resource_name} error={str(e)[:200]}"
-            )
-            return ToolResult(ok=False, error=f"k8s_error:{type(e).__name__}")
+def _tool_aws_ec2_status(call: _ToolCall) -> ToolResult:
+    args, policy, analysis_json = call.args, call.policy, call.analysis_json
+    if not policy.allow_aws_read:
+        return ToolResult(ok=False, error="tool_not_allowed")
+
+    instance_id = str(args.get("instance_id") or "").strip()
+    region = str(args.get("region") or "").strip()
 
-    # --------------------
-    # aws.*
-    # --------------------
-    if tool == "aws.ec2_status":
-        if not policy.allow_aws_read:
-            return ToolResult(ok=False, error="tool_not_allowed")
+    # Auto-discover from investigation metadata if not provided
+    if not instance_id or not region:
+        aws_metadata = analysis_json.get("evidence", {}).get("aws", {}).get("metadata", {})
+        if not instance_id and aws_metadata.get("ec2_instances"):
+            instance_id = aws_metadata["ec2_instances"][0]
+        if not region:
+            region = aws_metadata.get("region", "us-east-1")
 
-        instance_id = str(args.get("instance_id") or "").strip()
-        region = str(args.get("region") or "").strip()
+    if not instance_id:
+        return ToolResult(ok=False, error="instance_id_required")
 
-        # Auto-discover from investigation metadata if not provided
-        if not instance_id or not region:
-            aws_metadata = analysis_json.get("evidence", {}).get("aws", {}).get("metadata", {})
-            if not instance_id and aws_metadata.get("ec2_instances"):
-                instance_id = aws_metadata["ec2_instances"][0]
-            if not region:
-                region = aws_metadata.get("region", "us-east-1")
+    # Region allowlist check
+    if policy.aws_region_allowlist and region not in policy.aws_region_allowlist:
+        return ToolResult(ok=False, error=f"region_not_allowed:{region}")
 
-        if not instance_id:
-            return ToolResult(ok=False, error="instance_id_required")
+    try:
+        from agent.providers.aws_provider import get_aws_provider
 
-        # Region allowlist check
-        if policy.aws_region_allowlist and region not in policy.aws_region_allowlist:
-            return ToolResult(ok=False, error=f"region_not_allowed:{region}")
+        aws = get_aws_provider()
+        result = aws.get_ec2_instance_status(instance_id, region)
+        return ToolResult(ok=True, result=_compact(result))
+    except Exception as e:
+        return ToolResult(ok=False, error=f"aws_error:{type(e).__name__}")
 
-        try:
-            from agent.providers.aws_provider import get_aws_provider
 
-            aws = get_aws_provider()
-            result = aws.get_ec2_instance_status(instance_id, region)
-            return ToolResult(ok=True, result=_compact(result))
-        except Exception as e:
-            return ToolResult(ok=False, error=f"aws_error:{type(e).__name__}")
+def _tool_aws_ebs_health(call: _ToolCall) -> ToolResult:
+    args, policy, analysis_json = call.args, call.policy, call.analysis_json
+    if not policy.allow_aws_read:
+        return ToolResult(ok=False, error="tool_not_allowed")
 
-    if tool == "aws.ebs_health":
-        if not policy.allow_aws_read:
-            return ToolResult(ok=False, error="tool_not_allowed")
+    volume_id = str(args.get("volume_id") or "").strip()
+    region = str(args.get("region") or "").strip()
 
-        volume_id = str(args.get("volume_id") or "").strip()
-        region = str(args.get("region") or "").strip()
+    # Auto-discover from investigation metadata
+    if not volume_id or not region:
+        aws_metadata = analysis_json.get("evidence", {}).get("aws", {}).get("metadata", {})
+        if not volume_id and aws_metadata.get("ebs_volumes"):
+            volume_id = aws_metadata["ebs_volumes"][0]
+        if not region:
+            region = aws_metadata.get("region", "us-east-1")
 
-        # Auto-discover from investigation metadata
-        if not volume_id or not region:
-            aws_metadata = analysis_json.get("evidence", {}).get("aws", {}).get("metadata", {})
-            if not volume_id and aws_metadata.get("ebs_volumes"):
-                volume_id = aws_metadata["ebs_volumes"][0]
-            if not region:
-                region = aws_metadata.get("region", "us-east-1")
+    if not volume_id:
+        return ToolResult(ok=False, error="volume_id_required")
 
-        if not volume_id:
-            return ToolResult(ok=False, error="volume_id_required")
+    if policy.aws_region_allowlist and region not in policy.aws_region_allowlist:
+        return ToolResult(ok=False, error=f"region_not_allowed:{region}")
 
-        if policy.aws_region_allowlist and region not in policy.aws_region_allowlist:
-            return ToolResult(ok=False, error=f"region_not_allowed:{region}")
+    try:
+        from agent.providers.aws_provider import get_aws_provider
 
-        try:
-            from agent.providers.aws_provider import get_aws_provider
-
-            aws = get_aws_provider()
-            result = aws.get_ebs_volume_health(volume_id, region)
-            return ToolResult(ok=True, result=_compact(result))
-        except Exception as e:
-            return ToolResult(ok=False, error=f"aws_error:{type(e).__name__}")
-
-    if tool == "aws.elb_health":
-        if not policy.allow_aws_read:
-            return ToolResult(ok=False, error="tool_not_allowed")
-
-        load_balancer = str(args.get("load_balancer") or "").strip()
-        target_group_arn = str(args.get("target_group_arn") or "").strip()
-        region = str(args.get("region") or "").strip()
-
-        # Auto-discover from investigation metadata
-        if (not load_balancer and not target_group_arn) or not region:
-            aws_metadata = analysis_json.get("evidence", {}).get("aws", {}).get("metadata", {})
-            if not load_balancer and not target_group_arn:
-                if aws_metadata.get("elb_names"):
-                    load_balancer = aws_metadata["elb_names"][0]
-                elif aws_metadata.get("elbv2_target_groups"):
-                    target_group_arn = aws_metadata["elbv2_target_groups"][0]
-            if not region:
-                region = aws_metadata.get("region", "us-east-1")
+        aws = get_aws_provider()
+        result = aws.get_ebs_volume_health(volume_id, region)
+        return ToolResult(ok=True, result=_compact(result))
+    except Exception as e:
+        return ToolResult(ok=False, error=f"aws_error:{type(e).__name__}")
 
+
+def _tool_aws_elb_health(call: _ToolCall) -> ToolResult:
+    args, policy, analysis_json = call.args, call.policy, call.analysis_json
+    if not policy.allow_aws_read:
+        return ToolResult(ok=False, error="tool_not_allowed")
+
+    load_balancer = str(args.get("load_balancer") or "").strip()
+    target_group_arn = str(args.get("target_group_arn") or "").strip()
+    region = str(args.get("region") or "").strip()
+
+    # Auto-discover from investigation metadata
+    if (not load_balancer and not target_group_arn) or not region:
+        aws_metadata = analysis_json.get("evidence", {}).get("aws", {}).get("metadata", {})
         if not load_balancer and not target_group_arn:
-            return ToolResult(ok=False, error="load_balancer_or_target_group_required")
+            if aws_metadata.get("elb_names"):
+                load_balancer = aws_metadata["elb_names"][0]
+            elif aws_metadata.get("elbv2_target_groups"):
+                target_group_arn = aws_metadata["elbv2_target_groups"][0]
+        if not region:
+            region = aws_metadata.get("region", "us-east-1")
 
-        if policy.aws_region_allowlist and region not in policy.aws_region_allowlist:
-            return ToolResult(ok=False, error=f"region_not_allowed:{region}")
+    if not load_balancer and not target_group_arn:
+        return ToolResult(ok=False, error="load_balancer_or_target_group_required")
 
-        try:
-            from agent.providers.aws_provider import get_aws_provider
-
-            aws = get_aws_provider()
-            if target_group_arn:
-                result = aws.get_elbv2_target_health(target_group_arn, region)
-            else:
-                result = aws.get_elb_target_health(load_balancer, region)
-            return ToolResult(ok=True, result=_compact(result))
-        except Exception as e:
-            return ToolResult(ok=False, error=f"aws_error:{type(e).__name__}")
-
-    if tool == "aws.rds_status":
-        if not policy.allow_aws_read:
-            return ToolResult(ok=False, error="tool_not_allowed")
-
-        db_instance_id = str(args.get("db_instance_id") or "").strip()
-        region = str(args.get("region") or "").strip()
-
-        # Auto-discover from investigation metadata
-        if not db_instance_id or not region:
-            aws_metadata = analysis_json.get("evidence", {}).get("aws", {}).get("metadata", {})
-            if not db_instance_id and aws_metadata.get("rds_instances"):
-                db_instance_id = aws_metadata["rds_instances"][0]
-            if not region:
-                region = aws_metadata.get("region", "us-east-1")
-
-        if not db_instance_id:
-            return ToolResult(ok=False, error="db_instance_id_required")
-
-        if policy.aws_region_allowlist and region not in policy.aws_region_allowlist:
-            return ToolResult(ok=False, error=f"region_not_allowed:{region}")
+    if policy.aws_region_allowlist and region not in policy.aws_region_allowlist:
+        return ToolResult(ok=False, error=f"region_not_allowed:{region}")
 
-        try:
-            from agent.providers.aws_provider import get_aws_provider
-
-            aws = get_aws_provider()
-            result = aws.get_rds_instance_status(db_instance_id, region)
-            return ToolResult(ok=True, result=_compact(result))
-        except Exception as e:
-            return ToolResult(ok=False, error=f"aws_error:{type(e).__name__}")
-
-    if tool == "aws.ecr_image":
-        if not policy.allow_aws_read:
-            return ToolResult(ok=False, error="tool_not_allowed")
-
-        repository = str(args.get("repository") or "").strip()
-        image_tag = str(args.get("image_tag") or "").strip()
-        region = str(args.get("region") or "").strip()
-
-        # Auto-discover from investigation metadata
-        if (not repository or not image_tag) or not region:
-            aws_metadata = analysis_json.get("evidence", {}).get("aws", {}).get("metadata", {})
-            if (not repository or not image_tag) and aws_metadata.get("ecr_repositories"):
-                ecr_ref = aws_metadata["ecr_repositories"][0]
-                if isinstance(ecr_ref, dict):
-                    repository = repository or ecr_ref.get("repository", "")
-                    image_tag = image_tag or ecr_ref.get("tag", "")
-                    region = region or ecr_ref.get("region", "us-east-1")
-            if not region:
-                region = aws_metadata.get("region", "us-east-1")
-
-        if not repository or not image_tag:
-            return ToolResult(ok=False, error="repository_and_image_tag_required")
-
-        if policy.aws_region_allowlist and region not in policy.aws_region_allowlist:
-            return ToolResult(ok=False, error=f"region_not_allowed:{region}")
+    try:
+        from agent.providers.aws_provider import get_aws_provider
 
-        try:
-            from agent.providers.aws_provider import get_aws_provider
+        aws = get_aws_provider()
+        if target_group_arn:
+            result = aws.get_elbv2_target_health(target_group_arn, region)
+        else:
+            result = aws.get_elb_target_health(load_balancer, region)
+        return ToolResult(ok=True, result=_compact(result))
+    except Exception as e:
+        return ToolResult(ok=False, error=f"aws_error:{type(e).__name__}")
 
-            aws = get_aws_provider()
-            result = aws.get_ecr_image_scan_findings(repository, image_tag, region)
-            return ToolResult(ok=True, result=_compact(result))
-        except Exception as e:
-            return ToolResult(ok=False, error=f"aws_error:{type(e).__name__}")
 
-    if tool == "aws.security_group":
-        if not policy.allow_aws_read:
-            return ToolResult(ok=False, error="tool_not_allowed")
+def _tool_aws_rds_status(call: _ToolCall) -> ToolResult:
+    args, policy, analysis_json = call.args, call.policy, call.analysis_json
+    if not policy.allow_aws_read:
+        return ToolResult(ok=False, error="tool_not_allowed")
 
-        security_group_id = str(args.get("security_group_id") or "").strip()
-        region = str(args.get("region") or "").strip()
+    db_instance_id = str(args.get("db_instance_id") or "").strip()
+    region = str(args.get("region") or "").strip()
 
-        # Auto-discover from investigation metadata
-        if not security_group_id or not region:
-            aws_metadata = analysis_json.get("evidence", {}).get("aws", {}).get("metadata", {})
-            if not security_group_id and aws_metadata.get("security_groups"):
-                security_group_id = aws_metadata["security_groups"][0]
-            if not region:
-                region = aws_metadata.get("region", "us-east-1")
+    # Auto-discover from investigation metadata
+    if not db_instance_id or not region:
+        aws_metadata = analysis_json.get("evidence", {}).get("aws", {}).get("metadata", {})
+        if not db_instance_id and aws_metadata.get("rds_instances"):
+            db_instance_id = aws_metadata["rds_instances"][0]
+        if not region:
+            region = aws_metadata.get("region", "us-east-1")
 
-        if not security_group_id:
-            return ToolResult(ok=False, error="security_group_id_required")
+    if not db_instance_id:
+        return ToolResult(ok=False, error="db_instance_id_required")
 
-        if policy.aws_region_allowlist and region not in policy.aws_region_allowlist:
-            return ToolResult(ok=False, error=f"region_not_allowed:{region}")
+    if policy.aws_region_allowlist and region not in policy.aws_region_allowlist:
+        return ToolResult(ok=False, error=f"region_not_allowed:{region}")
 
-        try:
-            from agent.providers.aws_provider import get_aws_provider
+    try:
+        from agent.providers.aws_provider import get_aws_provider
+
+        aws = get_aws_provider()
+        result = aws.get_rds_instance_status(db_instance_id, region)
+        return ToolResult(ok=True, result=_compact(result))
+    except Exception as e:
+        return ToolResult(ok=False, error=f"aws_error:{type(e).__name__}")
+
+
+def _tool_aws_ecr_image(call: _ToolCall) -> ToolResult:
+    args, policy, analysis_json = call.args, call.policy, call.analysis_json
+    if not policy.allow_aws_read:
+        return ToolResult(ok=False, error="tool_not_allowed")
+
+    repository = str(args.get("repository") or "").strip()
+    image_tag = str(args.get("image_tag") or "").strip()
+    region = str(args.get("region") or "").strip()
+
+    # Auto-discover from investigation metadata
+    if (not repository or not image_tag) or not region:
+        aws_metadata = analysis_json.get("evidence", {}).get("aws", {}).get("metadata", {})
+        if (not repository or not image_tag) and aws_metadata.get("ecr_repositories"):
+            ecr_ref = aws_metadata["ecr_repositories"][0]
+            if isinstance(ecr_ref, dict):
+                repository = repository or ecr_ref.get("repository", "")
+                image_tag = image_tag or ecr_ref.get("tag", "")
+                region = region or ecr_ref.get("region", "us-east-1")
+        if not region:
+            region = aws_metadata.get("region", "us-east-1")
 
-            aws = get_aws_provider()
-            result = aws.get_security_group_rules(security_group_id, region)
-            return ToolResult(ok=True, result=_compact(result))
-        except Exception as e:
-            return ToolResult(ok=False, error=f"aws_error:{type(e).__name__}")
+    if not repository or not image_tag:
+        return ToolResult(ok=False, error="repository_and_image_tag_required")
 
-    if tool == "aws.nat_gateway":
-        if not policy.allow_aws_read:
-            return ToolResult(ok=False, error="tool_not_allowed")
+    if policy.aws_region_allowlist and region not in policy.aws_region_allowlist:
+        return ToolResult(ok=False, error=f"region_not_allowed:{region}")
 
-        nat_gateway_id = str(args.get("nat_gateway_id") or "").strip()
-        region = str(args.get("region") or "").strip()
+    try:
+        from agent.providers.aws_provider import get_aws_provider
 
-        # Auto-discover from investigation metadata
-        if not nat_gateway_id or not region:
-            aws_metadata = analysis_json.get("evidence", {}).get("aws", {}).get("metadata", {})
-            if not nat_gateway_id and aws_metadata.get("nat_gateways"):
-                nat_gateway_id = aws_metadata["nat_gateways"][0]
-            if not region:
-                region = aws_metadata.get("region", "us-east-1")
+        aws = get_aws_provider()
+        result = aws.get_ecr_image_scan_findings(repository, image_tag, region)
+        return ToolResult(ok=True, result=_compact(result))
+    except Exception as e:
+        return ToolResult(ok=False, error=f"aws_error:{type(e).__name__}")
 
-        if not nat_gateway_id:
-            return ToolResult(ok=False, error="nat_gateway_id_required")
 
-        if policy.aws_region_allowlist and region not in policy.aws_region_allowlist:
-            return ToolResult(ok=False, error=f"region_not_allowed:{region}")
+def _tool_aws_security_group(call: _ToolCall) -> ToolResult:
+    args, policy, analysis_json = call.args, call.policy, call.analysis_json
+    if not policy.allow_aws_read:
+        return ToolResult(ok=False, error="tool_not_allowed")
 
-        try:
-            from agent.providers.aws_provider import get_aws_provider
+    security_group_id = str(args.get("security_group_id") or "").strip()
+    region = str(args.get("region") or "").strip()
+
+    # Auto-discover from investigation metadata
+    if not security_group_id or not region:
+        aws_metadata = analysis_json.get("evidence", {}).get("aws", {}).get("metadata", {})
+        if not security_group_id and aws_metadata.get("security_groups"):
+            security_group_id = aws_metadata["security_groups"][0]
+        if not region:
+            region = aws_metadata.get("region", "us-east-1")
+
+    if not security_group_id:
+        return ToolResult(ok=False, error="security_group_id_required")
 
-            aws = get_aws_provider()
-            result = aws.get_nat_gateway_status(nat_gateway_id, region)
-            return ToolResult(ok=True, result=_compact(result))
-        except Exception as e:
-            return ToolResult(ok=False, error=f"aws_error:{type(e).__name__}")
+    if policy.aws_region_allowlist and region not in policy.aws_region_allowlist:
+        return ToolResult(ok=False, error=f"region_not_allowed:{region}")
 
-    if tool == "aws.vpc_endpoint":
-        if not policy.allow_aws_read:
-            return ToolResult(ok=False, error="tool_not_allowed")
+    try:
+        from agent.providers.aws_provider import get_aws_provider
 
-        vpc_endpoint_id = str(args.get("vpc_endpoint_id") or "").strip()
-        region = str(args.get("region") or "").strip()
+        aws = get_aws_provider()
+        result = aws.get_security_group_rules(security_group_id, region)
+        return ToolResult(ok=True, result=_compact(result))
+    except Exception as e:
+        return ToolResult(ok=False, error=f"aws_error:{type(e).__name__}")
 
-        # Auto-discover from investigation metadata
-        if not vpc_endpoint_id or not region:
-            aws_metadata = analysis_json.get("evidence", {}).get("aws", {}).get("metadata", {})
-            if not vpc_endpoint_id and aws_metadata.get("vpc_endpoints"):
-                vpc_endpoint_id = aws_metadata["vpc_endpoints"][0]
-            if not region:
-                region = aws_metadata.get("region", "us-east-1")
 
-        if not vpc_endpoint_id:
-            return ToolResult(ok=False, error="vpc_endpoint_id_required")
+def _tool_aws_nat_gateway(call: _ToolCall) -> ToolResult:
+    args, policy, analysis_json = call.args, call.policy, call.analysis_json
+    if not policy.allow_aws_read:
+        return ToolResult(ok=False, error="tool_not_allowed")
 
-        if policy.aws_region_allowlist and region not in policy.aws_region_allowlist:
-            return ToolResult(ok=False, error=f"region_not_allowed:{region}")
+    nat_gateway_id = str(args.get("nat_gateway_id") or "").strip()
+    region = str(args.get("region") or "").strip()
 
-        try:
-            from agent.providers.aws_provider import get_aws_provider
+    # Auto-discover from investigation metadata
+    if not nat_gateway_id or not region:
+        aws_metadata = analysis_json.get("evidence", {}).get("aws", {}).get("metadata", {})
+        if not nat_gateway_id and aws_metadata.get("nat_gateways"):
+            nat_gateway_id = aws_metadata["nat_gateways"][0]
+        if not region:
+            region = aws_metadata.get("region", "us-east-1")
+
+    if not nat_gateway_id:
+        return ToolResult(ok=False, error="nat_gateway_id_required")
+
+    if policy.aws_region_allowlist and region not in policy.aws_region_allowlist:
+        return ToolResult(ok=False, error=f"region_not_allowed:{region}")
 
-            aws = get_aws_provider()
-            result = aws.get_vpc_endpoint_status(vpc_endpoint_id, region)
-            return ToolResult(ok=True, result=_compact(result))
-        except Exception as e:
-            return ToolResult(ok=False, error=f"aws_error:{type(e).__name__}")
+    try:
+        from agent.providers.aws_provider import get_aws_provider
+
+        aws = get_aws_provider()
+        result = aws.get_nat_gateway_status(nat_gateway_id, region)
+        return ToolResult(ok=True, result=_compact(result))
+    except Exception as e:
+        return ToolResult(ok=False, error=f"aws_error:{type(e).__name__}")
 
-    if tool == "aws.cloudtrail_events":
-        if not policy.allow_aws_read:
-            return ToolResult(ok=False, error="tool_not_allowed")
 
-        start_time_str = str(args.get("start_time") or "").strip()
-        end_time_str = str(args.get("end_time") or "").strip()
-        resource_ids_str = str(args.get("resource_ids") or "").strip()
-        max_results = int(args.get("max_results") or 20)
-        region = str(args.get("region") or "").strip()
+def _tool_aws_vpc_endpoint(call: _ToolCall) -> ToolResult:
+    args, policy, analysis_json = call.args, call.policy, call.analysis_json
+    if not policy.allow_aws_read:
+        return ToolResult(ok=False, error="tool_not_allowed")
 
-        # Cap max_results
-        max_results = min(max_results, 100)
+    vpc_endpoint_id = str(args.get("vpc_endpoint_id") or "").strip()
+    region = str(args.get("region") or "").strip()
 
-        # Auto-discover region from investigation metadata
+    # Auto-discover from investigation metadata
+    if not vpc_endpoint_id or not region:
+        aws_metadata = analysis_json.get("evidence", {}).get("aws", {}).get("metadata", {})
+        if not vpc_endpoint_id and aws_metadata.get("vpc_endpoints"):
+            vpc_endpoint_id = aws_metadata["vpc_endpoints"][0]
         if not region:
-            aws_metadata = analysis_json.get("evidence", {}).get("aws", {}).get("metadata", {})
             region = aws_metadata.get("region", "us-east-1")
 
-        # Region allowlist check
-        if policy.aws_region_allowlist and region not in policy.aws_region_allowlist:
-            return ToolResult(ok=False, error=f"region_not_allowed:{region}")
-
-        # Parse time window (defaults to investigation window + 30m lookback)
-        alert = analysis_json.get("alert", {})
-        if start_time_str:
-            # Parse relative time or ISO timestamp
-            if start_time_str.endswith("m") or start_time_str.endswith("h"):
-                # Relative time (e.g., "30m", "2h")
-                from agent.core.time_window import parse_time_window
-
-                tw = parse_time_window(start_time_str, datetime.now(timezone.utc))
-                start_time = tw.start_time
-            else:
-                # ISO timestamp
-                start_time = datetime.fromisoformat(start_time_str.replace("Z", "+00:00"))
+    if not vpc_endpoint_id:
+        return ToolResult(ok=False, error="vpc_endpoint_id_required")
+
+    if policy.aws_region_allowlist and region not in policy.aws_region_allowlist:
+        return ToolResult(ok=False, error=f"region_not_allowed:{region}")
+
+    try:
+        from agent.providers.aws_provider import get_aws_provider
+
+        aws = get_aws_provider()
+        result = aws.get_vpc_endpoint_status(vpc_endpoint_id, region)
+        return ToolResult(ok=True, result=_compact(result))
+    except Exception as e:
+        return ToolResult(ok=False, error=f"aws_error:{type(e).__name__}")
+
+
+def _tool_aws_cloudtrail_events(call: _ToolCall) -> ToolResult:
+    args, policy, analysis_json, log = call.args, call.policy, call.analysis_json, call.log
+    if not policy.allow_aws_read:
+        return ToolResult(ok=False, error="tool_not_allowed")
+
+    start_time_str = str(args.get("start_time") or "").strip()
+    end_time_str = str(args.get("end_time") or "").strip()
+    resource_ids_str = str(args.get("resource_ids") or "").strip()
+    max_results = int(args.get("max_results") or 20)
+    region = str(args.get("region") or "").strip()
+
+    # Cap max_results
+    max_results = min(max_results, 100)
+
+    # Auto-discover region from investigation metadata
+    if not region:
+        aws_metadata = analysis_json.get("evidence", {}).get("aws", {}).get("metadata", {})
+        region = aws_metadata.get("region", "us-east-1")
+
+    # Region allowlist check
+    if policy.aws_region_allowlist and region not in policy.aws_region_allowlist:
+        return ToolResult(ok=False, error=f"region_not_allowed:{region}")
+
+    # Parse time window (defaults to investigation window + 30m lookback)
+    alert = analysis_json.get("alert", {})
+    if start_time_str:
+        # Parse relative time or ISO timestamp
+        if start_time_str.endswith("m") or start_time_str.endswith("h"):
+            # Relative time (e.g., "30m", "2h")
+            tw = parse_time_window(start_time_str, datetime.now(timezone.utc))
+            start_time = tw.start_time
         else:
-            # Default: investigation start - 30m
-            alert_start_str = alert.get("starts_at")
-            if alert_start_str:
-                alert_start = datetime.fromisoformat(alert_start_str.replace("Z", "+00:00"))
-                start_time = alert_start - timedelta(minutes=30)
-            else:
-                start_time = datetime.now(timezone.utc) - timedelta(hours=1)
-
-        if end_time_str:
-            # Parse relative time or ISO timestamp
-            if end_time_str.endswith("m") or end_time_str.endswith("h"):
-                from agent.core.time_window import parse_time_window
-
-                tw = parse_time_window(end_time_str, datetime.now(timezone.utc))
-                end_time = tw.end_time
-            else:
-                end_time = datetime.fromisoformat(end_time_str.replace("Z", "+00:00"))
+            # ISO timestamp
+            start_time = datetime.fromisoformat(start_time_str.replace("Z", "+00:00"))
+    else:
+        # Default: investigation start - 30m
+        alert_start_str = alert.get("starts_at")
+        if alert_start_str:
+            alert_start = datetime.fromisoformat(alert_start_str.replace("Z", "+00:00"))
+            start_time = alert_start - timedelta(minutes=30)
         else:
-            # Default: investigation end or now
-            alert_end_str = alert.get("ends_at")
-            if alert_end_str:
-                end_time = datetime.fromisoformat(alert_end_str.replace("Z", "+00:00"))
-            else:
-                end_time = datetime.now(timezone.utc)
-
-        # Parse resource IDs
-        resource_ids = None
-        if resource_ids_str:
-            resource_ids = [rid.strip() for rid in resource_ids_str.split(",") if rid.strip()]
-
-        # Auto-discover resource IDs if not provided
-        if not resource_ids:
-            aws_metadata = analysis_json.get("evidence", {}).get("aws", {}).get("metadata", {})
-            resource_ids = []
-            resource_ids.extend(aws_metadata.get("ec2_instances", []))
-            resource_ids.extend(aws_metadata.get("ebs_volumes", []))
-            resource_ids.extend(aws_metadata.get("rds_instances", []))
-            resource_ids = resource_ids or None
+            start_time = datetime.now(timezone.utc) - timedelta(hours=1)
 
-        try:
-            from agent.collectors.aws_context import _group_cloudtrail_events
-            from agent.providers.aws_provider import get_aws_provider
-
-            aws = get_aws_provider()
-            events = aws.lookup_cloudtrail_events(region, start_time, end_time, resource_ids, max_results)
-
-            # Check for errors
-            if isinstance(events, list) and len(events) == 1 and isinstance(events[0], dict) and events[0].get("error"):
-                return ToolResult(ok=False, error=events[0]["error"])
-
-            # Group by category
-            grouped = _group_cloudtrail_events(events)
-
-            result = {
-                "events": events,
-                "grouped": grouped,
-                "metadata": {
-                    "time_window": f"{start_time.isoformat()} to {end_time.isoformat()}",
-                    "event_count": len(events),
-                    "region": region,
-                },
-            }
-
-            return ToolResult(ok=True, result=_compact(result))
-        except Exception as e:
-            log.warning(f"CloudTrail events query failed: region={region} error={str(e)[:400]}")
-            return ToolResult(ok=False, error=f"aws_error:{type(e).__name__}:{str(e)[:200]}")
-
-    if tool == "aws.s3_bucket_location":
-        if not policy.allow_aws_read:
-            return ToolResult(ok=False, error="tool_not_allowed")
-
-        bucket = str(args.get("bucket") or "").strip()
-
-        # Auto-extract bucket name from parsed_errors if not provided
-        if not bucket:
-            parsed_errors = analysis_json.get("evidence", {}).get("logs", {}).get("parsed_errors", [])
-            for error in parsed_errors:
-                # Match patterns like: "bucket: foo" or "for bucket foo" or "bucket=foo" or "for example-bucket.example.com:"
-                message = error.get("message", "") if isinstance(error, dict) else str(error)
-                # Try multiple patterns to extract bucket name (most specific first)
-                patterns = [
-                    r"for\s+([a-z0-9.-]+):",  # "for example-bucket.example.com:" (most specific)
-                    r"bucket[:=]\s*([a-z0-9.-]+)",  # "bucket: foo" or "bucket=foo" (require : or =)
-                    r"bucket\s+([a-z0-9.-]+)",  # "bucket foo" (fallback)
-                ]
-                for pattern in patterns:
-                    match = re.search(pattern, message, re.IGNORECASE)
-                    if match:
-                        bucket = match.group(1)
-                        break
-                if bucket:
+    if end_time_str:
+        # Parse relative time or ISO timestamp
+        if end_time_str.endswith("m") or end_time_str.endswith("h"):
+            tw = parse_time_window(end_time_str, datetime.now(timezone.utc))
+            end_time = tw.end_time
+        else:
+            end_time = datetime.fromisoformat(end_time_str.replace("Z", "+00:00"))
+    else:
+        # Default: investigation end or now
+        alert_end_str = alert.get("ends_at")
+        if alert_end_str:
+            end_time = datetime.fromisoformat(alert_end_str.replace("Z", "+00:00"))
+        else:
+            end_time = datetime.now(timezone.utc)
+
+    # Parse resource IDs
+    resource_ids = None
+    if resource_ids_str:
+        resource_ids = [rid.strip() for rid in resource_ids_str.split(",") if rid.strip()]
+
+    # Auto-discover resource IDs if not provided
+    if not resource_ids:
+        aws_metadata = analysis_json.get("evidence", {}).get("aws", {}).get("metadata", {})
+        resource_ids = []
+        resource_ids.extend(aws_metadata.get("ec2_instances", []))
+        resource_ids.extend(aws_metadata.get("ebs_volumes", []))
+        resource_ids.extend(aws_metadata.get("rds_instances", []))
+        resource_ids = resource_ids or None
+
+    try:
+        from agent.collectors.aws_context import _group_cloudtrail_events
+        from agent.providers.aws_provider import get_aws_provider
+
+        aws = get_aws_provider()
+        events = aws.lookup_cloudtrail_events(region, start_time, end_time, resource_ids, max_results)
+
+        # Check for errors
+        if isinstance(events, list) and len(events) == 1 and isinstance(events[0], dict) and events[0].get("error"):
+            return ToolResult(ok=False, error=events[0]["error"])
+
+        # Group by category
+        grouped = _group_cloudtrail_events(events)
+
+        result = {
+            "events": events,
+            "grouped": grouped,
+            "metadata": {
+                "time_window": f"{start_time.isoformat()} to {end_time.isoformat()}",
+                "event_count": len(events),
+                "region": region,
+            },
+        }
+
+        return ToolResult(ok=True, result=_compact(result))
+    except Exception as e:
+        log.warning(f"CloudTrail events query failed: region={region} error={str(e)[:400]}")
+        return ToolResult(ok=False, error=f"aws_error:{type(e).__name__}:{str(e)[:200]}")
+
+
+def _tool_aws_s3_bucket_location(call: _ToolCall) -> ToolResult:
+    args, policy, analysis_json = call.args, call.policy, call.analysis_json
+    if not policy.allow_aws_read:
+        return ToolResult(ok=False, error="tool_not_allowed")
+
+    bucket = str(args.get("bucket") or "").strip()
+
+    # Auto-extract bucket name from parsed_errors if not provided
+    if not bucket:
+        parsed_errors = analysis_json.get("evidence", {}).get("logs", {}).get("parsed_errors", [])
+        for error in parsed_errors:
+            # Match patterns like: "bucket: foo" or "for bucket foo" or "bucket=foo" or "for example-bucket.example.com:"
+            message = error.get("message", "") if isinstance(error, dict) else str(error)
+            # Try multiple patterns to extract bucket name (most specific first)
+            patterns = [
+                r"for\s+([a-z0-9.-]+):",  # "for example-bucket.example.com:" (most specific)
+                r"bucket[:=]\s*([a-z0-9.-]+)",  # "bucket: foo" or "bucket=foo" (require : or =)
+                r"bucket\s+([a-z0-9.-]+)",  # "bucket foo" (fallback)
+            ]
+            for pattern in patterns:
+                match = re.search(pattern, message, re.IGNORECASE)
+                if match:
+                    bucket = match.group(1)
                     break
+            if bucket:
+                break
 
-        if not bucket:
-            return ToolResult(ok=False, error="bucket_name_required")
+    if not bucket:
+        return ToolResult(ok=False, error="bucket_name_required")
 
-        try:
-            from agent.providers.aws_provider import get_aws_provider
-
-            aws = get_aws_provider()
-            result = aws.get_s3_bucket_location(bucket)
-            return ToolResult(ok=True, result=_compact(result))
-        except Exception as e:
-            return ToolResult(ok=False, error=f"aws_error:{type(e).__name__}")
-
-    if tool == "aws.iam_role_permissions":
-        if not policy.allow_aws_read:
-            return ToolResult(ok=False, error="tool_not_allowed")
-
-        role_name = str(args.get("role_name") or "").strip()
-        service_account = str(args.get("service_account") or "").strip()
-
-        # Track whether we attempted to extract from service account but found no annotation
-        sa_checked_no_annotation = False
-
-        # If service_account provided, fetch its annotations to get role ARN
-        if not role_name and service_account:
-            namespace = str(args.get("namespace") or "").strip()
-            if not namespace:
-                # Try to get namespace from target
-                namespace = analysis_json.get("target", {}).get("namespace")
-
-            if namespace:
-                try:
-                    from agent.providers.k8s_provider import get_service_account_info
-
-                    sa_info = get_service_account_info(namespace, service_account)
-                    if sa_info and isinstance(sa_info.get("annotations"), dict):
-                        role_arn = sa_info["annotations"].get("eks.amazonaws.com/role-arn") or sa_info[
-                            "annotations"
-                        ].get("iam.amazonaws.com/role")
-                        if role_arn and "/" in role_arn:
-                            role_name = role_arn.split("/")[-1]
-                        else:
-                            # Service account exists but has no IAM role annotation
-                            sa_checked_no_annotation = True
+    try:
+        from agent.providers.aws_provider import get_aws_provider
+
+        aws = get_aws_provider()
+        result = aws.get_s3_bucket_location(bucket)
+        return ToolResult(ok=True, result=_compact(result))
+    except Exception as e:
+        return ToolResult(ok=False, error=f"aws_error:{type(e).__name__}")
+
+
+def _tool_aws_iam_role_permissions(call: _ToolCall) -> ToolResult:
+    args, policy, analysis_json, namespace = call.args, call.policy, call.analysis_json, call.namespace
+    if not policy.allow_aws_read:
+        return ToolResult(ok=False, error="tool_not_allowed")
+
+    role_name = str(args.get("role_name") or "").strip()
+    service_account = str(args.get("service_account") or "").strip()
+
+    # Track whether we attempted to extract from service account but found no annotation
+    sa_checked_no_annotation = False
+
+    # If service_account provided, fetch its annotations to get role ARN
+    if not role_name and service_account:
+        namespace = str(args.get("namespace") or "").strip()
+        if not namespace:
+            # Try to get namespace from target
+            namespace = analysis_json.get("target", {}).get("namespace")
+
+        if namespace:
+            try:
+                from agent.providers.k8s_provider import get_service_account_info
+
+                sa_info = get_service_account_info(namespace, service_account)
+                if sa_info and isinstance(sa_info.get("annotations"), dict):
+                    role_arn = sa_info["annotations"].get("eks.amazonaws.com/role-arn") or sa_info["annotations"].get(
+                        "iam.amazonaws.com/role"
+                    )
+                    if role_arn and "/" in role_arn:
+                        role_name = role_arn.split("/")[-1]
                     else:
-                        # Service account exists but has no annotations dict
+                        # Service account exists but has no IAM role annotation
                         sa_checked_no_annotation = True
-                except Exception:
-                    pass  # Fall through to try pod_info extraction
-
-        # Try to extract from pod_info annotation (if available in evidence)
-        if not role_name:
-            pod_info = analysis_json.get("evidence", {}).get("k8s", {}).get("pod_info", {})
-
-            # Try to extract role from service account annotations if available
-            # Format: eks.amazonaws.com/role-arn: arn:aws:iam::123456789012:role/MyRole
-            annotations = pod_info.get("annotations", {})
-            role_arn = annotations.get("eks.amazonaws.com/role-arn") or annotations.get("iam.amazonaws.com/role")
-            if role_arn:
-                # Extract role name from ARN (arn:aws:iam::123456789012:role/MyRole)
-                if "/" in role_arn:
-                    role_name = role_arn.split("/")[-1]
-
-        if not role_name:
-            # Return more specific error if we checked service account but found no IRSA annotation
-            if sa_checked_no_annotation and service_account:
-                return ToolResult(
-                    ok=False,
-                    error="no_iam_role_annotation",
-                    result={
-                        "message": f"Service account {service_account} has no IAM role annotation (IRSA not configured)",
-                        "remediation": "Configure IRSA by adding eks.amazonaws.com/role-arn annotation to the service account",
-                    },
-                )
-            return ToolResult(ok=False, error="role_name_required")
-
-        try:
-            from agent.providers.aws_provider import get_aws_provider
-
-            aws = get_aws_provider()
-            result = aws.get_iam_role_permissions(role_name)
-            return ToolResult(ok=True, result=_compact(result))
-        except Exception as e:
-            return ToolResult(ok=False, error=f"aws_error:{type(e).__name__}")
-
-    # --------------------
-    # github.*
-    # --------------------
-    if tool == "github.recent_commits":
-        if not policy.allow_github_read:
-            return ToolResult(ok=False, error="tool_not_allowed")
-
-        branch = str(args.get("branch") or "main").strip()
-        since_str = str(args.get("since") or "")
-        limit = min(int(args.get("limit", 20)), 30)  # hard cap at 30
-
-        repo, source = _resolve_github_repo(args, analysis_json)
-        if not repo:
-            log.warning("github.recent_commits: repo not discovered (raw=%s, source=%s)", args.get("repo"), source)
+                else:
+                    # Service account exists but has no annotations dict
+                    sa_checked_no_annotation = True
+            except Exception:
+                pass  # Fall through to try pod_info extraction
+
+    # Try to extract from pod_info annotation (if available in evidence)
+    if not role_name:
+        pod_info = analysis_json.get("evidence", {}).get("k8s", {}).get("pod_info", {})
+
+        # Try to extract role from service account annotations if available
+        # Format: eks.amazonaws.com/role-arn: arn:aws:iam::123456789012:role/MyRole
+        annotations = pod_info.get("annotations", {})
+        role_arn = annotations.get("eks.amazonaws.com/role-arn") or annotations.get("iam.amazonaws.com/role")
+        if role_arn:
+            # Extract role name from ARN (arn:aws:iam::123456789012:role/MyRole)
+            if "/" in role_arn:
+                role_name = role_arn.split("/")[-1]
+
+    if not role_name:
+        # Return more specific error if we checked service account but found no IRSA annotation
+        if sa_checked_no_annotation and service_account:
             return ToolResult(
                 ok=False,
-                error="repo_not_discovered: could not resolve repo. Try 'org/repo' format, or add to service-catalog.yaml",
+                error="no_iam_role_annotation",
+                result={
+                    "message": f"Service account {service_account} has no IAM role annotation (IRSA not configured)",
+                    "remediation": "Configure IRSA by adding eks.amazonaws.com/role-arn annotation to the service account",
+                },
             )
+        return ToolResult(ok=False, error="role_name_required")
 
-        log.info("github.recent_commits: using repo=%s (source=%s)", repo, source)
+    try:
+        from agent.providers.aws_provider import get_aws_provider
 
-        # Check repo allowlist
-        if policy.github_repo_allowlist and repo not in policy.github_repo_allowlist:
-            log.warning("github.recent_commits: repo not in allowlist: %s", repo)
-            return ToolResult(ok=False, error=f"repo_not_allowed:{repo} - not in configured allowlist")
+        aws = get_aws_provider()
+        result = aws.get_iam_role_permissions(role_name)
+        return ToolResult(ok=True, result=_compact(result))
+    except Exception as e:
+        return ToolResult(ok=False, error=f"aws_error:{type(e).__name__}")
 
-        # Parse time window
-        until = datetime.now(timezone.utc)
-        using_default_window = not since_str
-        if since_str:
-            since = _parse_iso(since_str)
-        else:
-            since = until - timedelta(hours=2)
 
-        try:
-            from agent.services.github_data_service import get_github_data_service
+# --------------------
+# github.*
+# --------------------
+
+
+def _tool_github_recent_commits(call: _ToolCall) -> ToolResult:
+    args, policy, analysis_json, log = call.args, call.policy, call.analysis_json, call.log
+    if not policy.allow_github_read:
+        return ToolResult(ok=False, error="tool_not_allowed")
+
+    branch = str(args.get("branch") or "main").strip()
+    since_str = str(args.get("since") or "")
+    limit = min(int(args.get("limit", 20)), 30)  # hard cap at 30
+
+    repo, source = _resolve_github_repo(args, analysis_json)
+    if not repo:
+        log.warning("github.recent_commits: repo not discovered (raw=%s, source=%s)", args.get("repo"), source)
+        return ToolResult(
+            ok=False,
+            error="repo_not_discovered: could not resolve repo. Try 'org/repo' format, or add to service-catalog.yaml",
+        )
+
+    log.info("github.recent_commits: using repo=%s (source=%s)", repo, source)
+
+    # Check repo allowlist
+    if policy.github_repo_allowlist and repo not in policy.github_repo_allowlist:
+        log.warning("github.recent_commits: repo not in allowlist: %s", repo)
+        return ToolResult(ok=False, error=f"repo_not_allowed:{repo} - not in configured allowlist")
 
-            github_data = get_github_data_service()
+    # Parse time window
+    until = datetime.now(timezone.utc)
+    using_default_window = not since_str
+    if since_str:
+        since = _parse_iso(since_str)
+    else:
+        since = until - timedelta(hours=2)
+
+    try:
+        from agent.services.github_data_service import get_github_data_service
+
+        github_data = get_github_data_service()
+        commits_resp = github_data.recent_commits(repo=repo, since=since, until=until, branch=branch)
+        commits = commits_resp.get("commits", [])
+
+        # Filter out error responses
+        if commits_resp.get("error"):
+            err_msg = commits_resp.get("message", "")
+            log.warning("github.recent_commits: provider error for repo=%s: %s", repo, err_msg)
+            return ToolResult(ok=False, error=f"{commits_resp.get('error', 'github_error')}: {err_msg}")
+
+        # Auto-widen: if default 2h window returned 0 commits, retry with 24h
+        if not commits and using_default_window:
+            since = until - timedelta(hours=24)
+            log.info("github.recent_commits: 0 commits in 2h window, auto-widening to 24h for repo=%s", repo)
             commits_resp = github_data.recent_commits(repo=repo, since=since, until=until, branch=branch)
             commits = commits_resp.get("commits", [])
-
-            # Filter out error responses
             if commits_resp.get("error"):
                 err_msg = commits_resp.get("message", "")
                 log.warning("github.recent_commits: provider error for repo=%s: %s", repo, err_msg)
                 return ToolResult(ok=False, error=f"{commits_resp.get('error', 'github_error')}: {err_msg}")
 
-            # Auto-widen: if default 2h window returned 0 commits, retry with 24h
-            if not commits and using_default_window:
-                since = until - timedelta(hours=24)
-                log.info("github.recent_commits: 0 commits in 2h window, auto-widening to 24h for repo=%s", repo)
-                commits_resp = github_data.recent_commits(repo=repo, since=since, until=until, branch=branch)
-                commits = commits_resp.get("commits", [])
-                if commits_resp.get("error"):
-                    err_msg = commits_resp.get("message", "")
-                    log.warning("github.recent_commits: provider error for repo=%s: %s", repo, err_msg)
-                    return ToolResult(ok=False, error=f"{commits_resp.get('error', 'github_error')}: {err_msg}")
-
-            searched_hours = round((until - since).total_seconds() / 3600)
-            total = len(commits)
-            commits = commits[:limit]
-            return ToolResult(
-                ok=True,
-                result=_compact(
-                    {
-                        "repo": repo,
-                        "branch": branch,
-                        "commits": commits,
-                        "total_available": total,
-                        "returned": len(commits),
-                        "searched_window_hours": searched_hours,
-                    }
-                ),
-            )
-        except Exception as e:
-            log.warning("github.recent_commits failed: repo=%s error=%s", repo, str(e)[:200])
-            return ToolResult(ok=False, error=f"github_error:{type(e).__name__}")
+        searched_hours = round((until - since).total_seconds() / 3600)
+        total = len(commits)
+        commits = commits[:limit]
+        return ToolResult(
+            ok=True,
+            result=_compact(
+                {
+                    "repo": repo,
+                    "branch": branch,
+                    "commits": commits,
+                    "total_available": total,
+                    "returned": len(commits),
+                    "searched_window_hours": searched_hours,
+                }
+            ),
+        )
+    except Exception as e:
+        log.warning("github.recent_commits failed: repo=%s error=%s", repo, str(e)[:200])
+        return ToolResult(ok=False, error=f"github_error:{type(e).__name__}")
 
-    if tool == "github.workflow_runs":
-        if not policy.allow_github_read:
-            return ToolResult(ok=False, error="tool_not_allowed")
 
-        since_str = str(args.get("since") or "")
-        limit = int(args.get("limit", 10))
+def _tool_github_workflow_runs(call: _ToolCall) -> ToolResult:
+    args, policy, analysis_json, log = call.args, call.policy, call.analysis_json, call.log
+    if not policy.allow_github_read:
+        return ToolResult(ok=False, error="tool_not_allowed")
 
-        repo, source = _resolve_github_repo(args, analysis_json)
-        if not repo:
-            log.warning("github.workflow_runs: repo not discovered (raw=%s, source=%s)", args.get("repo"), source)
-            return ToolResult(
-                ok=False,
-                error="repo_not_discovered: could not resolve repo. Try 'org/repo' format, or add to service-catalog.yaml",
-            )
+    since_str = str(args.get("since") or "")
+    limit = int(args.get("limit", 10))
 
-        log.info("github.workflow_runs: using repo=%s (source=%s)", repo, source)
+    repo, source = _resolve_github_repo(args, analysis_json)
+    if not repo:
+        log.warning("github.workflow_runs: repo not discovered (raw=%s, source=%s)", args.get("repo"), source)
+        return ToolResult(
+            ok=False,
+            error="repo_not_discovered: could not resolve repo. Try 'org/repo' format, or add to service-catalog.yaml",
+        )
 
-        if policy.github_repo_allowlist and repo not in policy.github_repo_allowlist:
-            log.warning("github.workflow_runs: repo not in allowlist: %s", repo)
-            return ToolResult(ok=False, error=f"repo_not_allowed:{repo} - not in configured allowlist")
+    log.info("github.workflow_runs: using repo=%s (source=%s)", repo, source)
 
-        # Parse time window
-        if since_str:
-            since = _parse_iso(since_str)
-        else:
-            since = datetime.now(timezone.utc) - timedelta(hours=2)
+    if policy.github_repo_allowlist and repo not in policy.github_repo_allowlist:
+        log.warning("github.workflow_runs: repo not in allowlist: %s", repo)
+        return ToolResult(ok=False, error=f"repo_not_allowed:{repo} - not in configured allowlist")
 
-        try:
-            from agent.services.github_data_service import get_github_data_service
+    # Parse time window
+    if since_str:
+        since = _parse_iso(since_str)
+    else:
+        since = datetime.now(timezone.utc) - timedelta(hours=2)
 
-            github_data = get_github_data_service()
-            runs_resp = github_data.workflow_runs(repo=repo, since=since, limit=limit)
-            runs = runs_resp.get("workflow_runs", [])
+    try:
+        from agent.services.github_data_service import get_github_data_service
+
+        github_data = get_github_data_service()
+        runs_resp = github_data.workflow_runs(repo=repo, since=since, limit=limit)
+        runs = runs_resp.get("workflow_runs", [])
+
+        # Filter out error responses
+        if runs_resp.get("error"):
+            err_msg = runs_resp.get("message", "")
+            log.warning("github.workflow_runs: provider error for repo=%s: %s", repo, err_msg)
+            return ToolResult(ok=False, error=f"{runs_resp.get('error', 'github_error')}: {err_msg}")
+
+        return ToolResult(ok=True, result=_compact({"repo": repo, "workflow_runs": runs}))
+    except Exception as e:
+        log.warning("github.workflow_runs failed: repo=%s error=%s", repo, str(e)[:200])
+        return ToolResult(ok=False, error=f"github_error:{type(e).__name__}")
+
+
+def _tool_github_workflow_logs(call: _ToolCall) -> ToolResult:
+    args, policy, analysis_json, log = call.args, call.policy, call.analysis_json, call.log
+    if not policy.allow_github_read:
+        return ToolResult(ok=False, error="tool_not_allowed")
+
+    run_id = int(args.get("run_id", 0))
+    job_id = int(args.get("job_id", 0))
+
+    repo, source = _resolve_github_repo(args, analysis_json)
+    if not repo:
+        log.warning("github.workflow_logs: repo not discovered (raw=%s, source=%s)", args.get("repo"), source)
+        return ToolResult(
+            ok=False,
+            error="repo_not_discovered: could not resolve repo. Try 'org/repo' format, or add to service-catalog.yaml",
+        )
 
-            # Filter out error responses
-            if runs_resp.get("error"):
-                err_msg = runs_resp.get("message", "")
-                log.warning("github.workflow_runs: provider error for repo=%s: %s", repo, err_msg)
-                return ToolResult(ok=False, error=f"{runs_resp.get('error', 'github_error')}: {err_msg}")
+    log.info("github.workflow_logs: using repo=%s (source=%s)", repo, source)
 
-            return ToolResult(ok=True, result=_compact({"repo": repo, "workflow_runs": runs}))
-        except Exception as e:
-            log.warning("github.workflow_runs failed: repo=%s error=%s", repo, str(e)[:200])
-            return ToolResult(ok=False, error=f"github_error:{type(e).__name__}")
+    if not run_id or not job_id:
+        return ToolResult(ok=False, error="run_id_and_job_id_required")
 
-    if tool == "github.workflow_logs":
-        if not policy.allow_github_read:
-            return ToolResult(ok=False, error="tool_not_allowed")
+    if policy.github_repo_allowlist and repo not in policy.github_repo_allowlist:
+        log.warning("github.workflow_logs: repo not in allowlist: %s", repo)
+        return ToolResult(ok=False, error=f"repo_not_allowed:{repo} - not in configured allowlist")
 
-        run_id = int(args.get("run_id", 0))
-        job_id = int(args.get("job_id", 0))
+    try:
+        from agent.services.github_data_service import get_github_data_service
+
+        github_data = get_github_data_service()
+        logs_resp = github_data.workflow_logs(repo=repo, run_id=run_id, job_id=job_id)
+        if logs_resp.get("error"):
+            return ToolResult(ok=False, error=logs_resp.get("error", "github_error:log_fetch_failed"))
+        logs = logs_resp.get("logs", "")
+
+        return ToolResult(ok=True, result=_compact({"repo": repo, "run_id": run_id, "job_id": job_id, "logs": logs}))
+    except Exception as e:
+        log.warning("github.workflow_logs failed: repo=%s error=%s", repo, str(e)[:200])
+        return ToolResult(ok=False, error=f"github_error:{type(e).__name__}")
+
+
+def _tool_github_read_file(call: _ToolCall) -> ToolResult:
+    args, policy, analysis_json, log = call.args, call.policy, call.analysis_json, call.log
+    if not policy.allow_github_read:
+        return ToolResult(ok=False, error="tool_not_allowed")
+
+    path = str(args.get("path") or "").strip()
+    ref = str(args.get("ref") or "main").strip()
+
+    repo, source = _resolve_github_repo(args, analysis_json)
+    if not repo:
+        log.warning("github.read_file: repo not discovered (raw=%s, source=%s)", args.get("repo"), source)
+        return ToolResult(
+            ok=False,
+            error="repo_not_discovered: could not resolve repo. Try 'org/repo' format, or add to service-catalog.yaml",
+        )
 
-        repo, source = _resolve_github_repo(args, analysis_json)
-        if not repo:
-            log.warning("github.workflow_logs: repo not discovered (raw=%s, source=%s)", args.get("repo"), source)
-            return ToolResult(
-                ok=False,
-                error="repo_not_discovered: could not resolve repo. Try 'org/repo' format, or add to service-catalog.yaml",
-            )
+    log.info("github.read_file: using repo=%s (source=%s)", repo, source)
 
-        log.info("github.workflow_logs: using repo=%s (source=%s)", repo, source)
+    if not path:
+        return ToolResult(ok=False, error="path_required")
 
-        if not run_id or not job_id:
-            return ToolResult(ok=False, error="run_id_and_job_id_required")
+    # Path validation (prevent directory traversal)
+    if ".." in path or path.startswith("/"):
+        return ToolResult(ok=False, error="invalid_path")
 
-        if policy.github_repo_allowlist and repo not in policy.github_repo_allowlist:
-            log.warning("github.workflow_logs: repo not in allowlist: %s", repo)
-            return ToolResult(ok=False, error=f"repo_not_allowed:{repo} - not in configured allowlist")
+    if policy.github_repo_allowlist and repo not in policy.github_repo_allowlist:
+        log.warning("github.read_file: repo not in allowlist: %s", repo)
+        return ToolResult(ok=False, error=f"repo_not_allowed:{repo} - not in configured allowlist")
 
-        try:
-            from agent.services.github_data_service import get_github_data_service
+    try:
+        from agent.services.github_data_service import get_github_data_service
+
+        github_data = get_github_data_service()
+        read_resp = github_data.read_file(repo=repo, path=path, ref=ref)
+        if read_resp.get("error"):
+            msg = read_resp.get("message", "")
+            return ToolResult(ok=False, error=f"{read_resp.get('error', 'github_error')}: {msg}")
+        content = read_resp.get("content", "")
+
+        return ToolResult(ok=True, result=_compact({"repo": repo, "path": path, "ref": ref, "content": content}))
+    except Exception as e:
+        log.warning("github.read_file failed: repo=%s error=%s", repo, str(e)[:200])
+        return ToolResult(ok=False, error=f"github_error:{type(e).__name__}")
+
+
+def _tool_github_commit_diff(call: _ToolCall) -> ToolResult:
+    args, policy, analysis_json, log = call.args, call.policy, call.analysis_json, call.log
+    if not policy.allow_github_read:
+        return ToolResult(ok=False, error="tool_not_allowed")
+
+    sha = str(args.get("sha") or "").strip()
+    if not sha:
+        return ToolResult(ok=False, error="sha_required")
+
+    repo, source = _resolve_github_repo(args, analysis_json)
+    if not repo:
+        log.warning("github.commit_diff: repo not discovered (raw=%s, source=%s)", args.get("repo"), source)
+        return ToolResult(
+            ok=False,
+            error="repo_not_discovered: could not resolve repo. Try 'org/repo' format, or add to service-catalog.yaml",
+        )
 
-            github_data = get_github_data_service()
-            logs_resp = github_data.workflow_logs(repo=repo, run_id=run_id, job_id=job_id)
-            if logs_resp.get("error"):
-                return ToolResult(ok=False, error=logs_resp.get("error", "github_error:log_fetch_failed"))
-            logs = logs_resp.get("logs", "")
+    log.info("github.commit_diff: using repo=%s sha=%s (source=%s)", repo, sha, source)
 
-            return ToolResult(
-                ok=True, result=_compact({"repo": repo, "run_id": run_id, "job_id": job_id, "logs": logs})
-            )
-        except Exception as e:
-            log.warning("github.workflow_logs failed: repo=%s error=%s", repo, str(e)[:200])
-            return ToolResult(ok=False, error=f"github_error:{type(e).__name__}")
+    if policy.github_repo_allowlist and repo not in policy.github_repo_allowlist:
+        log.warning("github.commit_diff: repo not in allowlist: %s", repo)
+        return ToolResult(ok=False, error=f"repo_not_allowed:{repo} - not in configured allowlist")
 
-    if tool == "github.read_file":
-        if not policy.allow_github_read:
-            return ToolResult(ok=False, error="tool_not_allowed")
+    try:
+        from agent.services.github_data_service import get_github_data_service
+
+        github_data = get_github_data_service()
+        diff_resp = github_data.commit_diff(repo=repo, sha=sha)
+        if diff_resp.get("error"):
+            err_msg = diff_resp.get("message", "")
+            log.warning("github.commit_diff: provider error for repo=%s sha=%s: %s", repo, sha, err_msg)
+            return ToolResult(ok=False, error=f"{diff_resp.get('error', 'github_error')}: {err_msg}")
+        diff = diff_resp.get("diff", {})
+
+        return ToolResult(ok=True, result=_compact({"repo": repo, **diff}))
+    except Exception as e:
+        log.warning("github.commit_diff failed: repo=%s sha=%s error=%s", repo, sha, str(e)[:200])
+        return ToolResult(ok=False, error=f"github_error:{type(e).__name__}")
+
+
+def _tool_github_regression_context(call: _ToolCall) -> ToolResult:
+    args, policy, analysis_json, log = call.args, call.policy, call.analysis_json, call.log
+    if not policy.allow_github_read:
+        return ToolResult(ok=False, error="tool_not_allowed")
+
+    repo, source = _resolve_github_repo(args, analysis_json)
+    if not repo:
+        log.warning("github.regression_context: repo not discovered (raw=%s, source=%s)", args.get("repo"), source)
+        return ToolResult(
+            ok=False,
+            error="repo_not_discovered: could not resolve repo. Try 'org/repo' format, or add to service-catalog.yaml",
+        )
 
-        path = str(args.get("path") or "").strip()
-        ref = str(args.get("ref") or "main").strip()
+    log.info("github.regression_context: using repo=%s (source=%s)", repo, source)
+
+    if policy.github_repo_allowlist and repo not in policy.github_repo_allowlist:
+        log.warning("github.regression_context: repo not in allowlist: %s", repo)
+        return ToolResult(ok=False, error=f"repo_not_allowed:{repo} - not in configured allowlist")
+
+    # Parse error_hints: accept list or comma-separated string
+    raw_hints = args.get("error_hints")
+    if isinstance(raw_hints, list):
+        error_hints = [str(h).strip() for h in raw_hints if str(h).strip()]
+    elif isinstance(raw_hints, str) and raw_hints.strip():
+        error_hints = [h.strip() for h in raw_hints.split(",") if h.strip()]
+    else:
+        error_hints = None
+
+    # Parse time window: explicit args or fall back to analysis_json.time_window
+    since_str = str(args.get("since") or "").strip()
+    until_str = str(args.get("until") or "").strip()
+    if since_str:
+        since = _parse_iso(since_str)
+    else:
+        tw = analysis_json.get("time_window") if isinstance(analysis_json.get("time_window"), dict) else {}
+        since = _parse_iso(str(tw.get("start_time") or ""))
+    if until_str:
+        until = _parse_iso(until_str)
+    else:
+        tw = analysis_json.get("time_window") if isinstance(analysis_json.get("time_window"), dict) else {}
+        until = _parse_iso(str(tw.get("end_time") or ""))
+
+    if not since:
+        since = datetime.now(timezone.utc) - timedelta(hours=2)
+    if not until:
+        until = datetime.now(timezone.utc)
 
-        repo, source = _resolve_github_repo(args, analysis_json)
-        if not repo:
-            log.warning("github.read_file: repo not discovered (raw=%s, source=%s)", args.get("repo"), source)
-            return ToolResult(
-                ok=False,
-                error="repo_not_discovered: could not resolve repo. Try 'org/repo' format, or add to service-catalog.yaml",
-            )
+    deployed_sha = str(args.get("deployed_sha") or "").strip() or None
+    branch = str(args.get("branch") or "main").strip()
 
-        log.info("github.read_file: using repo=%s (source=%s)", repo, source)
+    try:
+        from agent.analysis.git_regression import build_regression_context_pack
+
+        pack = build_regression_context_pack(
+            repo=repo,
+            incident_start=since,
+            incident_end=until,
+            deployed_sha=deployed_sha,
+            branch=branch,
+            error_hints=error_hints,
+            max_files=10,
+            max_diff_lines_per_file=200,
+            max_total_diff_lines=1200,
+        )
+        return ToolResult(ok=True, result=_compact(pack))
+    except Exception as e:
+        log.warning("github.regression_context failed: repo=%s error=%s", repo, str(e)[:200])
+        return ToolResult(ok=False, error=f"github_error:{type(e).__name__}")
 
-        if not path:
-            return ToolResult(ok=False, error="path_required")
 
-        # Path validation (prevent directory traversal)
-        if ".." in path or path.startswith("/"):
-            return ToolResult(ok=False, error="invalid_path")
+# --------------------
+# logs.*
+# --------------------
 
-        if policy.github_repo_allowlist and repo not in policy.github_repo_allowlist:
-            log.warning("github.read_file: repo not in allowlist: %s", repo)
-            return ToolResult(ok=False, error=f"repo_not_allowed:{repo} - not in configured allowlist")
 
-        try:
-            from agent.services.github_data_service import get_github_data_service
-
-            github_data = get_github_data_service()
-            read_resp = github_data.read_file(repo=repo, path=path, ref=ref)
-            if read_resp.get("error"):
-                msg = read_resp.get("message", "")
-                return ToolResult(ok=False, error=f"{read_resp.get('error', 'github_error')}: {msg}")
-            content = read_resp.get("content", "")
-
-            return ToolResult(ok=True, result=_compact({"repo": repo, "path": path, "ref": ref, "content": content}))
-        except Exception as e:
-            log.warning("github.read_file failed: repo=%s error=%s", repo, str(e)[:200])
-            return ToolResult(ok=False, error=f"github_error:{type(e).__name__}")
-
-    if tool == "github.commit_diff":
-        if not policy.allow_github_read:
-            return ToolResult(ok=False, error="tool_not_allowed")
-
-        sha = str(args.get("sha") or "").strip()
-        if not sha:
-            return ToolResult(ok=False, error="sha_required")
-
-        repo, source = _resolve_github_repo(args, analysis_json)
-        if not repo:
-            log.warning("github.commit_diff: repo not discovered (raw=%s, source=%s)", args.get("repo"), source)
-            return ToolResult(
-                ok=False,
-                error="repo_not_discovered: could not resolve repo. Try 'org/repo' format, or add to service-catalog.yaml",
+def _tool_logs_tail(call: _ToolCall) -> ToolResult:
+    args, policy, tgt = call.args, call.policy, call.tgt
+    if not policy.allow_logs_query:
+        return ToolResult(ok=False, error="tool_not_allowed")
+    pod = str(args.get("pod") or "").strip() or (tgt.get("pod") if isinstance(tgt, dict) else None)
+    ns = str(args.get("namespace") or "").strip() or (tgt.get("namespace") if isinstance(tgt, dict) else None)
+
+    # Support Jobs: if no pod but we have a Job workload, find the pods created by the Job
+    if not pod and ns and isinstance(tgt, dict):
+        workload_kind = tgt.get("kind")
+        workload_name = tgt.get("workload")
+        if workload_kind == "Job" and workload_name:
+            try:
+                k8s = get_k8s_provider()
+                # Find pods created by this Job using label selector
+                pods = k8s.list_pods(namespace=ns, label_selector=f"job-name={workload_name}")
+                if pods:
+                    # Use the most recent pod (Jobs may have multiple pods if they failed and restarted)
+                    pod = (
+                        max(pods, key=lambda p: p.get("metadata", {}).get("creationTimestamp", ""))
+                        .get("metadata", {})
+                        .get("name")
+                    )
+            except Exception:
+                pass  # Fall through to error below
+
+    if not pod or not ns:
+        missing = []
+        if not pod:
+            missing.append("pod_name")
+        if not ns:
+            missing.append("namespace")
+        return ToolResult(ok=False, error=f"missing_required_args:{','.join(missing)}")
+    try:
+        end_time = _parse_iso(str(args.get("end_time") or "")) or datetime.now(timezone.utc)
+        start_time = _parse_iso(str(args.get("start_time") or "")) or (end_time - timedelta(minutes=15))
+        limit = int(args.get("limit") or policy.max_log_lines)
+        limit = max(10, min(limit, policy.max_log_lines))
+        container = str(args.get("container") or "").strip() or None
+        out = fetch_recent_logs(str(pod), str(ns), start_time, end_time, container=container, limit=limit)
+        # Redact messages before returning to chat.
+        if policy.redact_secrets and isinstance(out, dict) and isinstance(out.get("entries"), list):
+            entries = []
+            for e in out.get("entries") or []:
+                if not isinstance(e, dict):
+                    continue
+                msg = e.get("message")
+                if isinstance(msg, str):
+                    e = dict(e)
+                    e["message"] = redact_text(msg)
+                entries.append(e)
+            out = dict(out)
+            out["entries"] = entries
+        return ToolResult(ok=True, result=_compact(out))
+    except Exception as e:
+        return ToolResult(ok=False, error=f"logs_error:{type(e).__name__}")
+
+
+# --------------------
+# memory.*
+# --------------------
+
+
+def _tool_memory_similar_cases(call: _ToolCall) -> ToolResult:
+    args, policy, analysis_json = call.args, call.policy, call.analysis_json
+    if not policy.allow_memory_read:
+        return ToolResult(ok=False, error="tool_not_allowed")
+    try:
+        inv = _build_investigation_from_analysis_json(analysis_json)
+        ok, msg, sims = find_similar_runs(inv, limit=int(args.get("limit") or 5))
+        if not ok:
+            return ToolResult(ok=False, error=f"memory_unavailable:{msg}")
+        items = []
+        for s in sims or []:
+            items.append(
+                {
+                    "case_id": s.case_id,
+                    "run_id": s.run_id,
+                    "created_at": s.created_at,
+                    "one_liner": s.one_liner,
+                    "s3_report_key": s.s3_report_key,
+                    "resolution_category": getattr(s, "resolution_category", None),
+                    "resolution_summary": getattr(s, "resolution_summary", None),
+                    "postmortem_link": getattr(s, "postmortem_link", None),
+                }
             )
+        return ToolResult(ok=True, result={"status": "ok", "items": items})
+    except Exception as e:
+        return ToolResult(ok=False, error=f"memory_error:{type(e).__name__}")
 
-        log.info("github.commit_diff: using repo=%s sha=%s (source=%s)", repo, sha, source)
 
-        if policy.github_repo_allowlist and repo not in policy.github_repo_allowlist:
-            log.warning("github.commit_diff: repo not in allowlist: %s", repo)
-            return ToolResult(ok=False, error=f"repo_not_allowed:{repo} - not in configured allowlist")
+def _tool_memory_skills(call: _ToolCall) -> ToolResult:
+    args, policy, analysis_json = call.args, call.policy, call.analysis_json
+    if not policy.allow_memory_read:
+        return ToolResult(ok=False, error="tool_not_allowed")
+    try:
+        inv = _build_investigation_from_analysis_json(analysis_json)
+        ok, msg, matches = match_skills(inv, max_matches=int(args.get("max_matches") or 5))
+        if not ok:
+            return ToolResult(ok=False, error=f"memory_unavailable:{msg}")
+        items = []
+        for m in matches or []:
+            items.append({"name": m.skill.name, "version": m.skill.version, "rendered": m.rendered})
+        return ToolResult(ok=True, result={"status": "ok", "items": items})
+    except Exception as e:
+        return ToolResult(ok=False, error=f"memory_error:{type(e).__name__}")
+
+
+# --------------------
+# actions.*
+# --------------------
+
+
+def _tool_actions_list(call: _ToolCall) -> ToolResult:
+    args, action_policy, namespace, cluster, case_id = (
+        call.args,
+        call.action_policy,
+        call.namespace,
+        call.cluster,
+        call.case_id,
+    )
+    if action_policy is None or not action_policy.enabled:
+        return ToolResult(ok=False, error="tool_not_allowed")
+    if not case_id:
+        return ToolResult(ok=False, error="case_id_required")
+    ok_scope_a, why_scope_a = _ensure_allowed_scope_actions(
+        action_policy, namespace=str(namespace) if namespace else None, cluster=str(cluster) if cluster else None
+    )
+    if not ok_scope_a:
+        return ToolResult(ok=False, error=why_scope_a)
+    try:
+        from agent.memory.actions import list_case_actions
+
+        ok, msg, items = list_case_actions(case_id=str(case_id), limit=int(args.get("limit") or 50))
+        if not ok:
+            return ToolResult(ok=False, error=f"actions_unavailable:{msg}")
+        out = []
+        for a in items:
+            out.append(a.__dict__)
+        return ToolResult(ok=True, result={"status": "ok", "items": out})
+    except Exception as e:
+        return ToolResult(ok=False, error=f"actions_error:{type(e).__name__}")
+
+
+def _tool_actions_propose(call: _ToolCall) -> ToolResult:
+    args, action_policy, namespace, cluster, case_id, run_id = (
+        call.args,
+        call.action_policy,
+        call.namespace,
+        call.cluster,
+        call.case_id,
+        call.run_id,
+    )
+    if action_policy is None or not action_policy.enabled:
+        return ToolResult(ok=False, error="tool_not_allowed")
+    if not case_id:
+        return ToolResult(ok=False, error="case_id_required")
+    ok_scope_a, why_scope_a = _ensure_allowed_scope_actions(
+        action_policy, namespace=str(namespace) if namespace else None, cluster=str(cluster) if cluster else None
+    )
+    if not ok_scope_a:
+        return ToolResult(ok=False, error=why_scope_a)
+    atype = str(args.get("action_type") or "").strip().lower()
+    title = str(args.get("title") or "").strip()
+    if not atype or not title:
+        missing = []
+        if not atype:
+            missing.append("action_type")
+        if not title:
+            missing.append("title")
+        return ToolResult(ok=False, error=f"missing_required_args:{','.join(missing)}")
+    if action_policy.action_type_allowlist is not None and atype not in action_policy.action_type_allowlist:
+        return ToolResult(ok=False, error="action_type_not_allowed")
+    try:
+        # Enforce max actions per case
+        from agent.memory.actions import create_case_action, list_case_actions
+
+        okc, _msgc, existing = list_case_actions(case_id=str(case_id), limit=action_policy.max_actions_per_case + 1)
+        if okc and len(existing) >= int(action_policy.max_actions_per_case):
+            return ToolResult(ok=False, error="case_action_limit_reached")
+
+        ok, msg, action_id = create_case_action(
+            case_id=str(case_id),
+            run_id=str(run_id) if run_id else (str(args.get("run_id")) if args.get("run_id") else None),
+            hypothesis_id=str(args.get("hypothesis_id")) if args.get("hypothesis_id") else None,
+            action_type=atype,
+            title=title,
+            risk=str(args.get("risk")) if args.get("risk") else None,
+            preconditions=(
+                list(args.get("preconditions") or []) if isinstance(args.get("preconditions"), list) else []
+            ),
+            execution_payload=(
+                args.get("execution_payload") if isinstance(args.get("execution_payload"), dict) else {}
+            ),
+            proposed_by=str(args.get("actor")) if args.get("actor") else "chat",
+        )
+        if not ok:
+            return ToolResult(ok=False, error=f"actions_unavailable:{msg}")
+        return ToolResult(ok=True, result={"status": "ok", "action_id": action_id})
+    except Exception as e:
+        return ToolResult(ok=False, error=f"actions_error:{type(e).__name__}")
 
-        try:
-            from agent.services.github_data_service import get_github_data_service
-
-            github_data = get_github_data_service()
-            diff_resp = github_data.commit_diff(repo=repo, sha=sha)
-            if diff_resp.get("error"):
-                err_msg = diff_resp.get("message", "")
-                log.warning("github.commit_diff: provider error for repo=%s sha=%s: %s", repo, sha, err_msg)
-                return ToolResult(ok=False, error=f"{diff_resp.get('error', 'github_error')}: {err_msg}")
-            diff = diff_resp.get("diff", {})
-
-            return ToolResult(ok=True, result=_compact({"repo": repo, **diff}))
-        except Exception as e:
-            log.warning("github.commit_diff failed: repo=%s sha=%s error=%s", repo, sha, str(e)[:200])
-            return ToolResult(ok=False, error=f"github_error:{type(e).__name__}")
-
-    if tool == "github.regression_context":
-        if not policy.allow_github_read:
-            return ToolResult(ok=False, error="tool_not_allowed")
-
-        repo, source = _resolve_github_repo(args, analysis_json)
-        if not repo:
-            log.warning("github.regression_context: repo not discovered (raw=%s, source=%s)", args.get("repo"), source)
-            return ToolResult(
-                ok=False,
-                error="repo_not_discovered: could not resolve repo. Try 'org/repo' format, or add to service-catalog.yaml",
-            )
 
-        log.info("github.regression_context: using repo=%s (source=%s)", repo, source)
+# --------------------
+# rerun.*
+# --------------------
 
-        if policy.github_repo_allowlist and repo not in policy.github_repo_allowlist:
-            log.warning("github.regression_context: repo not in allowlist: %s", repo)
-            return ToolResult(ok=False, error=f"repo_not_allowed:{repo} - not in configured allowlist")
 
-        # Parse error_hints: accept list or comma-separated string
-        raw_hints = args.get("error_hints")
-        if isinstance(raw_hints, list):
-            error_hints = [str(h).strip() for h in raw_hints if str(h).strip()]
-        elif isinstance(raw_hints, str) and raw_hints.strip():
-            error_hints = [h.strip() for h in raw_hints.split(",") if h.strip()]
-        else:
-            error_hints = None
+def _tool_rerun_investigation(call: _ToolCall) -> ToolResult:
+    args, policy, analysis_json = call.args, call.policy, call.analysis_json
+    if not policy.allow_report_rerun:
+        return ToolResult(ok=False, error="tool_not_allowed")
+    tw = str(args.get("time_window") or "").strip()
+    if not tw:
+        return ToolResult(ok=False, error="time_window_required")
 
-        # Parse time window: explicit args or fall back to analysis_json.time_window
-        since_str = str(args.get("since") or "").strip()
-        until_str = str(args.get("until") or "").strip()
-        if since_str:
-            since = _parse_iso(since_str)
-        else:
-            tw = analysis_json.get("time_window") if isinstance(analysis_json.get("time_window"), dict) else {}
-            since = _parse_iso(str(tw.get("start_time") or ""))
-        if until_str:
-            until = _parse_iso(until_str)
-        else:
-            tw = analysis_json.get("time_window") if isinstance(analysis_json.get("time_window"), dict) else {}
-            until = _parse_iso(str(tw.get("end_time") or ""))
+    # reference_time controls whether to investigate historical state or current state
+    reference_time = str(args.get("reference_time") or "original").strip().lower()
+    if reference_time not in ("original", "now"):
+        return ToolResult(ok=False, error="reference_time_must_be_original_or_now")
+
+    # Enforce max window up front with the same parser the pipeline uses, so oversized
+    # requests are rejected before paying for a full investigation run.
+    try:
+        start0, end0 = parse_time_window(tw)
+    except ValueError:
+        return ToolResult(ok=False, error="time_window_invalid")
+    if (end0 - start0).total_seconds() > float(policy.max_time_window_seconds):
+        return ToolResult(ok=False, error="time_window_too_large")
+
+    inv0 = _build_investigation_from_analysis_json(analysis_json)
+
+    # Build alert dict based on reference_time mode
+    if reference_time == "original":
+        # Historical mode: use original alert timestamp (what happened when alert fired)
+        alert = {
+            "fingerprint": inv0.alert.fingerprint,
+            "labels": inv0.alert.labels or {},
+            "annotations": inv0.alert.annotations or {},
+            "starts_at": inv0.alert.starts_at,  # Critical: use original alert time
+            "ends_at": inv0.alert.ends_at,
+            "generator_url": inv0.alert.generator_url,
+            "status": {"state": inv0.alert.state or "active"},
+        }
+    else:
+        # Current state mode: use "now" as reference time
+        now = datetime.now(timezone.utc)
+        alert = {
+            "fingerprint": inv0.alert.fingerprint,
+            "labels": inv0.alert.labels or {},
+            "annotations": inv0.alert.annotations or {},
+            "starts_at": now.isoformat(),  # Use current time as reference
+            "ends_at": "0001-01-01T00:00:00Z",  # Active alert
+            "generator_url": inv0.alert.generator_url,
+            "status": {"state": "active"},
+        }
+
+    inv2 = run_investigation(alert=alert, time_window=tw)
+    # Belt-and-braces: guard the effective window (parsed by pipeline).
+    try:
+        dt = inv2.time_window.end_time - inv2.time_window.start_time
+        if dt.total_seconds() > float(policy.max_time_window_seconds):
+            return ToolResult(ok=False, error="time_window_too_large")
+    except Exception:
+        pass
+    # Return only the analysis slice (smaller) for chat use; skip dumping the rest of the investigation.
+    return ToolResult(ok=True, result={"status": "ok"}, updated_analysis=analysis_to_json_dict(inv2))
 
-        if not since:
-            since = datetime.now(timezone.utc) - timedelta(hours=2)
-        if not until:
-            until = datetime.now(timezone.utc)
 
-        deployed_sha = str(args.get("deployed_sha") or "").strip() or None
-        branch = str(args.get("branch") or "main").strip()
+# --------------------
+# argocd.*
+# --------------------
 
+
+def _tool_argocd(call: _ToolCall) -> ToolResult:
+    tool, policy, log = call.tool, call.policy, call.log
+    if not policy.allow_argocd_read:
+        log.warning(f"Tool {tool} not allowed by policy")
+        return ToolResult(ok=False, error="tool_not_allowed")
+    # Provider placeholder exists but is not implemented.
+    log.warning(f"Tool {tool} not implemented")
+    return ToolResult(ok=False, error="argocd_not_implemented")
+
+
+# --------------------
+# exec.*
+# --------------------
+
+
+def _tool_exec_overview(call: _ToolCall) -> ToolResult:
+    args, policy, log = call.args, call.policy, call.log
+    if not policy.allow_exec_read:
+        return ToolResult(ok=False, error="tool_not_allowed")
+    days = max(1, min(int(args.get("days") or 30), 90))
+    try:
+        from agent.api.webhook import _get_db_connection
+        from agent.memory.console_queries import get_exec_overview
+
+        conn = _get_db_connection()
+        if not conn:
+            return ToolResult(ok=False, error="postgres_not_configured")
         try:
-            from agent.analysis.git_regression import build_regression_context_pack
-
-            pack = build_regression_context_pack(
-                repo=repo,
-                incident_start=since,
-                incident_end=until,
-                deployed_sha=deployed_sha,
-                branch=branch,
-                error_hints=error_hints,
-                max_files=10,
-                max_diff_lines_per_file=200,
-                max_total_diff_lines=1200,
-            )
-            return ToolResult(ok=True, result=_compact(pack))
-        except Exception as e:
-            log.warning("github.regression_context failed: repo=%s error=%s", repo, str(e)[:200])
-            return ToolResult(ok=False, error=f"github_error:{type(e).__name__}")
-
-    # --------------------
-    # logs.*
-    # --------------------
-    if tool == "logs.tail":
-        if not policy.allow_logs_query:
-            return ToolResult(ok=False, error="tool_not_allowed")
-        pod = str(args.get("pod") or "").strip() or (tgt.get("pod") if isinstance(tgt, dict) else None)
-        ns = str(args.get("namespace") or "").strip() or (tgt.get("namespace") if isinstance(tgt, dict) else None)
-
-        # Support Jobs: if no pod but we have a Job workload, find the pods created by the Job
-        if not pod and ns and isinstance(tgt, dict):
-            workload_kind = tgt.get("kind")
-            workload_name = tgt.get("workload")
-            if workload_kind == "Job" and workload_name:
-                try:
-                    k8s = get_k8s_provider()
-                    # Find pods created by this Job using label selector
-                    pods = k8s.list_pods(namespace=ns, label_selector=f"job-name={workload_name}")
-                    if pods:
-                        # Use the most recent pod (Jobs may have multiple pods if they failed and restarted)
-                        pod = (
-                            max(pods, key=lambda p: p.get("metadata", {}).get("creationTimestamp", ""))
-                            .get("metadata", {})
-                            .get("name")
-                        )
-                except Exception:
-                    pass  # Fall through to error below
-
-        if not pod or not ns:
-            missing = []
-            if not pod:
-                missing.append("pod_name")
-            if not ns:
-                missing.append("namespace")
-            return ToolResult(ok=False, error=f"missing_required_args:{','.join(missing)}")
-        try:
-            end_time = _parse_iso(str(args.get("end_time") or "")) or datetime.now(timezone.utc)
-            start_time = _parse_iso(str(args.get("start_time") or "")) or (end_time - timedelta(minutes=15))
-            limit = int(args.get("limit") or policy.max_log_lines)
-            limit = max(10, min(limit, policy.max_log_lines))
-            container = str(args.get("container") or "").strip() or None
-            out = fetch_recent_logs(str(pod), str(ns), start_time, end_time, container=container, limit=limit)
-            # Redact messages before returning to chat.
-            if policy.redact_secrets and isinstance(out, dict) and isinstance(out.get("entries"), list):
-                entries = []
-                for e in out.get("entries") or []:
-                    if not isinstance(e, dict):
-                        continue
-                    msg = e.get("message")
-                    if isinstance(msg, str):
-                        e = dict(e)
-                        e["message"] = redact_text(msg)
-                    entries.append(e)
-                out = dict(out)
-                out["entries"] = entries
-            return ToolResult(ok=True, result=_compact(out))
-        except Exception as e:
-            return ToolResult(ok=False, error=f"logs_error:{type(e).__name__}")
-
-    # --------------------
-    # memory.*
-    # --------------------
-    if tool == "memory.similar_cases":
-        if not policy.allow_memory_read:
-            return ToolResult(ok=False, error="tool_not_allowed")
-        try:
-            inv = _build_investigation_from_analysis_json(analysis_json)
-            ok, msg, sims = find_similar_runs(inv, limit=int(args.get("limit") or 5))
-            if not ok:
-                return ToolResult(ok=False, error=f"memory_unavailable:{msg}")
-            items = []
-            for s in sims or []:
-                items.append(
-                    {
-                        "case_id": s.case_id,
-                        "run_id": s.run_id,
-                        "created_at": s.created_at,
-                        "one_liner": s.one_liner,
-                        "s3_report_key": s.s3_report_key,
-                        "resolution_category": getattr(s, "resolution_category", None),
-                        "resolution_summary": getattr(s, "resolution_summary", None),
-                        "postmortem_link": getattr(s, "postmortem_link", None),
-                    }
-                )
-            return ToolResult(ok=True, result={"status": "ok", "items": items})
-        except Exception as e:
-            return ToolResult(ok=False, error=f"memory_error:{type(e).__name__}")
-
-    if tool == "memory.skills":
-        if not policy.allow_memory_read:
-            return ToolResult(ok=False, error="tool_not_allowed")
-        try:
-            inv = _build_investigation_from_analysis_json(analysis_json)
-            ok, msg, matches = match_skills(inv, max_matches=int(args.get("max_matches") or 5))
-            if not ok:
-                return ToolResult(ok=False, error=f"memory_unavailable:{msg}")
-            items = []
-            for m in matches or []:
-                items.append({"name": m.skill.name, "version": m.skill.version, "rendered": m.rendered})
-            return ToolResult(ok=True, result={"status": "ok", "items": items})
-        except Exception as e:
-            return ToolResult(ok=False, error=f"memory_error:{type(e).__name__}")
-
-    # --------------------
-    # actions.*
-    # --------------------
-    if tool == "actions.list":
-        if action_policy is None or not action_policy.enabled:
-            return ToolResult(ok=False, error="tool_not_allowed")
-        if not case_id:
-            return ToolResult(ok=False, error="case_id_required")
-        ok_scope_a, why_scope_a = _ensure_allowed_scope_actions(
-            action_policy, namespace=str(namespace) if namespace else None, cluster=str(cluster) if cluster else None
-        )
-        if not ok_scope_a:
-            return ToolResult(ok=False, error=why_scope_a)
-        try:
-            from agent.memory.actions import list_case_actions
-
-            ok, msg, items = list_case_actions(case_id=str(case_id), limit=int(args.get("limit") or 50))
-            if not ok:
-                return ToolResult(ok=False, error=f"actions_unavailable:{msg}")
-            out = []
-            for a in items:
-                out.append(a.__dict__)
-            return ToolResult(ok=True, result={"status": "ok", "items": out})
-        except Exception as e:
-            return ToolResult(ok=False, error=f"actions_error:{type(e).__name__}")
-
-    if tool == "actions.propose":
-        if action_policy is None or not action_policy.enabled:
-            return ToolResult(ok=False, error="tool_not_allowed")
-        if not case_id:
-            return ToolResult(ok=False, error="case_id_required")
-        ok_scope_a, why_scope_a = _ensure_allowed_scope_actions(
-            action_policy, namespace=str(namespace) if namespace else None, cluster=str(cluster) if cluster else None
+            data = get_exec_overview(conn, days=days)
+        finally:
+            conn.close()
+
+        # Return a token-efficient summary instead of the full payload.
+        signal = data.get("signal", {})
+        savings = data.get("savings", {})
+        risk = data.get("risk", {})
+        ai = data.get("ai", {})
+        return ToolResult(
+            ok=True,
+            result=_compact(
+                {
+                    "window_days": days,
+                    "signal": {
+                        "total_runs": signal.get("total_runs"),
+                        "actionable_pct": signal.get("actionable_pct"),
+                        "noisy": signal.get("noisy"),
+                        "change_correlated_count": signal.get("change_correlated_count"),
+                    },
+                    "savings": {
+                        "deflected_runs": savings.get("deflected_runs"),
+                        "hours_saved": savings.get("hours_saved"),
+                        "cost_saved_usd": savings.get("cost_saved_usd"),
+                    },
+                    "risk": {
+                        "active_count": risk.get("active_count"),
+                        "active_high_impact_count": risk.get("active_high_impact_count"),
+                        "stale_investigation_count": risk.get("stale_investigation_count"),
+                        "critical_this_month": risk.get("critical_this_month"),
+                        "total_this_month": risk.get("total_this_month"),
+                        "top_active": risk.get("top_active", [])[:3],
+                    },
+                    "ai": ai,
+                    "recurrence_rate": data.get("recurrence", {}).get("rate"),
+                    "top_services": data.get("focus", {}).get("top_services", [])[:3],
+                    "top_teams": data.get("focus", {}).get("top_teams", [])[:3],
+                }
+            ),
         )
-        if not ok_scope_a:
-            return ToolResult(ok=False, error=why_scope_a)
-        atype = str(args.get("action_type") or "").strip().lower()
-        title = str(args.get("title") or "").strip()
-        if not atype or not title:
-            missing = []
-            if not atype:
-                missing.append("action_type")
-            if not title:
-                missing.append("title")
-            return ToolResult(ok=False, error=f"missing_required_args:{','.join(missing)}")
-        if action_policy.action_type_allowlist is not None and atype not in action_policy.action_type_allowlist:
-            return ToolResult(ok=False, error="action_type_not_allowed")
-        try:
-            # Enforce max actions per case
-            from agent.memory.actions import create_case_action, list_case_actions
-
-            okc, _msgc, existing = list_case_actions(case_id=str(case_id), limit=action_policy.max_actions_per_case + 1)
-            if okc and len(existing) >= int(action_policy.max_actions_per_case):
-                return ToolResult(ok=False, error="case_action_limit_reached")
-
-            ok, msg, action_id = create_case_action(
-                case_id=str(case_id),
-                run_id=str(run_id) if run_id else (str(args.get("run_id")) if args.get("run_id") else None),
-                hypothesis_id=str(args.get("hypothesis_id")) if args.get("hypothesis_id") else None,
-                action_type=atype,
-                title=title,
-                risk=str(args.get("risk")) if args.get("risk") else None,
-                preconditions=(
-                    list(args.get("preconditions") or []) if isinstance(args.get("preconditions"), list) else []
-                ),
-                execution_payload=(
-                    args.get("execution_payload") if isinstance(args.get("execution_payload"), dict) else {}
-                ),
-                proposed_by=str(args.get("actor")) if args.get("actor") else "chat",
-            )
-            if not ok:
-                return ToolResult(ok=False, error=f"actions_unavailable:{msg}")
-            return ToolResult(ok=True, result={"status": "ok", "action_id": action_id})
-        except Exception as e:
-            return ToolResult(ok=False, error=f"actions_error:{type(e).__name__}")
-
-    # --------------------
-    # rerun.*
-    # --------------------
-    if tool == "rerun.investigation":
-        if not policy.allow_report_rerun:
-            return ToolResult(ok=False, error="tool_not_allowed")
-        tw = str(args.get("time_window") or "").strip()
-        if not tw:
-            return ToolResult(ok=False, error="time_window_required")
-
-        # reference_time controls whether to investigate historical state or current state
-        reference_time = str(args.get("reference_time") or "original").strip().lower()
-        if reference_time not in ("original", "now"):
-            return ToolResult(ok=False, error="reference_time_must_be_original_or_now")
-
-        # Enforce max window by parsing through agent's parser indirectly: run with a guard.
-        # We approximate: allow only a bounded set in seconds by parsing after the run (cheap guard).
-        # If the user passes a huge window, run_investigation will still parse; guard below rejects if too large.
-        inv0 = _build_investigation_from_analysis_json(analysis_json)
-
-        # Build alert dict based on reference_time mode
-        if reference_time == "original":
-            # Historical mode: use original alert timestamp (what happened when alert fired)
-            alert = {
-                "fingerprint": inv0.alert.fingerprint,
-                "labels": inv0.alert.labels or {},
-                "annotations": inv0.alert.annotations or {},
-                "starts_at": inv0.alert.starts_at,  # Critical: use original alert time
-                "ends_at": inv0.alert.ends_at,
-                "generator_url": inv0.alert.generator_url,
-                "status": {"state": inv0.alert.state or "active"},
-            }
-        else:
-            # Current state mode: use "now" as reference time
-            now = datetime.now(timezone.utc)
-            alert = {
-                "fingerprint": inv0.alert.fingerprint,
-                "labels": inv0.alert.labels or {},
-                "annotations": inv0.alert.annotations or {},
-                "starts_at": now.isoformat(),  # Use current time as reference
-                "ends_at": "0001-01-01T00:00:00Z",  # Active alert
-                "generator_url": inv0.alert.generator_url,
-                "status": {"state": "active"},
-            }
-
-        inv2 = run_investigation(alert=alert, time_window=tw)
-        # Guard the effective window (parsed by pipeline).
-        try:
-            dt = inv2.time_window.end_time - inv2.time_window.start_time
-            if dt.total_seconds() > float(policy.max_time_window_seconds):
-                return ToolResult(ok=False, error="time_window_too_large")
-        except Exception:
-            pass
-        aj = investigation_to_json_dict(inv2, mode="analysis")
-        # Return only analysis slice (smaller) for chat use.
-        return ToolResult(ok=True, result={"status": "ok"}, updated_analysis=aj.get("analysis"))
-
-    # --------------------
-    # argocd.*
-    # --------------------
-    if tool.startswith("argocd."):
-        if not policy.allow_argocd_read:
-            log.warning(f"Tool {tool} not allowed by policy")
-            return ToolResult(ok=False, error="tool_not_allowed")
-        # Provider placeholder exists but is not implemented.
-        log.warning(f"Tool {tool} not implemented")
-        return ToolResult(ok=False, error="argocd_not_implemented")
-
-    # --------------------
-    # exec.*
-    # --------------------
-    if tool == "exec.overview":
-        if not policy.allow_exec_read:
-            return ToolResult(ok=False, error="tool_not_allowed")
-        days = max(1, min(int(args.get("days") or 30), 90))
-        try:
-            from agent.api.webhook import _get_db_connection
-            from agent.memory.console_queries import get_exec_overview
+    except Exception as e:
+        log.warning(f"exec.overview failed: days={days} error={str(e)[:200]}")
+        return ToolResult(ok=False, error=f"exec_overview_error:{type(e).__name__}")
+
+
+_TOOL_HANDLERS: Dict[str, Callable[[_ToolCall], ToolResult]] = {
+    "promql.instant": _tool_promql_instant,
+    "k8s.pod_context": _tool_k8s_pod_context,
+    "k8s.rollout_status": _tool_k8s_rollout_status,
+    "k8s.events": _tool_k8s_events,
+    "aws.ec2_status": _tool_aws_ec2_status,
+    "aws.ebs_health": _tool_aws_ebs_health,
+    "aws.elb_health": _tool_aws_elb_health,
+    "aws.rds_status": _tool_aws_rds_status,
+    "aws.ecr_image": _tool_aws_ecr_image,
+    "aws.security_group": _tool_aws_security_group,
+    "aws.nat_gateway": _tool_aws_nat_gateway,
+    "aws.vpc_endpoint": _tool_aws_vpc_endpoint,
+    "aws.cloudtrail_events": _tool_aws_cloudtrail_events,
+    "aws.s3_bucket_location": _tool_aws_s3_bucket_location,
+    "aws.iam_role_permissions": _tool_aws_iam_role_permissions,
+    "github.recent_commits": _tool_github_recent_commits,
+    "github.workflow_runs": _tool_github_workflow_runs,
+    "github.workflow_logs": _tool_github_workflow_logs,
+    "github.read_file": _tool_github_read_file,
+    "github.commit_diff": _tool_github_commit_diff,
+    "github.regression_context": _tool_github_regression_context,
+    "logs.tail": _tool_logs_tail,
+    "memory.similar_cases": _tool_memory_similar_cases,
+    "memory.skills": _tool_memory_skills,
+    "actions.list": _tool_actions_list,
+    "actions.propose": _tool_actions_propose,
+    "rerun.investigation": _tool_rerun_investigation,
+    "exec.overview": _tool_exec_overview,
+}
+
+# Namespaced tool families, consulted only when no exact handler matches.
+_TOOL_PREFIX_HANDLERS: Tuple[Tuple[str, Callable[[_ToolCall], ToolResult]], ...] = (("argocd.", _tool_argocd),)
 
-            conn = _get_db_connection()
-            if not conn:
-                return ToolResult(ok=False, error="postgres_not_configured")
-            try:
-                data = get_exec_overview(conn, days=days)
-            finally:
-                conn.close()
-
-            # Return a token-efficient summary instead of the full payload.
-            signal = data.get("signal", {})
-            savings = data.get("savings", {})
-            risk = data.get("risk", {})
-            ai = data.get("ai", {})
-            return ToolResult(
-                ok=True,
-                result=_compact(
-                    {
-                        "window_days": days,
-                        "signal": {
-                            "total_runs": signal.get("total_runs"),
-                            "actionable_pct": signal.get("actionable_pct"),
-                            "noisy": signal.get("noisy"),
-                            "change_correlated_count": signal.get("change_correlated_count"),
-                        },
-                        "savings": {
-                            "deflected_runs": savings.get("deflected_runs"),
-                            "hours_saved": savings.get("hours_saved"),
-                            "cost_saved_usd": savings.get("cost_saved_usd"),
-                        },
-                        "risk": {
-                            "active_count": risk.get("active_count"),
-                            "active_high_impact_count": risk.get("active_high_impact_count"),
-                            "stale_investigation_count": risk.get("stale_investigation_count"),
-                            "critical_this_month": risk.get("critical_this_month"),
-                            "total_this_month": risk.get("total_this_month"),
-                            "top_active": risk.get("top_active", [])[:3],
-                        },
-                        "ai": ai,
-                        "recurrence_rate": data.get("recurrence", {}).get("rate"),
-                        "top_services": data.get("focus", {}).get("top_services", [])[:3],
-                        "top_teams": data.get("focus", {}).get("top_teams", [])[:3],
-                    }
-                ),
-            )
-        except Exception as e:
-            log.warning(f"exec.overview failed: days={days} error={str(e)[:200]}")
-            return ToolResult(ok=False, error=f"exec_overview_error:{type(e).__name__}")
+
+def run_tool(
+    *,
+    policy: ChatPolicy,
+    action_policy: Optional[ActionPolicy],
+    tool: str,
+    args: Dict[str, Any],
+    analysis_json: Dict[str, Any],
+    case_id: Optional[str] = None,
+    run_id: Optional[str] = None,
+    caller_logger: Optional[logging.Logger] = None,
+) -> ToolResult:
+    """
+    Execute a single chat tool call with policy enforcement.
+
+    Args:
+        caller_logger: Optional logger to use instead of the default chat logger.
+                      This allows RCA and other callers to use their own logger
+                      for clearer log attribution.
+    """
+    tool = (tool or "").strip()
+    if not tool:
+        return ToolResult(ok=False, error="tool_missing")
+
+    # Use caller's logger if provided, otherwise use module logger
+    log = caller_logger or logger
+
+    # Log tool invocation with compact args (for debugging)
+    compact_args = {
+        k: v for k, v in (args or {}).items() if k in ["namespace", "pod", "kind", "name", "query", "limit", "repo"]
+    }
+    log.info(f"Tool call: {tool} args={compact_args} case_id={case_id}")
+
+    tgt = analysis_json.get("target") if isinstance(analysis_json.get("target"), dict) else {}
+    namespace = tgt.get("namespace") if isinstance(tgt, dict) else None
+    cluster = tgt.get("cluster") if isinstance(tgt, dict) else None
+    ok_scope, why_scope = _ensure_allowed_scope(
+        policy, namespace=str(namespace) if namespace else None, cluster=str(cluster) if cluster else None
+    )
+    if not ok_scope and tool.startswith(("k8s.", "logs.", "rerun.", "memory.")):
+        log.warning(f"Tool {tool} blocked by scope policy: {why_scope}")
+        return ToolResult(ok=False, error=why_scope)
+
+    call = _ToolCall(
+        tool=tool,
+        args=args,
+        policy=policy,
+        action_policy=action_policy,
+        analysis_json=analysis_json,
+        tgt=tgt,
+        namespace=namespace,
+        cluster=cluster,
+        case_id=case_id,
+        run_id=run_id,
+        log=log,
+    )
+    handler = _TOOL_HANDLERS.get(tool)
+    if handler is not None:
+        return handler(call)
+    for prefix, prefix_handler in _TOOL_PREFIX_HANDLERS:
+        if tool.startswith(prefix):
+            return prefix_handler(call)
 
     log.warning(f"Unknown tool: {tool}")
     return ToolResult(ok=False, error="unknown_tool")
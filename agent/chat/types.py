@@ -2,13 +2,16 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 ChatRole = Literal["user", "assistant", "tool"]
 ChatToolOutcome = Literal["ok", "empty", "unavailable", "error", "skipped_duplicate"]
 
 
 class ChatMessage(BaseModel):
+    # History entries are immutable once parsed; frozen models also skip assignment validation.
+    model_config = ConfigDict(frozen=True)
+
     role: ChatRole
     content: str
     name: Optional[str] = None
@@ -11,13 +11,70 @@ import os
 import re
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple, TypedDict
 
 from agent.core.models import Investigation
 from agent.providers.aws_provider import get_aws_provider
 
-
-def extract_aws_metadata_from_investigation(investigation: Investigation) -> Dict[str, Any]:
+AwsIdBucket = Literal["ec2_instances", "ebs_volumes", "security_groups", "nat_gateways", "vpc_endpoints"]
+
+
+class AwsEcrRef(TypedDict):
+    repository: str
+    tag: str
+    region: str
+
+
+class AwsMetadata(TypedDict):
+    """AWS resource IDs discovered for an investigation (see extract_aws_metadata_from_investigation)."""
+
+    region: str
+    ec2_instances: List[str]
+    ebs_volumes: List[str]
+    elb_names: List[str]
+    elbv2_target_groups: List[str]
+    rds_instances: List[str]
+    ecr_repositories: List[AwsEcrRef]
+    security_groups: List[str]
+    nat_gateways: List[str]
+    vpc_endpoints: List[str]
+
+
+# AWS resource ID prefix -> metadata bucket. Add new prefixed resource types here.
+_AWS_ID_PREFIX_BUCKETS: Tuple[Tuple[str, AwsIdBucket], ...] = (
+    ("i-", "ec2_instances"),
+    ("vol-", "ebs_volumes"),
+    ("sg-", "security_groups"),
+    ("nat-", "nat_gateways"),
+    ("vpce-", "vpc_endpoints"),
+)
+
+# Metadata keys holding resource lists; evidence collection is skipped when all are empty.
+_AWS_RESOURCE_KEYS = (
+    "ec2_instances",
+    "ebs_volumes",
+    "elb_names",
+    "elbv2_target_groups",
+    "rds_instances",
+    "ecr_repositories",
+    "security_groups",
+    "nat_gateways",
+    "vpc_endpoints",
+)
+
+# Alert labels that may carry a prefixed AWS resource ID.
+_AWS_ID_LABELS = ("instance_id", "instance", "volume_id", "security_group_id", "nat_gateway_id", "vpc_endpoint_id")
+
+
+def _aws_id_bucket(resource_id: str) -> Optional[AwsIdBucket]:
+    """Return the metadata bucket for a prefixed AWS resource ID, or None if unrecognized."""
+    for prefix, bucket in _AWS_ID_PREFIX_BUCKETS:
+        if resource_id.startswith(prefix):
+            return bucket
+    return None
+
+
+def extract_aws_metadata_from_investigation(investigation: Investigation) -> AwsMetadata:
     """
     Extract AWS resource IDs from investigation context.
 
@@ -29,7 +86,7 @@ def extract_aws_metadata_from_investigation(investigation: Investigation) -> Dic
     5. Container images (ECR repositories)
     6. Node labels (security group IDs, VPC IDs)
 
-    Returns dict with discovered resource IDs keyed by type:
+    Returns an AwsMetadata dict with discovered resource IDs keyed by type (every key is always present):
         {
             "region": "us-east-1",
             "ec2_instances": ["i-abc123"],
@@ -37,13 +94,13 @@ def extract_aws_metadata_from_investigation(investigation: Investigation) -> Dic
             "elb_names": ["my-classic-lb"],
             "elbv2_target_groups": ["arn:aws:..."],
             "rds_instances": ["my-db"],
-            "ecr_repositories": [{"repo": "my-app", "tag": "v1.2.3"}],
+            "ecr_repositories": [{"repository": "my-app", "tag": "v1.2.3", "region": "us-east-1"}],
             "security_groups": ["sg-abc123"],
             "nat_gateways": ["nat-xyz789"],
             "vpc_endpoints": ["vpce-abc123"],
         }
     """
-    metadata: Dict[str, Any] = {
+    metadata: AwsMetadata = {
         "region": os.getenv("AWS_REGION", "us-east-1"),  # Default region
         "ec2_instances": [],
         "ebs_volumes": [],
@@ -65,22 +122,14 @@ def extract_aws_metadata_from_investigation(investigation: Investigation) -> Dic
     elif alert_labels.get("region"):
         metadata["region"] = str(alert_labels["region"])
 
-    # EC2 instances
-    if alert_labels.get("instance_id"):
-        instance_id = str(alert_labels["instance_id"])
-        if instance_id.startswith("i-"):
-            metadata["ec2_instances"].append(instance_id)
-
-    if alert_labels.get("instance"):
-        instance = str(alert_labels["instance"])
-        if instance.startswith("i-"):
-            metadata["ec2_instances"].append(instance)
-
-    # EBS volumes
-    if alert_labels.get("volume_id"):
-        volume_id = str(alert_labels["volume_id"])
-        if volume_id.startswith("vol-"):
-            metadata["ebs_volumes"].append(volume_id)
+    # Prefixed resource IDs (EC2, EBS, security groups, NAT gateways, VPC endpoints)
+    for label in _AWS_ID_LABELS:
+        value = alert_labels.get(label)
+        if value:
+            resource_id = str(value)
+            bucket = _aws_id_bucket(resource_id)
+            if bucket:
+                metadata[bucket].append(resource_id)
 
     # ELB
     if alert_labels.get("load_balancer"):
@@ -105,24 +154,6 @@ def extract_aws_metadata_from_investigation(investigation: Investigation) -> Dic
     if alert_labels.get("dbinstance_identifier"):
         metadata["rds_instances"].append(str(alert_labels["dbinstance_identifier"]))
 
-    # Security groups
-    if alert_labels.get("security_group_id"):
-        sg_id = str(alert_labels["security_group_id"])
-        if sg_id.startswith("sg-"):
-            metadata["security_groups"].append(sg_id)
-
-    # NAT gateways
-    if alert_labels.get("nat_gateway_id"):
-        nat_id = str(alert_labels["nat_gateway_id"])
-        if nat_id.startswith("nat-"):
-            metadata["nat_gateways"].append(nat_id)
-
-    # VPC endpoints
-    if alert_labels.get("vpc_endpoint_id"):
-        vpce_id = str(alert_labels["vpc_endpoint_id"])
-        if vpce_id.startswith("vpce-"):
-            metadata["vpc_endpoints"].append(vpce_id)
-
     # 2. Extract from K8s context
     k8s_evidence = investigation.evidence.k8s
     pod_info = k8s_evidence.pod_info or {}
@@ -133,13 +164,8 @@ def extract_aws_metadata_from_investigation(investigation: Investigation) -> Dic
         # EKS node names are often: ip-10-12-34-56.ec2.internal or i-abc123def456
         if node_name.startswith("i-"):
             metadata["ec2_instances"].append(node_name)
-        # Try to extract instance ID from labels (EKS pattern)
-        owner_chain = k8s_evidence.owner_chain or {}
-        workload = owner_chain.get("workload") or {}
-        workload_labels = workload.get("labels") or {}
-        if workload_labels.get("eks.amazonaws.com/nodegroup"):
-            # Node is from EKS - we might be able to look it up
-            pass  # Future: Query K8s node object for instance ID annotation
+        # Future: for EKS nodegroup workloads (owner_chain.workload.labels["eks.amazonaws.com/nodegroup"]),
+        # query the K8s node object for its instance ID annotation.
 
     # 3. Extract from pod annotations (EBS CSI)
     # EBS CSI driver adds annotations like: volume.kubernetes.io/storage-provisioner: ebs.csi.aws.com
@@ -198,12 +224,25 @@ def collect_aws_evidence(investigation: Investigation) -> Dict[str, Any]:
     except Exception as e:
         return {"errors": [f"metadata_extraction_failed:{type(e).__name__}"]}
 
-    region = metadata.get("region", "us-east-1")
+    # Non-AWS alerts: skip provider (boto3 session) setup entirely.
+    if not any(metadata.get(k) for k in _AWS_RESOURCE_KEYS):
+        return {
+            "ec2_instances": {},
+            "ebs_volumes": {},
+            "elb_health": {},
+            "rds_instances": {},
+            "ecr_images": {},
+            "networking": {},
+            "metadata": metadata,
+            "errors": errors,
+        }
+
+    region = metadata["region"]
     aws = get_aws_provider()
 
     # Collect EC2 instance status
     ec2_instances: Dict[str, Any] = {}
-    for instance_id in metadata.get("ec2_instances", []):
+    for instance_id in metadata["ec2_instances"]:
         try:
             result = aws.get_ec2_instance_status(instance_id, region)
             ec2_instances[instance_id] = result
@@ -212,7 +251,7 @@ def collect_aws_evidence(investigation: Investigation) -> Dict[str, Any]:
 
     # Collect EBS volume health
     ebs_volumes: Dict[str, Any] = {}
-    for volume_id in metadata.get("ebs_volumes", []):
+    for volume_id in metadata["ebs_volumes"]:
         try:
             result = aws.get_ebs_volume_health(volume_id, region)
             ebs_volumes[volume_id] = result
@@ -221,7 +260,7 @@ def collect_aws_evidence(investigation: Investigation) -> Dict[str, Any]:
 
     # Collect ELB health (Classic)
     elb_health: Dict[str, Any] = {}
-    for lb_name in metadata.get("elb_names", []):
+    for lb_name in metadata["elb_names"]:
         try:
             result = aws.get_elb_target_health(lb_name, region)
             elb_health[lb_name] = result
@@ -229,7 +268,7 @@ def collect_aws_evidence(investigation: Investigation) -> Dict[str, Any]:
             errors.append(f"elb:{lb_name}:{type(e).__name__}")
 
     # Collect ELBv2 health (ALB/NLB)
-    for tg_arn in metadata.get("elbv2_target_groups", []):
+    for tg_arn in metadata["elbv2_target_groups"]:
         try:
             result = aws.get_elbv2_target_health(tg_arn, region)
             elb_health[tg_arn] = result
@@ -238,7 +277,7 @@ def collect_aws_evidence(investigation: Investigation) -> Dict[str, Any]:
 
     # Collect RDS instance status
     rds_instances: Dict[str, Any] = {}
-    for db_id in metadata.get("rds_instances", []):
+    for db_id in metadata["rds_instances"]:
         try:
             result = aws.get_rds_instance_status(db_id, region)
             rds_instances[db_id] = result
@@ -247,36 +286,33 @@ def collect_aws_evidence(investigation: Investigation) -> Dict[str, Any]:
 
     # Collect ECR image scan findings
     ecr_images: Dict[str, Any] = {}
-    for ecr_ref in metadata.get("ecr_repositories", []):
-        if isinstance(ecr_ref, dict):
-            repo = ecr_ref.get("repository")
-            tag = ecr_ref.get("tag")
-            ecr_region = ecr_ref.get("region", region)
-            if repo and tag:
-                try:
-                    result = aws.get_ecr_image_scan_findings(repo, tag, ecr_region)
-                    ecr_images[f"{repo}:{tag}"] = result
-                except Exception as e:
-                    errors.append(f"ecr:{repo}:{tag}:{type(e).__name__}")
+    for ecr_ref in metadata["ecr_repositories"]:
+        repo = ecr_ref["repository"]
+        tag = ecr_ref["tag"]
+        try:
+            result = aws.get_ecr_image_scan_findings(repo, tag, ecr_ref["region"] or region)
+            ecr_images[f"{repo}:{tag}"] = result
+        except Exception as e:
+            errors.append(f"ecr:{repo}:{tag}:{type(e).__name__}")
 
     # Collect networking status
     networking: Dict[str, Any] = {}
 
-    for sg_id in metadata.get("security_groups", []):
+    for sg_id in metadata["security_groups"]:
         try:
             result = aws.get_security_group_rules(sg_id, region)
             networking[sg_id] = result
         except Exception as e:
             errors.append(f"sg:{sg_id}:{type(e).__name__}")
 
-    for nat_id in metadata.get("nat_gateways", []):
+    for nat_id in metadata["nat_gateways"]:
         try:
             result = aws.get_nat_gateway_status(nat_id, region)
             networking[nat_id] = result
         except Exception as e:
             errors.append(f"nat:{nat_id}:{type(e).__name__}")
 
-    for vpce_id in metadata.get("vpc_endpoints", []):
+    for vpce_id in metadata["vpc_endpoints"]:
         try:
             result = aws.get_vpc_endpoint_status(vpce_id, region)
             networking[vpce_id] = result
@@ -370,15 +406,15 @@ def _extract_region(investigation: Investigation) -> str:
     if alert_labels.get("aws_region"):
         return str(alert_labels["aws_region"])
 
-    # 2. Try AWS evidence metadata
-    if investigation.evidence.aws and investigation.evidence.aws.metadata:
-        metadata = investigation.evidence.aws.metadata
-        if metadata.get("region"):
+    aws_ev = investigation.evidence.aws
+    if aws_ev:
+        # 2. Try AWS evidence metadata
+        metadata = aws_ev.metadata
+        if metadata and metadata.get("region"):
             return str(metadata["region"])
 
-    # 3. Try EC2 instances
-    if investigation.evidence.aws and investigation.evidence.aws.ec2_instances:
-        for instance_id, data in investigation.evidence.aws.ec2_instances.items():
+        # 3. Try EC2 instances
+        for data in (aws_ev.ec2_instances or {}).values():
             if isinstance(data, dict) and data.get("region"):
                 return str(data["region"])
 
@@ -390,18 +426,12 @@ def _extract_resource_ids(investigation: Investigation) -> Optional[List[str]]:
     """Extract AWS resource IDs from investigation evidence."""
     resource_ids = []
 
-    if investigation.evidence.aws:
-        # EC2 instances
-        if investigation.evidence.aws.ec2_instances:
-            resource_ids.extend(investigation.evidence.aws.ec2_instances.keys())
-
-        # EBS volumes
-        if investigation.evidence.aws.ebs_volumes:
-            resource_ids.extend(investigation.evidence.aws.ebs_volumes.keys())
-
-        # RDS instances
-        if investigation.evidence.aws.rds_instances:
-            resource_ids.extend(investigation.evidence.aws.rds_instances.keys())
+    aws_ev = investigation.evidence.aws
+    if aws_ev:
+        # EC2 instances, EBS volumes, RDS instances
+        for resources in (aws_ev.ec2_instances, aws_ev.ebs_volumes, aws_ev.rds_instances):
+            if resources:
+                resource_ids.extend(resources.keys())
 
     return resource_ids if resource_ids else None
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 from agent.collectors.pod_baseline import _container_from_investigation, _require_pod_target, collect_pod_baseline
 from agent.core.models import Investigation
 from agent.providers.prom_provider import query_cpu_throttling
@@ -16,15 +18,17 @@ def collect_cpu_throttling(investigation: Investigation) -> None:
     start_time = investigation.time_window.start_time
     end_time = investigation.time_window.end_time
 
-    collect_pod_baseline(investigation, events_limit=20)
+    # Container comes from the target/alert labels (not from baseline evidence), so the throttling
+    # query can run while the pod baseline (K8s + Prometheus + logs) is collected.
     container = _container_from_investigation(investigation)
 
-    try:
-        investigation.evidence.metrics.throttling_data = query_cpu_throttling(
-            pod, namespace, start_time, end_time, container=container
-        )
-    except Exception as e:
-        investigation.errors.append(f"Failed to query throttling: {e}")
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        throttling = pool.submit(query_cpu_throttling, pod, namespace, start_time, end_time, container=container)
+        collect_pod_baseline(investigation, events_limit=20)
+        try:
+            investigation.evidence.metrics.throttling_data = throttling.result()
+        except Exception as e:
+            investigation.errors.append(f"Failed to query throttling: {e}")
 
 
 __all__ = ["collect_cpu_throttling"]
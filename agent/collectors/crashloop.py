@@ -8,6 +8,8 @@ Builds on the shared pod_baseline collector with crashloop-specific enrichment:
 
 from __future__ import annotations
 
+from collections import deque
+from datetime import datetime
 from typing import List, Optional
 
 from agent.collectors.log_parser import parse_log_entries
@@ -19,6 +21,10 @@ from agent.collectors.pod_baseline import (
 from agent.core.models import Investigation
 from agent.providers.k8s_provider import get_k8s_provider
 
+# Previous-container log lines to fetch and parse. The crash context lives at the end of the log,
+# so when more lines arrive than this we keep the most recent ones.
+_PREVIOUS_LOG_MAX_LINES = 200
+
 
 def collect_crashloop_evidence(investigation: Investigation) -> None:
     """Crashloop evidence collector.
@@ -74,7 +80,7 @@ def _fetch_previous_logs(
             namespace=namespace,
             container=container,
             previous=True,
-            tail_lines=200,
+            tail_lines=_PREVIOUS_LOG_MAX_LINES,
         )
         if prev_logs:
             investigation.meta["previous_container_logs"] = prev_logs
@@ -85,14 +91,16 @@ def _fetch_previous_logs(
 def _parse_previous_logs(investigation: Investigation) -> None:
     """Parse previous container logs for ERROR/FATAL patterns."""
     prev_logs_raw = investigation.meta.get("previous_container_logs")
-    if not prev_logs_raw:
+    if not prev_logs_raw or not prev_logs_raw.strip():
         return
 
     try:
         # Convert raw log text to list-of-dict format expected by parse_log_entries
-        log_entries = [{"message": line} for line in prev_logs_raw.splitlines() if line.strip()]
-        if not log_entries:
+        # (bounded to the most recent non-empty lines so oversized blobs don't allocate a dict per line).
+        lines = deque(filter(str.strip, prev_logs_raw.splitlines()), maxlen=_PREVIOUS_LOG_MAX_LINES)
+        if not lines:
             return
+        log_entries = [{"message": line} for line in lines]
 
         parse_result = parse_log_entries(log_entries, limit=50)
         parsed_errors = parse_result.get("parsed_errors", [])
@@ -109,20 +117,22 @@ def _detect_probe_failures(investigation: Investigation) -> None:
         investigation.meta["probe_failure_type"] = None
         return
 
+    # Events are List[dict] per K8sEvidence; a malformed entry stops the scan rather than being probed per item.
     probe_type = None
-    for ev in events:
-        if not isinstance(ev, dict):
-            continue
-        reason = (ev.get("reason") or "").strip()
-        message = (ev.get("message") or "").strip().lower()
+    try:
+        for ev in events:
+            # Cheap reason check first: most events (Scheduled/Pulled/BackOff/...) never need their message lowered.
+            if ev.get("reason") != "Unhealthy":
+                continue
+            message = (ev.get("message") or "").lower()
 
-        if reason == "Unhealthy":
             if "liveness" in message:
                 probe_type = "liveness"
                 break  # Liveness is highest priority (causes restarts)
-            elif "readiness" in message:
-                if probe_type is None:
-                    probe_type = "readiness"
+            if probe_type is None and "readiness" in message:
+                probe_type = "readiness"
+    except (AttributeError, TypeError):
+        pass
 
     investigation.meta["probe_failure_type"] = probe_type
 
@@ -142,18 +152,14 @@ def _extract_crash_timing(investigation: Investigation, container: Optional[str]
     if not container_statuses:
         return
 
-    # Find the target container (or first one)
-    target_cs = None
-    for cs in container_statuses:
-        if not isinstance(cs, dict):
-            continue
-        if container and cs.get("name") == container:
-            target_cs = cs
-            break
-    if target_cs is None and container_statuses:
-        target_cs = container_statuses[0] if isinstance(container_statuses[0], dict) else None
-
+    # Find the target container (or first one). Statuses are dicts from the K8s provider; anything else bails out.
+    try:
+        target_cs = next((cs for cs in container_statuses if cs.get("name") == container), None) if container else None
+    except (AttributeError, TypeError):
+        return
     if target_cs is None:
+        target_cs = container_statuses[0]
+    if not isinstance(target_cs, dict):
         return
 
     # Extract crash duration from last_state.terminated
@@ -170,11 +176,9 @@ def _extract_crash_timing(investigation: Investigation, container: Optional[str]
 
     if started_at and finished_at:
         try:
-            from datetime import datetime
-
-            # Parse ISO timestamps
-            start = datetime.fromisoformat(str(started_at).replace("Z", "+00:00"))
-            finish = datetime.fromisoformat(str(finished_at).replace("Z", "+00:00"))
+            # Parse ISO timestamps (fromisoformat accepts a trailing "Z" natively on Python 3.11+)
+            start = datetime.fromisoformat(str(started_at))
+            finish = datetime.fromisoformat(str(finished_at))
             duration_seconds = max(0, int((finish - start).total_seconds()))
             investigation.meta["crash_duration_seconds"] = duration_seconds
         except Exception:
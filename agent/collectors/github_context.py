@@ -16,14 +16,53 @@ from __future__ import annotations
 
 import logging
 import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 import yaml
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass(frozen=True)
+class _Catalog:
+    """A parsed YAML catalog plus lookup indexes derived once per load."""
+
+    raw: Dict[str, Any]
+    # Top-level section -> {lowercased entry name: entry config}
+    by_name: Dict[str, Dict[str, Any]]
+    # Every `github_repo` listed under `third_party_services` (membership check for is_third_party)
+    third_party_repos: FrozenSet[str] = frozenset()
+
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> _Catalog:
+        by_name = {
+            section: {str(k).lower(): v for k, v in entries.items()}
+            for section, entries in raw.items()
+            if isinstance(entries, dict)
+        }
+        third_party_repos = frozenset(
+            svc["github_repo"]
+            for svc in by_name.get("third_party_services", {}).values()
+            if isinstance(svc, dict) and svc.get("github_repo")
+        )
+        return cls(raw=raw, by_name=by_name, third_party_repos=third_party_repos)
+
+    def section(self, name: str) -> Dict[str, Any]:
+        return self.by_name.get(name, {})
+
+
+_EMPTY_CATALOG = _Catalog(raw={}, by_name={})
+
+# Parsed catalog cache: path -> (mtime, catalog). Edits to a catalog file invalidate its entry.
+_CATALOG_CACHE: Dict[str, Tuple[float, _Catalog]] = {}
+
 # Workload-type suffixes stripped during fuzzy matching in service catalog
 # and naming convention discovery.  Shared constant to avoid duplication.
 _WORKLOAD_SUFFIXES = (
@@ -46,6 +85,24 @@ _WORKLOAD_SUFFIXES = (
 )
 
 
+def _strip_workload_suffix(name: str) -> Optional[str]:
+    """Return *name* without its workload-type suffix (e.g. "-job"), or None if it has none.
+
+    Every suffix is a single "-<word>", so at most one can match and it is always the
+    last hyphen-separated segment; one C-level endswith() check replaces a per-suffix loop.
+    """
+    if not name.endswith(_WORKLOAD_SUFFIXES):
+        return None
+    return name.rpartition("-")[0]
+
+
+# Structural suffixes stripped by _extract_base_service_name. They are applied in sequence because
+# layers stack (a CronJob pod is <cronjob>-<timestamp>-<hash>); one alternation would strip only one.
+_RE_JOB_POD = re.compile(r"^(.+)-\d+-\d+-([a-z0-9]{5,10})$")  # <name>-<instance>-<retry>-<pod-suffix>
+_RE_JOB_INSTANCE = re.compile(r"^(.+)-\d+-\d+$")  # <name>-<instance>-<retry>
+_RE_CRON_TS = re.compile(r"^(.+)-(\d{8,10})$")  # <name>-<unix timestamp>
+
+
 def discover_github_repo(investigation: Any) -> Optional[str]:
     """
     Discover GitHub repo using multi-step fallback chain.
@@ -53,50 +110,61 @@ def discover_github_repo(investigation: Any) -> Optional[str]:
     Returns:
         "org/repo" string or None if not found
     """
+    repo, _method = discover_github_repo_with_method(investigation)
+    return repo
+
+
+def discover_github_repo_with_method(investigation: Any) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Discover GitHub repo and report which step of the fallback chain found it.
+
+    Returns:
+        ("org/repo", method) or (None, None) if not found
+    """
     service_name = investigation.target.workload_name or investigation.target.pod or ""
     namespace = investigation.target.namespace or ""
 
     # Step 1: K8s annotations
     repo = _discover_from_k8s_annotations(investigation)
     if repo:
-        return repo
+        return repo, "k8s_annotation"
 
     # Step 2: Alert labels
     repo = _discover_from_alert_labels(investigation)
     if repo:
-        return repo
+        return repo, "alert_label"
 
     # Step 3: Static config (before naming convention — catalog has explicit
     # mappings with fuzzy suffix stripping, so it's more accurate than the
     # convention-based guess which can't verify the repo exists).
     repo = _discover_from_service_catalog(service_name)
     if repo:
-        return repo
+        return repo, "service_catalog"
 
     # Step 4: Third-party catalog (before naming convention — known
     # third-party services like mysql, redis, etc. should never fall through
     # to the org-based naming convention guess).
     repo = _discover_from_third_party_catalog(service_name)
     if repo:
-        return repo
+        return repo, "third_party_catalog"
 
     # Step 5: Naming convention
     repo = _discover_from_naming_convention(service_name)
     if repo:
-        return repo
+        return repo, "naming_convention"
 
     # Step 6: Helm metadata
     repo = _discover_from_helm_metadata(namespace, service_name)
     if repo:
-        return repo
+        return repo, "helm_metadata"
 
     # Step 7: OCI image labels
     repo = _discover_from_image_labels(investigation)
     if repo:
-        return repo
+        return repo, "image_labels"
 
     # Step 8: Graceful skip
-    return None
+    return None, None
 
 
 def _discover_from_k8s_annotations(investigation: Any) -> Optional[str]:
@@ -154,31 +222,29 @@ def _discover_from_naming_convention(service_name: str) -> Optional[str]:
     #    "order-processing-service",          (stripped -executor, tried -service)
     #    "order-processing"]                  (stripped -executor)
     candidates = [clean_name]
-    for suffix in _WORKLOAD_SUFFIXES:
-        if clean_name.endswith(suffix):
-            base = clean_name[: -len(suffix)]
-            if base:
-                candidates.append(base)
-                # Also try base-service (common naming pattern)
-                candidates.append(f"{base}-service")
+    base = _strip_workload_suffix(clean_name)
+    if base:
+        candidates.append(base)
+        # Also try base-service (common naming pattern)
+        candidates.append(f"{base}-service")
 
     # Dedupe while preserving order
-    seen: set[str] = set()
-    unique: list[str] = []
-    for c in candidates:
-        if c not in seen:
-            seen.add(c)
-            unique.append(c)
-
-    # Try to verify via GitHub API (fast HEAD check, ~100ms).
+    unique = list(dict.fromkeys(candidates))
+
+    # Try to verify via GitHub API (fast HEAD check, ~100ms). Checks run concurrently so the
+    # wall time is one round-trip, but the first existing candidate in priority order wins.
+    # Returning early does not save the remaining checks: all of them are already running and
+    # the pool waits for them on exit (there are at most three candidates).
     try:
         from agent.providers.github_provider import get_github_provider
 
-        github = get_github_provider()
-        for name in unique:
-            repo = f"{org}/{name}"
-            if github.repo_exists(repo):
-                return repo
+        github = get_github_provider()  # resolved once for all candidates
+        repos = [f"{org}/{name}" for name in unique]
+        with ThreadPoolExecutor(max_workers=len(repos)) as pool:
+            checks = [(repo, pool.submit(_repo_exists, github, repo)) for repo in repos]
+            for repo, check in checks:
+                if check.result():
+                    return repo
     except Exception:
         pass  # Verification unavailable; fall back to first candidate
 
@@ -192,15 +258,40 @@ def _discover_from_naming_convention(service_name: str) -> Optional[str]:
     return fallback
 
 
+# HEAD-check results are reused for this long, so re-investigations of the same workload skip the network.
+_REPO_EXISTS_TTL_SECONDS = 300
+
+
+class _RepoNotConfirmed(Exception):
+    """Carries a negative HEAD check out of the cached function so lru_cache does not keep it."""
+
+
+def _repo_exists(github: Any, repo: str) -> bool:
+    """Cached `github.repo_exists` check (entries expire every `_REPO_EXISTS_TTL_SECONDS`).
+
+    Only positive results are cached: `repo_exists` also returns False on auth/network errors, so a
+    miss is re-checked on the next call instead of hiding the repo for the whole TTL.
+    """
+    try:
+        return _repo_exists_cached(github, repo, int(time.monotonic() // _REPO_EXISTS_TTL_SECONDS))
+    except _RepoNotConfirmed:
+        return False
+
+
+@lru_cache(maxsize=512)
+def _repo_exists_cached(github: Any, repo: str, ttl_bucket: int) -> bool:
+    if not github.repo_exists(repo):
+        raise _RepoNotConfirmed(repo)
+    return True
+
+
 def _discover_from_service_catalog(service_name: str) -> Optional[str]:
     """Step 3: Look up in static service catalog."""
     if not service_name:
         return None
 
-    catalog = _load_service_catalog()
-    # Build case-insensitive lookup (lowercase keys → config)
-    services_raw = catalog.get("services", {})
-    services = {k.lower(): v for k, v in services_raw.items()}
+    # Case-insensitive lookup (lowercase keys → config), indexed once per catalog load
+    services = _load_service_catalog().section("services")
     clean_name = _extract_base_service_name(service_name)
 
     # Try exact match, then base name (case-insensitive)
@@ -217,16 +308,16 @@ def _discover_from_service_catalog(service_name: str) -> Optional[str]:
     #   workload "order-processing-job"      → catalog "order-processing-service"
     #   workload "order-processing-executor"  → catalog "order-processing-service"
     for name in [service_name.lower(), clean_name.lower()]:
-        for suffix in _WORKLOAD_SUFFIXES:
-            if name.endswith(suffix):
-                base = name[: -len(suffix)]
-                # Try base name and base-service variant
-                for variant in [base, f"{base}-service"]:
-                    service_config = services.get(variant)
-                    if service_config and "github_repo" in service_config:
-                        repo = service_config["github_repo"]
-                        if _is_valid_repo_format(repo):
-                            return repo
+        base = _strip_workload_suffix(name)
+        if base is None:
+            continue
+        # Try base name and base-service variant
+        for variant in [base, f"{base}-service"]:
+            service_config = services.get(variant)
+            if service_config and "github_repo" in service_config:
+                repo = service_config["github_repo"]
+                if _is_valid_repo_format(repo):
+                    return repo
 
     return None
 
@@ -252,12 +343,12 @@ def _discover_from_third_party_catalog(service_name: str) -> Optional[str]:
     if not service_name:
         return None
 
-    catalog = _load_third_party_catalog()
+    services = _load_third_party_catalog().section("third_party_services")
     clean_name = _extract_base_service_name(service_name)
 
     # Try exact match, then base name
     for name in [service_name.lower(), clean_name.lower()]:
-        service_config = catalog.get("third_party_services", {}).get(name)
+        service_config = services.get(name)
         if service_config and "github_repo" in service_config:
             repo = service_config["github_repo"]
             if _is_valid_repo_format(repo):
@@ -266,7 +357,7 @@ def _discover_from_third_party_catalog(service_name: str) -> Optional[str]:
     return None
 
 
-_VOWELS = set("aeiou")
+_VOWELS = frozenset("aeiou")
 
 
 def _looks_like_k8s_hash(suffix: str) -> bool:
@@ -280,14 +371,14 @@ def _looks_like_k8s_hash(suffix: str) -> bool:
     if not (5 <= len(suffix) <= 10 and suffix.isalnum() and suffix.islower()):
         return False
     # Pattern 1: no vowels (K8s safe alphabet)
-    if not (_VOWELS & set(suffix)):
-        return True
-    # Pattern 2: mixed letters and digits (ReplicaSet/Deployment hashes)
-    if any(c.isdigit() for c in suffix) and any(c.isalpha() for c in suffix):
+    if not any(c in _VOWELS for c in suffix):
         return True
-    return False
+    # Pattern 2: mixed letters and digits (ReplicaSet/Deployment hashes). islower() above guarantees
+    # at least one letter, so a single digit is enough.
+    return any(c.isdigit() for c in suffix)
 
 
+@lru_cache(maxsize=2048)
 def _extract_base_service_name(service_name: str) -> str:
     """
     Extract base service name from K8s workload name.
@@ -304,13 +395,13 @@ def _extract_base_service_name(service_name: str) -> str:
     - "room-management-api-5f8d9" -> "room-management-api"
     - "payment-processor-v2" -> "payment-processor-v2"
     - "auth-service" -> "auth-service"
-    """
-    import re
 
+    Pure on its input and called by every discovery step, so results are memoized.
+    """
     # 1. Combined Job pod: <name>-<instance>-<retry>-<pod-suffix>
     #    Structurally unambiguous — digits-digits-alphanum can only be a Job pod.
     #    No hash detection needed; any 5-10 char lowercase alnum suffix qualifies.
-    m = re.match(r"^(.+)-\d+-\d+-([a-z0-9]{5,10})$", service_name)
+    m = _RE_JOB_POD.match(service_name)
     if m:
         service_name = m.group(1)
         # Fall through to step 4 (CronJob timestamp) — the Job
@@ -323,12 +414,12 @@ def _extract_base_service_name(service_name: str) -> str:
             service_name = parts[0]
 
         # 3. Job instance without pod hash: <name>-<instance>-<retry>
-        m = re.match(r"^(.+)-\d+-\d+$", service_name)
+        m = _RE_JOB_INSTANCE.match(service_name)
         if m:
             service_name = m.group(1)
 
     # 4. CronJob timestamp: <name>-<8-10 digit unix timestamp>
-    m = re.match(r"^(.+)-(\d{8,10})$", service_name)
+    m = _RE_CRON_TS.match(service_name)
     if m:
         service_name = m.group(1)
 
@@ -337,58 +428,58 @@ def _extract_base_service_name(service_name: str) -> str:
 
 def _is_valid_repo_format(repo: str) -> bool:
     """Validate repo format is 'org/repo'."""
-    if not repo or "/" not in repo:
-        return False
-
-    parts = repo.split("/")
-    if len(parts) != 2:
+    if not repo:
         return False
 
-    org, name = parts
-    # Basic validation: alphanumeric, hyphens, underscores
-    if not org or not name:
+    # Exactly one "/" with a non-empty org and name on either side (no list allocation from split)
+    i = repo.find("/")
+    if i <= 0 or i == len(repo) - 1:
         return False
+    return repo.find("/", i + 1) == -1
 
-    return True
 
+def _load_yaml_catalog(path: Path) -> Optional[_Catalog]:
+    """
+    Parse a YAML catalog file, reusing the previous parse while the file's mtime is unchanged.
 
-def _load_service_catalog() -> Dict[str, Any]:
-    """Load user-maintained service catalog."""
-    config_path = Path("config/service-catalog.yaml")
+    Returns None when the file is missing or unreadable.
+    """
+    if not path.exists():
+        return None
 
-    if not config_path.exists():
-        return {}
+    key = str(path)
+    try:
+        mtime: Optional[float] = path.stat().st_mtime
+    except OSError:
+        mtime = None
+    cached = _CATALOG_CACHE.get(key)
+    if cached is not None and mtime is not None and cached[0] == mtime:
+        return cached[1]
 
     try:
-        with open(config_path) as f:
-            return yaml.safe_load(f) or {}
+        with open(path) as f:
+            catalog = _Catalog.from_raw(yaml.safe_load(f) or {})
     except Exception:
-        return {}
+        return None
+    if mtime is not None:
+        _CATALOG_CACHE[key] = (mtime, catalog)
+    return catalog
 
 
-def _load_third_party_catalog() -> Dict[str, Any]:
+def _load_service_catalog() -> _Catalog:
+    """Load user-maintained service catalog."""
+    return _load_yaml_catalog(Path("config/service-catalog.yaml")) or _EMPTY_CATALOG
+
+
+def _load_third_party_catalog() -> _Catalog:
     """Load third-party services catalog (shipped with agent)."""
     # First try custom catalog
-    custom_path = Path("config/third-party-catalog-custom.yaml")
-    if custom_path.exists():
-        try:
-            with open(custom_path) as f:
-                catalog = yaml.safe_load(f) or {}
-                if catalog:
-                    return catalog
-        except Exception:
-            pass
+    catalog = _load_yaml_catalog(Path("config/third-party-catalog-custom.yaml"))
+    if catalog and catalog.raw:
+        return catalog
 
     # Fall back to default catalog
-    default_path = Path("config/third-party-catalog.yaml")
-    if not default_path.exists():
-        return {}
-
-    try:
-        with open(default_path) as f:
-            return yaml.safe_load(f) or {}
-    except Exception:
-        return {}
+    return _load_yaml_catalog(Path("config/third-party-catalog.yaml")) or _EMPTY_CATALOG
 
 
 def collect_github_evidence(investigation: Any) -> Dict[str, Any]:
@@ -410,25 +501,52 @@ def collect_github_evidence(investigation: Any) -> Dict[str, Any]:
 
     errors: List[str] = []
 
-    # Discover repo
-    repo = discover_github_repo(investigation)
+    # Discover repo (and which step found it, for observability)
+    repo, discovery_method = discover_github_repo_with_method(investigation)
     if not repo:
         return {"errors": ["github_repo_not_found"]}
 
-    # Determine discovery method (for observability)
-    discovery_method = _determine_discovery_method(investigation, repo)
-
     # Check if third-party
-    third_party_catalog = _load_third_party_catalog()
-    is_third_party = any(
-        svc.get("github_repo") == repo for svc in third_party_catalog.get("third_party_services", {}).values()
-    )
+    is_third_party = repo in _load_third_party_catalog().third_party_repos
 
     github_data = get_github_data_service()
     time_window = investigation.time_window
 
-    # Recent commits (2h window before alert)
-    recent_commits = []
+    # Commits, workflow runs, README/docs and regression context are independent round-trips;
+    # overlap them instead of paying the sum of their latencies. Each helper records its own errors.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        commits_future = pool.submit(_collect_recent_commits, github_data, repo, time_window)
+        workflows_future = pool.submit(_collect_workflow_runs, github_data, repo, time_window)
+        docs_future = pool.submit(github_data.readme_and_docs, repo=repo, mirror_ref="HEAD", api_ref="main", max_docs=5)
+        regression_future = pool.submit(_collect_regression_context, repo, time_window)
+
+    recent_commits, commit_errors = commits_future.result()
+    workflow_runs, failed_logs, workflow_errors = workflows_future.result()
+    docs_resp = docs_future.result()
+    regression_context, regression_errors = regression_future.result()
+    errors.extend(commit_errors + workflow_errors + regression_errors)
+
+    readme = docs_resp.get("readme")
+    docs = docs_resp.get("docs", [])
+
+    return {
+        "repo": repo,
+        "repo_discovery_method": discovery_method,
+        "is_third_party": is_third_party,
+        "recent_commits": recent_commits,
+        "workflow_runs": workflow_runs,
+        "failed_workflow_logs": failed_logs,
+        "readme": readme,
+        "docs": docs,
+        "regression_context": regression_context,
+        "errors": errors,
+    }
+
+
+def _collect_recent_commits(github_data: Any, repo: str, time_window: Any) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Recent commits (2h window before alert), capped at 10."""
+    errors: List[str] = []
+    recent_commits: List[Dict[str, Any]] = []
     try:
         since = time_window.start_time - timedelta(hours=2)
         until = time_window.end_time
@@ -443,9 +561,15 @@ def collect_github_evidence(investigation: Any) -> Dict[str, Any]:
             recent_commits = commits[:10]  # Cap at 10
     except Exception as e:
         errors.append(f"commits:{type(e).__name__}")
+    return recent_commits, errors
 
-    # Workflow runs (last 5 runs since time window start)
-    workflow_runs = []
+
+def _collect_workflow_runs(
+    github_data: Any, repo: str, time_window: Any
+) -> Tuple[List[Dict[str, Any]], Optional[str], List[str]]:
+    """Workflow runs (last 5 runs since time window start) plus logs for the first failed job."""
+    errors: List[str] = []
+    workflow_runs: List[Dict[str, Any]] = []
     failed_logs = None
     try:
         runs_resp = github_data.workflow_runs(repo=repo, since=time_window.start_time, limit=5)
@@ -467,13 +591,11 @@ def collect_github_evidence(investigation: Any) -> Dict[str, Any]:
                         failed_logs = logs_resp.get("logs")
     except Exception as e:
         errors.append(f"workflows:{type(e).__name__}")
+    return workflow_runs, failed_logs, errors
 
-    docs_resp = github_data.readme_and_docs(repo=repo, mirror_ref="HEAD", api_ref="main", max_docs=5)
-    readme = docs_resp.get("readme")
-    docs = docs_resp.get("docs", [])
 
-    # Best-effort regression context (no error_hints at pipeline stage; LLM hasn't run yet)
-    regression_context = None
+def _collect_regression_context(repo: str, time_window: Any) -> Tuple[Any, List[str]]:
+    """Best-effort regression context (no error_hints at pipeline stage; LLM hasn't run yet)."""
     try:
         from agent.analysis.git_regression import build_regression_context_pack
 
@@ -487,36 +609,5 @@ def collect_github_evidence(investigation: Any) -> Dict[str, Any]:
             max_total_diff_lines=800,
         )
     except Exception as e:
-        errors.append(f"regression_context:{type(e).__name__}")
-
-    return {
-        "repo": repo,
-        "repo_discovery_method": discovery_method,
-        "is_third_party": is_third_party,
-        "recent_commits": recent_commits,
-        "workflow_runs": workflow_runs,
-        "failed_workflow_logs": failed_logs,
-        "readme": readme,
-        "docs": docs,
-        "regression_context": regression_context,
-        "errors": errors,
-    }
-
-
-def _determine_discovery_method(investigation: Any, repo: str) -> str:
-    """Determine which discovery method found the repo (for observability)."""
-    # Quick re-check each method to see which one matches
-    if _discover_from_k8s_annotations(investigation) == repo:
-        return "k8s_annotation"
-    if _discover_from_alert_labels(investigation) == repo:
-        return "alert_label"
-
-    service_name = investigation.target.workload_name or investigation.target.pod or ""
-    if _discover_from_service_catalog(service_name) == repo:
-        return "service_catalog"
-    if _discover_from_third_party_catalog(service_name) == repo:
-        return "third_party_catalog"
-    if _discover_from_naming_convention(service_name) == repo:
-        return "naming_convention"
-
-    return "unknown"
+        return None, [f"regression_context:{type(e).__name__}"]
+    return regression_context, []
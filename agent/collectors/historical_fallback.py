@@ -11,13 +11,21 @@ this module activates a best-effort investigation mode using:
 
 import re
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from agent.core.time_window import parse_time_window
+from agent.providers.logs_provider import get_logs_provider
 
 if TYPE_CHECKING:
     from agent.core.models import Investigation
 
+# Pod name mentions in alert annotation text: "pod: <name>", "Pod <name>", "Kubernetes pod `<name>`".
+# One case-insensitive pattern covers all forms ("Kubernetes pod" contains "pod").
+_POD_NAME_RE = re.compile(r'pod[:\s]+[`"]?([a-z0-9][-a-z0-9]*)', re.IGNORECASE)
+
+# Annotation fields searched for pod names, in priority order
+_ANNOT_FIELDS = ("summary", "description", "message")
+
 
 def apply_historical_fallback(
     investigation: "Investigation",
@@ -50,7 +58,8 @@ def apply_historical_fallback(
     alert_starts_at = getattr(investigation.alert, "starts_at", None)
     if alert_starts_at and investigation.time_window:
         try:
-            alert_start = datetime.fromisoformat(alert_starts_at.replace("Z", "+00:00"))
+            # fromisoformat accepts a trailing "Z" natively on Python 3.11+
+            alert_start = datetime.fromisoformat(alert_starts_at)
 
             # Calculate lookback duration using existing parse_time_window
             temp_start, temp_end = parse_time_window(investigation.time_window.window)
@@ -76,6 +85,14 @@ def apply_historical_fallback(
         _collect_logs_with_regex(investigation)
 
 
+def _annotations(alert) -> Dict[str, Any]:
+    """Annotations of an AlertInstance or raw alert dict; {} for any other shape."""
+    annotations = getattr(alert, "annotations", None)
+    if annotations is None and isinstance(alert, dict):
+        annotations = alert.get("annotations")
+    return annotations if isinstance(annotations, dict) else {}
+
+
 def _extract_pod_name_from_alert(alert) -> Optional[str]:
     """
     Try to extract pod name from alert annotations.
@@ -91,37 +108,16 @@ def _extract_pod_name_from_alert(alert) -> Optional[str]:
     - Pod <name>
     - Kubernetes pod `<name>`
     """
-    # Handle both dict and Pydantic model
-    if hasattr(alert, "annotations"):
-        annotations = alert.annotations
-    elif isinstance(alert, dict):
-        annotations = alert.get("annotations", {})
-    else:
-        return None
-
-    if not isinstance(annotations, dict):
-        return None
-
-    # Try common annotation fields
-    for field in ["summary", "description", "message"]:
-        text = annotations.get(field, "")
-        if not isinstance(text, str):
-            continue
-
-        # Try various patterns
-        patterns = [
-            r'pod[:\s]+[`"]?([a-z0-9][-a-z0-9]*)[`"]?',  # pod: name or pod name
-            r'Pod[:\s]+[`"]?([a-z0-9][-a-z0-9]*)[`"]?',  # Pod: name
-            r'Kubernetes pod[:\s]+[`"]?([a-z0-9][-a-z0-9]*)[`"]?',  # Kubernetes pod name
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                pod_name = match.group(1)
-                # Validate it looks like a pod name (not just 'is' or 'the')
-                if len(pod_name) > 3 and "-" in pod_name:
-                    return pod_name
+    annotations = _annotations(alert)
+
+    # Scan the common annotation fields in one pass. NUL separators keep a match from spanning fields
+    # (the pattern only crosses ":" and whitespace), and field order preserves priority.
+    text = "\0".join(v for v in (annotations.get(f) for f in _ANNOT_FIELDS) if isinstance(v, str))
+    for match in _POD_NAME_RE.finditer(text):
+        pod_name = match.group(1)
+        # Validate it looks like a pod name (not just 'is' or 'the')
+        if len(pod_name) > 3 and "-" in pod_name:
+            return pod_name
 
     return None
 
@@ -134,8 +130,6 @@ def _collect_logs_with_regex(investigation: "Investigation") -> None:
     - Extract pod name prefix (everything before the last hash)
     - Query logs with regex: {namespace="X", pod=~"prefix-.*"}
     """
-    from agent.providers.logs_provider import get_logs_provider
-
     pod_name = investigation.target.pod
     namespace = investigation.target.namespace
 
@@ -155,16 +149,41 @@ def _collect_logs_with_regex(investigation: "Investigation") -> None:
 
     try:
         logs_provider = get_logs_provider()
-        result = logs_provider.fetch_recent_logs(
-            pod_name=pod_pattern,
-            namespace=namespace,
-            start_time=investigation.time_window.start_time,
-            end_time=investigation.time_window.end_time,
-            limit=400,
-            use_regex=True,  # Enable regex matching
-        )
+        result = None
+        selector = None
+
+        # Prefer an equality match on the indexed Job label over expanding a pod regex across streams.
+        # Not every scrape config carries it, so any non-"ok" answer still falls back to the regex query.
+        job_name = investigation.target.workload_name if investigation.target.workload_kind == "Job" else None
+        if job_name:
+            selector = "job_name"
+            result = logs_provider.fetch_recent_logs(
+                pod_name=pod_name,
+                namespace=namespace,
+                start_time=investigation.time_window.start_time,
+                end_time=investigation.time_window.end_time,
+                limit=400,
+                label_selectors={"job_name": job_name},
+            )
+
+        # A provider that can't honour a pod regex would only burn a round trip on the fallback query
+        if (result is None or result.get("status") != "ok") and getattr(logs_provider, "supports_regex", True):
+            selector = "pod_regex"
+            result = logs_provider.fetch_recent_logs(
+                pod_name=pod_pattern,
+                namespace=namespace,
+                start_time=investigation.time_window.start_time,
+                end_time=investigation.time_window.end_time,
+                limit=400,
+                use_regex=True,  # Enable regex matching
+            )
+
+        if result is None:
+            investigation.meta["historical_logs_skipped"] = "no_regex_support"
+            return
 
         # Populate evidence
+        investigation.meta["historical_logs_selector"] = selector
         investigation.evidence.logs.logs = result.get("entries", [])
         investigation.evidence.logs.logs_status = result.get("status")
         investigation.evidence.logs.logs_reason = result.get("reason")
@@ -186,10 +205,6 @@ def _extract_pod_prefix(pod_name: str) -> Optional[str]:
         myapp-6d4b8c9f7-xk5p2 -> myapp-6d4b8c9f7
         prometheus-kube-state-metrics-99bf89fcf-z5rmg -> prometheus-kube-state-metrics-99bf89fcf
     """
-    # Remove the last segment (usually random suffix)
-    parts = pod_name.rsplit("-", 1)
-    if len(parts) == 2:
-        return parts[0]
-
-    # Fallback: use full name
-    return pod_name
+    # Remove the last segment (usually random suffix); fall back to the full name when there is none
+    i = pod_name.rfind("-")
+    return pod_name[:i] if i > 0 else pod_name
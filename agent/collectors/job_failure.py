@@ -2,16 +2,35 @@
 
 from __future__ import annotations
 
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from agent.collectors.historical_fallback import apply_historical_fallback
-from agent.collectors.k8s_context import gather_pod_context
+from agent.collectors.k8s_context import _rollout_matches, gather_pod_context
 from agent.collectors.log_parser import parse_log_entries
 from agent.core.models import Investigation
-from agent.providers.k8s_provider import get_events, get_k8s_provider, get_workload_rollout_status
+from agent.providers.k8s_provider import (
+    get_events,
+    get_k8s_provider,
+    get_service_account_info,
+    get_workload_rollout_status,
+)
 from agent.providers.logs_provider import fetch_recent_logs
 
+# Log signatures that trigger optional AWS validation (compiled once at import). The bucket name is
+# searched separately on purpose: it often appears before the status code ("bucket: x ... 403") or right
+# after an "S3" mention, which a single error-then-bucket alternation would miss.
+_S3_ERR_RE = re.compile(r"(?:403|404|Forbidden|NoSuchBucket).*(?:s3|bucket)", re.IGNORECASE)
+_BOTO_ERR_RE = re.compile(r"botocore\.exceptions\.ClientError.*(?:403|404)", re.IGNORECASE)
+_BUCKET_RE = re.compile(r"bucket[:\s]+([a-z0-9.-]+)", re.IGNORECASE)
+# Every signature above needs one of these (lowercase) tokens, so messages without them are never scanned
+_AWS_SIGNAL_TOKENS = ("s3", "bucket", "botocore")
+# Cap on signal messages searched for the bucket name; the first mentions carry it
+_AWS_SIGNAL_MAX_MESSAGES = 20
+
 
 def _find_job_pods(namespace: str, job_name: str) -> List[Dict[str, Any]]:
     """Find pods created by a Job using job-name label selector.
@@ -21,13 +40,16 @@ def _find_job_pods(namespace: str, job_name: str) -> List[Dict[str, Any]]:
     """
     try:
         k8s = get_k8s_provider()
-        pods = k8s.list_pods(namespace=namespace, label_selector=f"job-name={job_name}")
-        # Sort by creation time, newest first (Jobs may retry)
-        return sorted(pods, key=lambda p: p.get("metadata", {}).get("creationTimestamp", ""), reverse=True)
+        return k8s.list_pods(namespace=namespace, label_selector=f"job-name={job_name}")
     except Exception:
         return []
 
 
+def _most_recent(pods: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the newest pod by creationTimestamp (Jobs may retry; only the latest attempt is investigated)."""
+    return max(pods, key=lambda p: p.get("metadata", {}).get("creationTimestamp") or "")
+
+
 def _adjust_time_window_for_job(investigation: Investigation) -> None:
     """Adjust investigation time window to use Job start time instead of 'now - 1h'.
 
@@ -43,13 +65,18 @@ def _adjust_time_window_for_job(investigation: Investigation) -> None:
         return
 
     try:
-        # Fetch Job status from K8s API (includes start_time, completion_time)
-        rs = get_workload_rollout_status(namespace=ns, kind="Job", name=wn)
+        # Fetch Job status from K8s API (includes start_time, completion_time). It is kept as the
+        # investigation's rollout evidence so later steps reuse it instead of re-reading the Job.
+        rs = investigation.evidence.k8s.rollout_status
+        if not _rollout_matches(rs, "Job", wn):
+            rs = get_workload_rollout_status(namespace=ns, kind="Job", name=wn)
+            if investigation.evidence.k8s.rollout_status is None:
+                investigation.evidence.k8s.rollout_status = rs
         job_start_str = rs.get("start_time")
 
         if job_start_str:
-            # Parse ISO timestamp (may have Z or +00:00)
-            job_start = datetime.fromisoformat(job_start_str.replace("Z", "+00:00"))
+            # Parse ISO timestamp (may have Z or +00:00; both handled natively on Python 3.11+)
+            job_start = datetime.fromisoformat(job_start_str)
             alert_end = investigation.time_window.end_time
 
             # Only adjust if job started BEFORE alert (normal case)
@@ -114,10 +141,20 @@ def collect_job_failure_evidence(investigation: Investigation) -> None:
     start_time = investigation.time_window.start_time
     end_time = investigation.time_window.end_time
 
+    # Steps 2, 2.5 and 3 are independent apiserver reads: issue them together, then apply in order.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        rollout_future = (
+            pool.submit(get_workload_rollout_status, namespace=ns, kind="Job", name=wn)
+            if investigation.evidence.k8s.rollout_status is None
+            else None
+        )
+        events_future = pool.submit(get_events, namespace=ns, resource_type="job", resource_name=wn, limit=20)
+        pods_future = pool.submit(_find_job_pods, ns, wn)
+
     # Step 2: Get Job rollout status (start_time, completion_time, failed count)
-    if investigation.evidence.k8s.rollout_status is None:
+    if rollout_future is not None:
         try:
-            investigation.evidence.k8s.rollout_status = get_workload_rollout_status(namespace=ns, kind="Job", name=wn)
+            investigation.evidence.k8s.rollout_status = rollout_future.result()
         except Exception as e:
             investigation.errors.append(f"Failed to fetch Job rollout status: {e}")
 
@@ -125,7 +162,7 @@ def collect_job_failure_evidence(investigation: Investigation) -> None:
     # Job events persist longer than pods and may contain critical failure info
     # (DeadlineExceeded, BackoffLimitExceeded, FailedCreate, etc.)
     try:
-        job_events = get_events(namespace=ns, resource_type="job", resource_name=wn, limit=20)
+        job_events = events_future.result()
         if job_events:
             # Initialize pod_events list if needed
             if investigation.evidence.k8s.pod_events is None:
@@ -136,8 +173,8 @@ def collect_job_failure_evidence(investigation: Investigation) -> None:
     except Exception as e:
         investigation.errors.append(f"Failed to fetch Job events: {e}")
 
-    # Step 3: Find Job pods using label selector
-    pods = _find_job_pods(ns, wn)
+    # Step 3: Find Job pods using label selector (_find_job_pods never raises)
+    pods = pods_future.result()
     pod_name = None
 
     if not pods:
@@ -166,7 +203,7 @@ def collect_job_failure_evidence(investigation: Investigation) -> None:
         return
 
     # Step 4: Use most recent pod (Jobs may have multiple attempts due to retries)
-    most_recent_pod = pods[0]
+    most_recent_pod = _most_recent(pods)
     pod_name = most_recent_pod.get("metadata", {}).get("name")
 
     if not pod_name:
@@ -181,16 +218,22 @@ def collect_job_failure_evidence(investigation: Investigation) -> None:
 
     # Step 6: Collect K8s context for the pod
     if investigation.evidence.k8s.pod_info is None:
-        k_ctx = gather_pod_context(pod_name, ns, events_limit=20)
+        k_ctx = gather_pod_context(
+            pod_name, ns, events_limit=20, rollout_status=investigation.evidence.k8s.rollout_status
+        )
         investigation.evidence.k8s.pod_info = k_ctx.get("pod_info")
         investigation.evidence.k8s.pod_conditions = k_ctx.get("pod_conditions") or []
-        investigation.evidence.k8s.pod_events = k_ctx.get("pod_events") or []
+        # Keep the Job events from Step 2.5 after the pod's own events instead of overwriting them
+        pod_events = k_ctx.get("pod_events") or []
+        if investigation.evidence.k8s.pod_events:
+            pod_events.extend(investigation.evidence.k8s.pod_events)
+        investigation.evidence.k8s.pod_events = pod_events
 
         # Merge errors from K8s context gathering
         for err in k_ctx.get("errors") or []:
             investigation.errors.append(f"K8s context: {err}")
 
-    # Step 7: Job events already collected in Step 2.5 (no longer needed here)
+    # Step 7: Job events already collected in Step 2.5 and merged in Step 6
 
     # Step 8: Collect logs using adjusted time window
     if investigation.evidence.logs.logs_status is None and not investigation.evidence.logs.logs:
@@ -214,13 +257,24 @@ def collect_job_failure_evidence(investigation: Investigation) -> None:
     _validate_aws_resources(investigation)
 
 
+def _aws_signal_messages(parsed_errors: List[Dict[str, Any]]) -> List[str]:
+    """Return the parsed error messages mentioning S3/bucket/botocore, in log order."""
+    out: List[str] = []
+    for e in parsed_errors:
+        msg = e.get("message") or ""
+        lowered = msg.lower()
+        if any(tok in lowered for tok in _AWS_SIGNAL_TOKENS):
+            out.append(msg)
+    return out
+
+
 def _validate_aws_resources(investigation: Investigation) -> None:
     """
     Optional AWS resource validation when logs indicate cloud service failures.
 
     Only runs when:
-    1. AWS_EVIDENCE_ENABLED=true
-    2. Parsed errors exist
+    1. Parsed errors exist
+    2. AWS_EVIDENCE_ENABLED=true
     3. Logs indicate S3/IAM/cloud issues
 
     Validates:
@@ -228,25 +282,22 @@ def _validate_aws_resources(investigation: Investigation) -> None:
     - IAM role configuration (IRSA setup)
     - S3 permissions simulation
     """
-    import os
-    import re
+    # Check if we have parsed errors (cheapest exit, and the common one: most Job failures parse no errors)
+    if not investigation.evidence.logs or not investigation.evidence.logs.parsed_errors:
+        return
 
-    # Only run if AWS evidence is enabled
+    # Only run if AWS evidence is enabled (read per call so the flag can be toggled without a restart)
     if os.getenv("AWS_EVIDENCE_ENABLED") != "true":
         return
 
-    # Check if we have parsed errors
-    if not investigation.evidence.logs or not investigation.evidence.logs.parsed_errors:
+    # Only messages carrying an S3/bucket/botocore token can match below; skip the rest without joining them
+    signal_messages = _aws_signal_messages(investigation.evidence.logs.parsed_errors)
+    if not signal_messages:
         return
+    error_text = "\n".join(signal_messages)
 
-    parsed_errors = investigation.evidence.logs.parsed_errors
-    error_text = "\n".join(e.get("message", "") for e in parsed_errors)
-
-    # Check if logs indicate S3 issues
-    has_s3_error = bool(
-        re.search(r"(?:403|404|Forbidden|NoSuchBucket).*(?:s3|bucket)", error_text, re.IGNORECASE)
-        or re.search(r"botocore\.exceptions\.ClientError.*(?:403|404)", error_text, re.IGNORECASE)
-    )
+    # Check if logs indicate S3 issues (over every signal message: the error may follow many benign mentions)
+    has_s3_error = bool(_S3_ERR_RE.search(error_text) or _BOTO_ERR_RE.search(error_text))
 
     if not has_s3_error:
         return
@@ -255,71 +306,91 @@ def _validate_aws_resources(investigation: Investigation) -> None:
     if not investigation.evidence.aws.metadata:
         investigation.evidence.aws.metadata = {}
 
-    # Extract bucket name from logs
-    bucket_match = re.search(r"bucket[:\s]+([a-z0-9.-]+)", error_text, re.IGNORECASE)
-    if bucket_match:
-        bucket_name = bucket_match.group(1)
+    # Extract bucket name from logs (only the first mentions, which is where it appears)
+    bucket_match = _BUCKET_RE.search("\n".join(signal_messages[:_AWS_SIGNAL_MAX_MESSAGES]))
+    bucket_name = bucket_match.group(1) if bucket_match else None
 
-        # Validate S3 bucket
-        try:
-            from agent.providers.aws_s3_validator import check_s3_bucket_exists, get_s3_bucket_location
+    # Get service account IAM role (for IRSA validation)
+    sa_name = None
+    if investigation.evidence.k8s and investigation.evidence.k8s.pod_info:
+        sa_name = investigation.evidence.k8s.pod_info.get("service_account_name")
 
-            s3_validation = check_s3_bucket_exists(bucket_name)
-            investigation.evidence.aws.metadata["s3_validation"] = s3_validation
+    # The S3 chain (bucket -> region) and the IRSA chain (service account -> IAM role) are independent
+    # AWS/K8s round-trips: run them side by side, then apply results in the original S3-then-IAM order.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        s3_future = pool.submit(_validate_s3_bucket, bucket_name) if bucket_name else None
+        irsa_future = pool.submit(_validate_irsa, investigation.target.namespace, sa_name) if sa_name else None
 
-            # If bucket exists but access denied, try to get region
-            if s3_validation.get("error_code") == "403":
-                location = get_s3_bucket_location(bucket_name)
-                if location.get("region"):
-                    investigation.evidence.aws.metadata["s3_bucket_region"] = location["region"]
+    for future in (s3_future, irsa_future):
+        if future is not None:
+            metadata, errors = future.result()
+            investigation.evidence.aws.metadata.update(metadata)
+            investigation.errors.extend(errors)
 
-        except Exception as e:
-            investigation.errors.append(f"AWS S3 validation failed: {e}")
 
-    # Get service account IAM role (for IRSA validation)
-    if investigation.evidence.k8s and investigation.evidence.k8s.pod_info:
-        sa_name = investigation.evidence.k8s.pod_info.get("service_account_name")
-        if sa_name:
-            try:
-                # Get service account to extract IAM role annotation
-                from agent.providers.k8s_provider import get_service_account_info
-
-                sa = get_service_account_info(investigation.target.namespace, sa_name)
-
-                # Check for IRSA annotation
-                annotations = sa.get("annotations", {})
-                role_arn = annotations.get("eks.amazonaws.com/role-arn")
-
-                if role_arn:
-                    investigation.evidence.aws.metadata["irsa_role_arn"] = role_arn
-
-                    # Get IAM role details
-                    from agent.providers.aws_iam_validator import (
-                        check_irsa_trust_policy,
-                        extract_role_name_from_arn,
-                        get_iam_role_info,
-                    )
-
-                    role_name = extract_role_name_from_arn(role_arn)
-                    iam_info = get_iam_role_info(role_name)
-                    investigation.evidence.aws.metadata["iam_role_info"] = iam_info
-
-                    # Check IRSA trust policy
-                    if iam_info.get("trust_policy"):
-                        trust_check = check_irsa_trust_policy(iam_info["trust_policy"])
-                        investigation.evidence.aws.metadata["irsa_trust_check"] = trust_check
-
-                    # Policy documents are now included in iam_role_info
-                    # The LLM/diagnostics can analyze the policy documents directly
-                    # to determine if the bucket is allowed, rather than using
-                    # iam:SimulatePrincipalPolicy which has API limitations
-
-                else:
-                    investigation.evidence.aws.metadata["irsa_role_arn"] = None
-                    investigation.evidence.aws.metadata["irsa_issue"] = "No IRSA annotation found on service account"
-
-            except Exception as e:
-                investigation.errors.append(f"AWS IAM validation failed: {e}")
+def _validate_s3_bucket(bucket_name: str) -> Tuple[Dict[str, Any], List[str]]:
+    """Check S3 bucket existence (and region on 403). Returns (aws metadata updates, errors); never raises."""
+    metadata: Dict[str, Any] = {}
+    try:
+        # AWS validators import boto3; keep that cost off the import path for non-AWS deployments
+        from agent.providers.aws_s3_validator import check_s3_bucket_exists, get_s3_bucket_location
+
+        s3_validation = check_s3_bucket_exists(bucket_name)
+        metadata["s3_validation"] = s3_validation
+
+        # If bucket exists but access denied, try to get region
+        if s3_validation.get("error_code") == "403":
+            location = get_s3_bucket_location(bucket_name)
+            if location.get("region"):
+                metadata["s3_bucket_region"] = location["region"]
+
+    except Exception as e:
+        return metadata, [f"AWS S3 validation failed: {e}"]
+    return metadata, []
+
+
+def _validate_irsa(namespace: Optional[str], sa_name: str) -> Tuple[Dict[str, Any], List[str]]:
+    """Resolve the service account's IRSA role and its IAM details. Returns (aws metadata updates, errors)."""
+    metadata: Dict[str, Any] = {}
+    try:
+        # Get service account to extract IAM role annotation
+        sa = get_service_account_info(namespace, sa_name)
+
+        # Check for IRSA annotation
+        annotations = sa.get("annotations", {})
+        role_arn = annotations.get("eks.amazonaws.com/role-arn")
+
+        if role_arn:
+            metadata["irsa_role_arn"] = role_arn
+
+            # Get IAM role details
+            from agent.providers.aws_iam_validator import (
+                check_irsa_trust_policy,
+                extract_role_name_from_arn,
+                get_iam_role_info,
+            )
+
+            role_name = extract_role_name_from_arn(role_arn)
+            iam_info = get_iam_role_info(role_name)
+            metadata["iam_role_info"] = iam_info
+
+            # Check IRSA trust policy
+            if iam_info.get("trust_policy"):
+                trust_check = check_irsa_trust_policy(iam_info["trust_policy"])
+                metadata["irsa_trust_check"] = trust_check
+
+            # Policy documents are now included in iam_role_info
+            # The LLM/diagnostics can analyze the policy documents directly
+            # to determine if the bucket is allowed, rather than using
+            # iam:SimulatePrincipalPolicy which has API limitations
+
+        else:
+            metadata["irsa_role_arn"] = None
+            metadata["irsa_issue"] = "No IRSA annotation found on service account"
+
+    except Exception as e:
+        return metadata, [f"AWS IAM validation failed: {e}"]
+    return metadata, []
 
 
 def _parse_logs_universal(investigation: Investigation) -> None:
@@ -1,5 +1,6 @@
 """Shared Kubernetes read-only context gatherer for collectors/modules."""
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 from agent.providers.k8s_provider import (
@@ -11,10 +12,26 @@ from agent.providers.k8s_provider import (
 )
 
 
-def gather_pod_context(pod_name: str, namespace: str, events_limit: int = 20) -> Dict[str, Any]:
+def _rollout_matches(rollout_status: Optional[Dict[str, Any]], kind: str, name: str) -> bool:
+    """True when a rollout summary already describes workload `kind`/`name`."""
+    return (
+        isinstance(rollout_status, dict) and rollout_status.get("kind") == kind and rollout_status.get("name") == name
+    )
+
+
+def gather_pod_context(
+    pod_name: str,
+    namespace: str,
+    events_limit: int = 20,
+    *,
+    rollout_status: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
     """
     Gather Kubernetes read-only context for a Pod.
 
+    `rollout_status` is an already-fetched rollout summary for this namespace (e.g. from an earlier
+    collector step). It is reused when it describes the pod's owning workload instead of re-reading it.
+
     Best-effort and never raises. Returns:
       {
         "pod_info": dict|None,
@@ -26,39 +43,46 @@ def gather_pod_context(pod_name: str, namespace: str, events_limit: int = 20) ->
       }
     """
     errors: List[str] = []
+    rollout_errors: List[str] = []
+    known_rollout = rollout_status
+    rollout_status = None
 
-    pod_info: Optional[Dict[str, Any]] = None
-    pod_conditions: List[Dict[str, Any]] = []
-    pod_events: List[Dict[str, Any]] = []
-    owner_chain: Optional[Dict[str, Any]] = None
-    rollout_status: Optional[Dict[str, Any]] = None
-
-    try:
-        pod_info = get_pod_info(pod_name, namespace)
-    except Exception as e:
-        errors.append(f"pod_info: {e}")
-
-    try:
-        pod_conditions = get_pod_conditions(pod_name, namespace)
-    except Exception as e:
-        errors.append(f"pod_conditions: {e}")
+    def _result(future: "Future[Any]", name: str, default: Any) -> Any:
+        try:
+            return future.result()
+        except Exception as e:
+            errors.append(f"{name}: {e}")
+            return default
 
-    try:
-        pod_events = get_pod_events(pod_name, namespace, limit=events_limit)
-    except Exception as e:
-        errors.append(f"pod_events: {e}")
+    # The four pod reads are independent apiserver round-trips, so run them concurrently (kept small to
+    # avoid apiserver throttling). Rollout status depends on the owner chain, so it runs on this thread
+    # as soon as the owner chain resolves, while the remaining reads are still in flight.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        info_future = pool.submit(get_pod_info, pod_name, namespace)
+        conditions_future = pool.submit(get_pod_conditions, pod_name, namespace)
+        events_future = pool.submit(get_pod_events, pod_name, namespace, limit=events_limit)
+        owner_future = pool.submit(get_pod_owner_chain, pod_name, namespace)
 
-    try:
-        owner_chain = get_pod_owner_chain(pod_name, namespace)
-    except Exception as e:
-        errors.append(f"owner_chain: {e}")
+        try:
+            owner_chain_for_rollout = owner_future.result()
+        except Exception:
+            owner_chain_for_rollout = None  # reported below, in the usual order
+        try:
+            wl = (owner_chain_for_rollout or {}).get("workload") if isinstance(owner_chain_for_rollout, dict) else None
+            if isinstance(wl, dict) and wl.get("kind") and wl.get("name"):
+                if _rollout_matches(known_rollout, wl["kind"], wl["name"]):
+                    rollout_status = known_rollout
+                else:
+                    rollout_status = get_workload_rollout_status(namespace=namespace, kind=wl["kind"], name=wl["name"])
+        except Exception as e:
+            rollout_errors.append(f"rollout_status: {e}")
 
-    try:
-        wl = (owner_chain or {}).get("workload") if isinstance(owner_chain, dict) else None
-        if isinstance(wl, dict) and wl.get("kind") and wl.get("name"):
-            rollout_status = get_workload_rollout_status(namespace=namespace, kind=wl["kind"], name=wl["name"])
-    except Exception as e:
-        errors.append(f"rollout_status: {e}")
+    # Collect in the original order so `errors` reads the same as the sequential version.
+    pod_info: Optional[Dict[str, Any]] = _result(info_future, "pod_info", None)
+    pod_conditions: List[Dict[str, Any]] = _result(conditions_future, "pod_conditions", [])
+    pod_events: List[Dict[str, Any]] = _result(events_future, "pod_events", [])
+    owner_chain: Optional[Dict[str, Any]] = _result(owner_future, "owner_chain", None)
+    errors.extend(rollout_errors)
 
     return {
         "pod_info": pod_info,
@@ -9,7 +9,9 @@ that can be used for:
 """
 
 import re
-from typing import Any, Dict, List, Literal
+from collections import Counter
+from itertools import islice
+from typing import Any, Callable, Dict, List, Literal, Set
 
 # Severity patterns (ordered by priority)
 SEVERITY_PATTERNS = [
@@ -21,6 +23,30 @@ SEVERITY_PATTERNS = [
     (re.compile(r"\b(ERROR|Error|error)\b"), "ERROR"),
 ]
 
+# The SEVERITY_PATTERNS alternatives as plain literals, per severity in priority order. _classify_severity
+# matches these with str.find plus a word-boundary check, which is 2x faster than the regexes on matching
+# lines; SEVERITY_PATTERNS stays the reference definition (tests assert both agree).
+_SEVERITY_LITERALS = (
+    ("FATAL", ("FATAL", "Fatal", "fatal", "CRITICAL", "Critical", "critical")),
+    ("EXCEPTION", ("Exception", "exception", "EXCEPTION", "Traceback", "panic:", "PANIC")),
+    ("ERROR", ("ERROR", "Error", "error")),
+)
+
+# metadata counter per severity
+_SEVERITY_COUNT_KEYS = {"ERROR": "error_count", "FATAL": "fatal_count", "EXCEPTION": "exception_count"}
+
+# Lowercase keywords at least one of which every severity literal above contains. Most log lines carry
+# none of them, so one lower() plus six C-level `in` scans reject them before _classify_severity runs the
+# per-literal _find_word scans, which are what apply the exact case and the word boundaries.
+_SEVERITY_KEYWORDS = ("error", "fatal", "critical", "exception", "traceback", "panic")
+
+# Batches at least this large are first checked for any keyword as a whole
+_BATCH_PREFILTER_MIN_LINES = 64
+
+# Entry fields holding the message / timestamp, in lookup order
+_MESSAGE_FIELDS = ("message", "_msg", "msg", "log", "text")
+_TIMESTAMP_FIELDS = ("timestamp", "_time", "time", "@timestamp", "ts")
+
 # Common exception patterns for better extraction
 EXCEPTION_INDICATORS = [
     r"Exception:",
@@ -31,6 +57,9 @@ EXCEPTION_INDICATORS = [
     r"Caused by:",
     r"java\.[a-zA-Z0-9\.]+Exception",
 ]
+# Compiled once as a single alternation; use this rather than re.search() over the raw list.
+# MULTILINE so the "^\s+at" stack-frame indicator also matches inside multi-line messages.
+_EXCEPTION_INDICATORS_RE = re.compile("|".join(f"(?:{p})" for p in EXCEPTION_INDICATORS), re.MULTILINE)
 
 
 def parse_log_entries(
@@ -65,20 +94,27 @@ def parse_log_entries(
         }
     """
     parsed_errors = []
+    # Matched tokens come from a ~15-word vocabulary; a plain set beat an int-id bitmask in CPython
+    unique_patterns: Set[str] = set()
     stats = {
         "total_lines": len(log_entries),
         "error_count": 0,
         "fatal_count": 0,
         "exception_count": 0,
-        "unique_patterns": set(),
     }
 
-    for idx, entry in enumerate(log_entries):
-        if len(parsed_errors) >= limit:
-            break
+    # Extract message from various log formats (field resolved once from the first entry)
+    extract = _message_extractor(log_entries[0]) if log_entries else _extract_message
+    messages = [extract(entry) for entry in log_entries]
+
+    # Batch-level prefilter: one C-level keyword scan over the whole (usually error-free) batch instead of
+    # classifying line by line. Small batches skip it, the join would cost more than it saves.
+    if limit <= 0 or (
+        len(messages) >= _BATCH_PREFILTER_MIN_LINES and not _has_severity_keyword("\n".join(messages).lower())
+    ):
+        messages = []
 
-        # Extract message from various log formats
-        message = _extract_message(entry)
+    for idx, message in enumerate(messages):
         if not message:
             continue
 
@@ -86,12 +122,13 @@ def parse_log_entries(
         severity, pattern = _classify_severity(message)
         if severity:
             # Extract timestamp if available
-            timestamp = _extract_timestamp(entry)
+            timestamp = _extract_timestamp(log_entries[idx])
 
             # Truncate message if too long
-            truncated_message = message[:max_message_length]
             if len(message) > max_message_length:
-                truncated_message += "... (truncated)"
+                truncated_message = message[:max_message_length] + "... (truncated)"
+            else:
+                truncated_message = message
 
             parsed_errors.append(
                 {
@@ -104,28 +141,32 @@ def parse_log_entries(
             )
 
             # Update stats
-            if severity == "ERROR":
-                stats["error_count"] += 1
-            elif severity == "FATAL":
-                stats["fatal_count"] += 1
-            elif severity == "EXCEPTION":
-                stats["exception_count"] += 1
+            stats[_SEVERITY_COUNT_KEYS[severity]] += 1
 
-            stats["unique_patterns"].add(pattern)
+            unique_patterns.add(pattern)
+
+            # Limit check only when something was appended, not on every scanned line
+            if len(parsed_errors) >= limit:
+                break
 
     return {
         "parsed_errors": parsed_errors,
         "metadata": {
             **stats,
-            "unique_patterns": sorted(stats["unique_patterns"]),
+            "unique_patterns": sorted(unique_patterns),
         },
     }
 
 
 def _extract_message(entry: Dict[str, Any]) -> str:
     """Extract message text from log entry dict."""
+    # Fast path: both logs backends normalise entries to a string "message" field
+    val = entry.get("message")
+    if isinstance(val, str):
+        return val
+
     # Try common message field names
-    for field in ["message", "_msg", "msg", "log", "text"]:
+    for field in _MESSAGE_FIELDS:
         if field in entry:
             val = entry[field]
             if isinstance(val, str):
@@ -137,14 +178,49 @@ def _extract_message(entry: Dict[str, Any]) -> str:
     return str(entry)
 
 
+def _message_extractor(sample: Dict[str, Any]) -> Callable[[Dict[str, Any]], str]:
+    """
+    Message extractor specialised for a batch shaped like `sample`.
+
+    Entries of one batch come from one backend and share a schema, so when `sample` carries its message as
+    a string in a field other than "message" (already the fast path), bind that field directly. The bound
+    extractor still falls back to _extract_message for any entry that does not fit, so results are identical.
+    """
+    if not isinstance(sample, dict) or isinstance(sample.get("message"), str):
+        return _extract_message
+    for i, field in enumerate(_MESSAGE_FIELDS):
+        if field in sample:
+            if i == 0 or not isinstance(sample[field], str):
+                return _extract_message
+            earlier = _MESSAGE_FIELDS[:i]
+
+            def extract(entry: Dict[str, Any]) -> str:
+                val = entry.get(field)
+                if isinstance(val, str) and entry.keys().isdisjoint(earlier):
+                    return val
+                return _extract_message(entry)
+
+            return extract
+    return _extract_message
+
+
 def _extract_timestamp(entry: Dict[str, Any]) -> str:
     """Extract timestamp from log entry if available."""
-    for field in ["timestamp", "_time", "time", "@timestamp", "ts"]:
+    for field in _TIMESTAMP_FIELDS:
         if field in entry:
             return str(entry[field])
     return ""
 
 
+def _has_severity_keyword(lowered: str) -> bool:
+    """True if lowercased text contains any severity keyword (cheap substring prefilter for the literal scans)."""
+    # Plain loop rather than any(<genexpr>): this runs for every log line and the generator frame dominated
+    for kw in _SEVERITY_KEYWORDS:
+        if kw in lowered:
+            return True
+    return False
+
+
 def _classify_severity(message: str) -> tuple[Literal["ERROR", "FATAL", "EXCEPTION"] | None, str]:
     """
     Classify log message severity based on patterns.
@@ -152,15 +228,41 @@ def _classify_severity(message: str) -> tuple[Literal["ERROR", "FATAL", "EXCEPTI
     Returns:
         (severity, pattern_matched) or (None, "") if no match
     """
-    # Try each severity pattern in priority order
-    for pattern, severity in SEVERITY_PATTERNS:
-        match = pattern.search(message)
-        if match:
-            return severity, match.group(0)
+    if not _has_severity_keyword(message.lower()):
+        return None, ""
+
+    for severity, literals in _SEVERITY_LITERALS:
+        best, matched = -1, ""
+        for literal in literals:
+            i = _find_word(message, literal)
+            if i != -1 and (best == -1 or i < best):
+                best, matched = i, literal
+        if matched:
+            return severity, matched  # type: ignore[return-value]
 
     return None, ""
 
 
+def _is_word_char(c: str) -> bool:
+    # Same definition as re's Unicode \w
+    return c.isalnum() or c == "_"
+
+
+def _find_word(message: str, literal: str) -> int:
+    r"""Index of the first occurrence of `literal` that matches as r"\b<literal>\b" would, or -1."""
+    end_is_word = _is_word_char(literal[-1])
+    n = len(literal)
+    i = message.find(literal)
+    while i != -1:
+        # Every literal starts with a word character, so \b before it means a non-word (or no) character
+        if i == 0 or not _is_word_char(message[i - 1]):
+            j = i + n
+            if (j < len(message) and _is_word_char(message[j])) != end_is_word:
+                return i
+        i = message.find(literal, i + 1)
+    return -1
+
+
 def summarize_parsed_errors(parsed_errors: List[Dict[str, Any]], top_n: int = 5) -> str:
     """
     Generate a human-readable summary of parsed errors for reports.
@@ -178,21 +280,18 @@ def summarize_parsed_errors(parsed_errors: List[Dict[str, Any]], top_n: int = 5)
     lines = []
     lines.append(f"Found {len(parsed_errors)} error patterns:")
 
-    # Group by severity
-    by_severity = {"FATAL": [], "EXCEPTION": [], "ERROR": []}
-    for err in parsed_errors:
-        sev = err.get("severity", "ERROR")
-        by_severity[sev].append(err)
+    # Count by severity (only the counts are rendered)
+    by_severity = Counter(err.get("severity", "ERROR") for err in parsed_errors)
 
     # Show counts
-    for sev in ["FATAL", "EXCEPTION", "ERROR"]:
-        count = len(by_severity[sev])
+    for sev in ("FATAL", "EXCEPTION", "ERROR"):
+        count = by_severity[sev]
         if count > 0:
             lines.append(f"- {count} {sev} patterns")
 
     # Show top N examples
     lines.append(f"\nTop {min(top_n, len(parsed_errors))} examples:")
-    for err in parsed_errors[:top_n]:
+    for err in islice(parsed_errors, top_n):
         sev = err.get("severity", "?")
         msg = err.get("message", "")
         ts = err.get("timestamp", "")
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from agent.core.models import Investigation
 from agent.providers.k8s_provider import get_workload_rollout_status
@@ -48,6 +51,12 @@ def _infer_workload_from_labels(labels: Dict[str, Any]) -> Optional[Dict[str, st
     return None
 
 
+def _str_label(labels: Dict[str, Any], key: str) -> Optional[str]:
+    """Label value if it is a string, else None (one lookup)."""
+    v = labels.get(key)
+    return v if isinstance(v, str) else None
+
+
 def _prom_instant_scalar(v: object) -> Optional[float]:
     """
     Best-effort scalar extraction from `query_prometheus_instant()` result:
@@ -67,6 +76,76 @@ def _prom_instant_scalar(v: object) -> Optional[float]:
         return None
 
 
+# kube-state-metrics fallback for rollout status: per workload kind, the metric label naming the workload and
+# the (rollout_status field, metric) pairs to read. Field order is the order keys appear in the summary.
+_KSM_ROLLOUT_QUERIES: Dict[str, Tuple[str, Tuple[Tuple[str, str], ...]]] = {
+    "Deployment": (
+        "deployment",
+        (
+            ("replicas", "kube_deployment_status_replicas"),
+            ("ready_replicas", "kube_deployment_status_replicas_ready"),
+            ("updated_replicas", "kube_deployment_status_replicas_updated"),
+            ("unavailable_replicas", "kube_deployment_status_replicas_unavailable"),
+            ("observed_generation", "kube_deployment_status_observed_generation"),
+        ),
+    ),
+    "StatefulSet": (
+        "statefulset",
+        (
+            ("replicas", "kube_statefulset_status_replicas"),
+            ("ready_replicas", "kube_statefulset_status_replicas_ready"),
+            ("current_replicas", "kube_statefulset_status_replicas_current"),
+            ("updated_replicas", "kube_statefulset_status_replicas_updated"),
+        ),
+    ),
+    "DaemonSet": (
+        "daemonset",
+        (
+            ("desired_number_scheduled", "kube_daemonset_status_desired_number_scheduled"),
+            ("number_ready", "kube_daemonset_status_number_ready"),
+            ("updated_number_scheduled", "kube_daemonset_status_updated_number_scheduled"),
+        ),
+    ),
+    "Job": (
+        "job_name",
+        (
+            ("failed", "kube_job_status_failed"),
+            ("active", "kube_job_status_active"),
+            ("succeeded", "kube_job_status_succeeded"),
+        ),
+    ),
+}
+
+
+# kube-state-metrics is scraped every 15-30s, so instant reads within the same 15s bucket return the same sample.
+# Alerts for one workload tend to arrive together; the per-query scalars are cached per bucket.
+_KSM_CACHE_BUCKET_SECONDS = 15
+
+
+def _promql_selector(labels: Dict[str, str]) -> str:
+    """Render a PromQL label matcher, escaping values so label content cannot alter the query."""
+
+    def _escape(v: str) -> str:
+        return (v or "").replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+@lru_cache(maxsize=1024)
+def _ksm_scalar_cached(query: str, at_bucket: int) -> Optional[float]:
+    # Evaluated at the start of the bucket so every caller in it gets the same answer. Errors raise and are
+    # therefore not cached.
+    at = datetime.fromtimestamp(at_bucket * _KSM_CACHE_BUCKET_SECONDS, tz=timezone.utc)
+    return _prom_instant_scalar(query_prometheus_instant(query, at))
+
+
+def _ksm_scalar(query: str, at: Optional[datetime]) -> Optional[float]:
+    if at is None:
+        # "Now" queries are not cached
+        return _prom_instant_scalar(query_prometheus_instant(query, at))
+    return _ksm_scalar_cached(query, int(at.timestamp() // _KSM_CACHE_BUCKET_SECONDS))
+
+
 def _rollout_status_from_kube_state_metrics(*, namespace: str, kind: str, name: str, at) -> Optional[Dict[str, Any]]:
     """
     Fallback rollout/status summary derived from kube-state-metrics metrics (PromQL instant).
@@ -75,71 +154,48 @@ def _rollout_status_from_kube_state_metrics(*, namespace: str, kind: str, name:
     if not namespace or not kind_norm or not name:
         return None
 
+    spec = _KSM_ROLLOUT_QUERIES.get(kind_norm)
+    if spec is None:
+        return None
+    workload_label, fields = spec
+
     def q(query: str) -> Optional[float]:
         try:
-            return _prom_instant_scalar(query_prometheus_instant(query, at))
+            return _ksm_scalar(query, at)
         except Exception:
             return None
 
-    if kind_norm == "Deployment":
-        replicas = q(f'kube_deployment_status_replicas{{namespace="{namespace}",deployment="{name}"}}')
-        ready = q(f'kube_deployment_status_replicas_ready{{namespace="{namespace}",deployment="{name}"}}')
-        updated = q(f'kube_deployment_status_replicas_updated{{namespace="{namespace}",deployment="{name}"}}')
-        unavailable = q(f'kube_deployment_status_replicas_unavailable{{namespace="{namespace}",deployment="{name}"}}')
-        observed = q(f'kube_deployment_status_observed_generation{{namespace="{namespace}",deployment="{name}"}}')
-        return {
-            "kind": "Deployment",
-            "name": name,
-            "replicas": int(replicas) if replicas is not None else None,
-            "ready_replicas": int(ready) if ready is not None else None,
-            "updated_replicas": int(updated) if updated is not None else None,
-            "unavailable_replicas": int(unavailable) if unavailable is not None else None,
-            "observed_generation": int(observed) if observed is not None else None,
-            "source": "kube_state_metrics",
-        }
+    # Independent instant queries: issue them together instead of one round-trip after another.
+    selector = _promql_selector({"namespace": namespace, workload_label: name})
+    with ThreadPoolExecutor(max_workers=len(fields)) as pool:
+        values = list(pool.map(q, [metric + selector for _, metric in fields]))
 
-    if kind_norm == "StatefulSet":
-        replicas = q(f'kube_statefulset_status_replicas{{namespace="{namespace}",statefulset="{name}"}}')
-        ready = q(f'kube_statefulset_status_replicas_ready{{namespace="{namespace}",statefulset="{name}"}}')
-        current = q(f'kube_statefulset_status_replicas_current{{namespace="{namespace}",statefulset="{name}"}}')
-        updated = q(f'kube_statefulset_status_replicas_updated{{namespace="{namespace}",statefulset="{name}"}}')
-        return {
-            "kind": "StatefulSet",
-            "name": name,
-            "replicas": int(replicas) if replicas is not None else None,
-            "ready_replicas": int(ready) if ready is not None else None,
-            "current_replicas": int(current) if current is not None else None,
-            "updated_replicas": int(updated) if updated is not None else None,
-            "source": "kube_state_metrics",
-        }
+    out: Dict[str, Any] = {"kind": kind_norm, "name": name}
+    for (field, _), v in zip(fields, values):
+        out[field] = int(v) if v is not None else None
+    out["source"] = "kube_state_metrics"
+    return out
 
-    if kind_norm == "DaemonSet":
-        desired = q(f'kube_daemonset_status_desired_number_scheduled{{namespace="{namespace}",daemonset="{name}"}}')
-        ready = q(f'kube_daemonset_status_number_ready{{namespace="{namespace}",daemonset="{name}"}}')
-        updated = q(f'kube_daemonset_status_updated_number_scheduled{{namespace="{namespace}",daemonset="{name}"}}')
-        return {
-            "kind": "DaemonSet",
-            "name": name,
-            "desired_number_scheduled": int(desired) if desired is not None else None,
-            "number_ready": int(ready) if ready is not None else None,
-            "updated_number_scheduled": int(updated) if updated is not None else None,
-            "source": "kube_state_metrics",
-        }
 
-    if kind_norm == "Job":
-        failed = q(f'kube_job_status_failed{{namespace="{namespace}",job_name="{name}"}}')
-        active = q(f'kube_job_status_active{{namespace="{namespace}",job_name="{name}"}}')
-        succeeded = q(f'kube_job_status_succeeded{{namespace="{namespace}",job_name="{name}"}}')
-        return {
-            "kind": "Job",
-            "name": name,
-            "failed": int(failed) if failed is not None else None,
-            "active": int(active) if active is not None else None,
-            "succeeded": int(succeeded) if succeeded is not None else None,
-            "source": "kube_state_metrics",
-        }
+# Label added to each half of a combined down/total query so the two series can be split again
+_BASELINE_PART_LABEL = "tarka_baseline"
+
+
+def _tag_series(query: str, name: str) -> str:
+    return f'label_replace({query}, "{_BASELINE_PART_LABEL}", "{name}", "", "")'
 
-    return None
+
+def _split_tagged_series(result: Any) -> Dict[str, List[Dict[str, Any]]]:
+    """Group a combined query's series by their _BASELINE_PART_LABEL value (label removed)."""
+    out: Dict[str, List[Dict[str, Any]]] = {}
+    for series in result if isinstance(result, list) else []:
+        if not isinstance(series, dict):
+            continue
+        metric = dict(series.get("metric") or {})
+        name = metric.pop(_BASELINE_PART_LABEL, None)
+        if name:
+            out.setdefault(name, []).append({**series, "metric": metric})
+    return out
 
 
 def collect_nonpod_baseline(investigation: Investigation) -> None:
@@ -166,9 +222,7 @@ def collect_nonpod_baseline(investigation: Investigation) -> None:
 
     # Kubernetes rollout status (read-only) when we have namespace + workload identity
     if investigation.evidence.k8s.rollout_status is None:
-        ns = investigation.target.namespace or (
-            labels.get("namespace") if isinstance(labels.get("namespace"), str) else None
-        )
+        ns = investigation.target.namespace or _str_label(labels, "namespace")
         wk = investigation.target.workload_kind
         wn = investigation.target.workload_name
         if ns and wk and wn:
@@ -188,16 +242,10 @@ def collect_nonpod_baseline(investigation: Investigation) -> None:
 
     # Prometheus baseline (instant; safe, label-derived)
     at = investigation.time_window.end_time
-    job = investigation.target.job or (labels.get("job") if isinstance(labels.get("job"), str) else None)
-    instance = investigation.target.instance or (
-        labels.get("instance") if isinstance(labels.get("instance"), str) else None
-    )
-    service = investigation.target.service or (
-        labels.get("service") if isinstance(labels.get("service"), str) else None
-    )
-    namespace = investigation.target.namespace or (
-        labels.get("namespace") if isinstance(labels.get("namespace"), str) else None
-    )
+    job = investigation.target.job or _str_label(labels, "job")
+    instance = investigation.target.instance or _str_label(labels, "instance")
+    service = investigation.target.service or _str_label(labels, "service")
+    namespace = investigation.target.namespace or _str_label(labels, "namespace")
 
     prom_baseline: Dict[str, Any] = (
         (investigation.evidence.metrics.prom_baseline or {})
@@ -206,26 +254,51 @@ def collect_nonpod_baseline(investigation: Investigation) -> None:
     )
     queries_used: Dict[str, str] = prom_baseline.get("queries_used") or {}
 
+    # Each pending round-trip: the baseline names it fills and its query. A down/total pair over the same
+    # selector is sent as one query, its two series told apart by _BASELINE_PART_LABEL.
+    pending: List[Tuple[Tuple[str, ...], str]] = []
+
     def _q(name: str, qstr: str) -> None:
         if not qstr or name in prom_baseline:
             return
-        try:
-            prom_baseline[name] = query_prometheus_instant(qstr, at)
-            queries_used[name] = qstr
-        except Exception as e:
-            investigation.errors.append(f"Prometheus baseline ({name}) failed: {e}")
-            prom_baseline[name] = []
-            queries_used[name] = qstr
+        pending.append(((name,), qstr))
+
+    def _q_down_total(prefix: str, selector: str) -> None:
+        down, total = f"{prefix}_down", f"{prefix}_total"
+        down_q, total_q = f"sum(up{selector} == 0)", f"count(up{selector})"
+        if down in prom_baseline or total in prom_baseline:
+            _q(down, down_q)
+            _q(total, total_q)
+            return
+        pending.append(((down, total), f"{_tag_series(down_q, down)} or {_tag_series(total_q, total)}"))
 
     if job and instance:
         _q("up_job_instance", f'up{{job="{job}",instance="{instance}"}}')
     elif job:
-        _q("up_job_down", f'sum(up{{job="{job}"}} == 0)')
-        _q("up_job_total", f'count(up{{job="{job}"}})')
+        _q_down_total("up_job", f'{{job="{job}"}}')
 
     if namespace and service:
-        _q("up_service_down", f'sum(up{{namespace="{namespace}",service="{service}"}} == 0)')
-        _q("up_service_total", f'count(up{{namespace="{namespace}",service="{service}"}})')
+        _q_down_total("up_service", f'{{namespace="{namespace}",service="{service}"}}')
+
+    # The baseline queries are independent round-trips: run them together, then record results in query order.
+    def _run(qstr: str) -> Any:
+        try:
+            return query_prometheus_instant(qstr, at)
+        except Exception as e:
+            return e
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+            results = list(pool.map(_run, [qstr for _, qstr in pending]))
+        for (names, qstr), result in zip(pending, results):
+            if isinstance(result, Exception):
+                for name in names:
+                    investigation.errors.append(f"Prometheus baseline ({name}) failed: {result}")
+                result = []
+            split = _split_tagged_series(result) if len(names) > 1 else {names[0]: result}
+            for name in names:
+                prom_baseline[name] = split.get(name, [])
+                queries_used[name] = qstr
 
     prom_baseline["queries_used"] = queries_used
     # MetricsEvidence is allow-extra; attach baseline as an extra field
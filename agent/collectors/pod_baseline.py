@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
 
 from agent.collectors.k8s_context import gather_pod_context
 from agent.collectors.log_parser import parse_log_entries
@@ -34,8 +35,7 @@ def _require_pod_target(investigation: Investigation, where: str) -> Optional[tu
     return (pod, ns)
 
 
-def _apply_k8s_context(investigation: Investigation, pod: str, namespace: str, *, events_limit: int) -> None:
-    kctx = gather_pod_context(pod, namespace, events_limit=events_limit)
+def _apply_k8s_context(investigation: Investigation, kctx: Dict[str, Any]) -> None:
     investigation.evidence.k8s.pod_info = kctx.get("pod_info")
     investigation.evidence.k8s.pod_conditions = kctx.get("pod_conditions") or []
     investigation.evidence.k8s.pod_events = kctx.get("pod_events") or []
@@ -45,6 +45,17 @@ def _apply_k8s_context(investigation: Investigation, pod: str, namespace: str, *
         investigation.errors.append(f"K8s context: {err}")
 
 
+def _result(future: Optional["Future[Any]"], investigation: Investigation, error_prefix: str) -> Tuple[bool, Any]:
+    """(ok, value) for a submitted baseline read; a failure is appended to investigation.errors."""
+    if future is None:
+        return False, None
+    try:
+        return True, future.result()
+    except Exception as e:
+        investigation.errors.append(f"{error_prefix}: {e}")
+        return False, None
+
+
 def collect_pod_baseline(investigation: Investigation, *, events_limit: int = 20) -> None:
     """
     Shared pod-scoped baseline evidence collector (full baseline).
@@ -62,71 +73,94 @@ def collect_pod_baseline(investigation: Investigation, *, events_limit: int = 20
     start_time = investigation.time_window.start_time
     end_time = investigation.time_window.end_time
     container = _container_from_investigation(investigation)
-
-    # K8s context
-    if investigation.evidence.k8s.pod_info is None:
-        _apply_k8s_context(investigation, pod, namespace, events_limit=events_limit)
-
-    # Metrics baseline
-    if investigation.evidence.metrics.pod_phase_signal is None:
-        try:
-            investigation.evidence.metrics.pod_phase_signal = query_pod_not_healthy(
-                namespace, pod, start_time, end_time
+    k8s = investigation.evidence.k8s
+    metrics = investigation.evidence.metrics
+    logs = investigation.evidence.logs
+
+    # K8s context, the four metric reads and the log fetch are independent I/O round-trips: issue the ones
+    # still missing together, then apply results in the original order so evidence and errors read the same.
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        ctx_future = (
+            pool.submit(
+                gather_pod_context, pod, namespace, events_limit=events_limit, rollout_status=k8s.rollout_status
             )
-        except Exception as e:
-            investigation.errors.append(f"Failed to query pod phase signal: {e}")
-
-    if investigation.evidence.metrics.restart_data is None:
-        try:
-            investigation.evidence.metrics.restart_data = query_pod_restarts(
-                namespace, pod, start_time, end_time, container=container
-            )
-        except Exception as e:
-            investigation.errors.append(f"Failed to query restart signal: {e}")
-
-    if investigation.evidence.metrics.cpu_metrics is None:
-        try:
-            investigation.evidence.metrics.cpu_metrics = query_cpu_usage_and_limits(
-                pod, namespace, start_time, end_time, container=container
-            )
-        except Exception as e:
-            investigation.errors.append(f"Failed to query CPU metrics: {e}")
-
-    if investigation.evidence.metrics.memory_metrics is None:
-        try:
-            investigation.evidence.metrics.memory_metrics = query_memory_usage_and_limits(
+            if k8s.pod_info is None
+            else None
+        )
+        phase_future = (
+            pool.submit(query_pod_not_healthy, namespace, pod, start_time, end_time)
+            if metrics.pod_phase_signal is None
+            else None
+        )
+        restarts_future = (
+            pool.submit(query_pod_restarts, namespace, pod, start_time, end_time, container=container)
+            if metrics.restart_data is None
+            else None
+        )
+        cpu_future = (
+            pool.submit(query_cpu_usage_and_limits, pod, namespace, start_time, end_time, container=container)
+            if metrics.cpu_metrics is None
+            else None
+        )
+        memory_future = (
+            pool.submit(
+                query_memory_usage_and_limits,
                 pod_name=pod,
                 namespace=namespace,
                 start_time=start_time,
                 end_time=end_time,
                 container=container,
             )
-        except Exception as e:
-            investigation.errors.append(f"Failed to query memory metrics: {e}")
+            if metrics.memory_metrics is None
+            else None
+        )
+        # Logs baseline (avoid re-attempting if already attempted).
+        # For crashloop-ish families, 100 lines often captures only startup banners.
+        # We parse a larger window and then the report renderer selects an actionable snippet.
+        logs_future = (
+            pool.submit(fetch_recent_logs, pod, namespace, start_time, end_time, container=container, limit=400)
+            if logs.logs_status is None and not logs.logs
+            else None
+        )
+
+    # K8s context (gather_pod_context never raises)
+    if ctx_future is not None:
+        _apply_k8s_context(investigation, ctx_future.result())
 
-    # Logs baseline (avoid re-attempting if already attempted)
-    if investigation.evidence.logs.logs_status is None and not investigation.evidence.logs.logs:
-        try:
-            # For crashloop-ish families, 100 lines often captures only startup banners.
-            # We parse a larger window and then the report renderer selects an actionable snippet.
-            logs_result = fetch_recent_logs(pod, namespace, start_time, end_time, container=container, limit=400)
-            investigation.evidence.logs.logs = logs_result.get("entries", [])
-            investigation.evidence.logs.logs_status = logs_result.get("status")
-            investigation.evidence.logs.logs_reason = logs_result.get("reason")
-            investigation.evidence.logs.logs_backend = logs_result.get("backend")
-            investigation.evidence.logs.logs_query = logs_result.get("query_used")
-        except Exception as e:
-            investigation.errors.append(f"Failed to fetch logs: {e}")
-            investigation.evidence.logs.logs = []
-            investigation.evidence.logs.logs_status = "unavailable"
-            investigation.evidence.logs.logs_reason = "unexpected_error"
+    # Metrics baseline
+    ok, value = _result(phase_future, investigation, "Failed to query pod phase signal")
+    if ok:
+        metrics.pod_phase_signal = value
+    ok, value = _result(restarts_future, investigation, "Failed to query restart signal")
+    if ok:
+        metrics.restart_data = value
+    ok, value = _result(cpu_future, investigation, "Failed to query CPU metrics")
+    if ok:
+        metrics.cpu_metrics = value
+    ok, value = _result(memory_future, investigation, "Failed to query memory metrics")
+    if ok:
+        metrics.memory_metrics = value
+
+    # Logs baseline
+    if logs_future is not None:
+        ok, logs_result = _result(logs_future, investigation, "Failed to fetch logs")
+        if ok:
+            logs.logs = logs_result.get("entries", [])
+            logs.logs_status = logs_result.get("status")
+            logs.logs_reason = logs_result.get("reason")
+            logs.logs_backend = logs_result.get("backend")
+            logs.logs_query = logs_result.get("query_used")
+        else:
+            logs.logs = []
+            logs.logs_status = "unavailable"
+            logs.logs_reason = "unexpected_error"
 
     # Parse logs for ERROR/FATAL/Exception patterns (universal)
-    if investigation.evidence.logs.logs and not investigation.evidence.logs.parsed_errors:
+    if logs.logs and not logs.parsed_errors:
         try:
-            parse_result = parse_log_entries(investigation.evidence.logs.logs, limit=50)
-            investigation.evidence.logs.parsed_errors = parse_result["parsed_errors"]
-            investigation.evidence.logs.parsing_metadata = parse_result["metadata"]
+            parse_result = parse_log_entries(logs.logs, limit=50)
+            logs.parsed_errors = parse_result["parsed_errors"]
+            logs.parsing_metadata = parse_result["metadata"]
         except Exception as e:
             investigation.errors.append(f"Log parsing failed: {e}")
 
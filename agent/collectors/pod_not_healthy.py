@@ -2,10 +2,84 @@
 
 from __future__ import annotations
 
+import copy
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
 from agent.collectors.pod_baseline import _require_pod_target, collect_pod_baseline
 from agent.core.models import Investigation
 from agent.providers.k8s_provider import get_service_account_info
 
+# Image-pull alerts tend to arrive in bursts for the same workload; the service account and ECR lookups
+# behind the diagnostics are cached for this long (same TTL-bucket scheme as github_context._repo_exists).
+_DIAGNOSTICS_CACHE_TTL_SECONDS = 300
+
+# ECR outcomes that describe the image itself; skips and errors (no creds, throttling, ...) are retried.
+_ECR_CACHEABLE_STATUSES = frozenset({"exists", "missing"})
+
+
+# Waiting reasons that trigger image pull diagnostics
+_PULL_REASONS = frozenset({"ImagePullBackOff", "ErrImagePull"})
+
+
+def _image_pull_waiting(cs: Any) -> Optional[Tuple[Any, Dict[str, Any]]]:
+    """(container name, waiting state) if this container status is waiting on an image pull, else None."""
+    if not isinstance(cs, dict):
+        return None
+    state = cs.get("state")
+    waiting = state.get("waiting") if isinstance(state, dict) else None
+    if isinstance(waiting, dict) and str(waiting.get("reason") or "") in _PULL_REASONS:
+        return cs.get("name"), waiting
+    return None
+
+
+def _ttl_bucket() -> int:
+    return int(time.monotonic() // _DIAGNOSTICS_CACHE_TTL_SECONDS)
+
+
+@lru_cache(maxsize=256)
+def _service_account_info_cached(namespace: str, name: str, ttl_bucket: int) -> Dict[str, Any]:
+    # Failures raise and are therefore not cached.
+    return get_service_account_info(namespace, name)
+
+
+def _service_account_info(namespace: str, name: str) -> Dict[str, Any]:
+    # Deep copy: callers get the nested annotations / image_pull_secrets too, and must not mutate the cached entry.
+    return copy.deepcopy(_service_account_info_cached(namespace, name, _ttl_bucket()))
+
+
+class _UncachedEcrResult(Exception):
+    """Carries a non-definitive ECR result out of the cached function so lru_cache does not keep it."""
+
+    def __init__(self, result: Dict[str, Any]) -> None:
+        super().__init__(result.get("status"))
+        self.result = result
+
+
+@lru_cache(maxsize=256)
+def _ecr_describe_image_cached(
+    region: str,
+    repository: str,
+    tag: Optional[str],
+    digest: Optional[str],
+    registry_id: Optional[str],
+    ttl_bucket: int,
+) -> Dict[str, Any]:
+    from agent.image_pull import ecr_describe_image
+
+    result = ecr_describe_image(region=region, repository=repository, tag=tag, digest=digest, registry_id=registry_id)
+    if result.get("status") not in _ECR_CACHEABLE_STATUSES:
+        raise _UncachedEcrResult(result)
+    return result
+
+
+def _ecr_describe_image(**kwargs: Any) -> Dict[str, Any]:
+    try:
+        return dict(_ecr_describe_image_cached(ttl_bucket=_ttl_bucket(), **kwargs))
+    except _UncachedEcrResult as e:
+        return e.result
+
 
 def collect_pod_not_healthy(investigation: Investigation) -> None:
     investigation.target.playbook = "pod_not_healthy"
@@ -16,37 +90,28 @@ def collect_pod_not_healthy(investigation: Investigation) -> None:
 
     # Optional: attach image pull diagnostics for ImagePullBackOff/ErrImagePull (deterministic).
     try:
-        from agent.image_pull import (
-            classify_pull_error,
-            ecr_describe_image,
-            extract_image_from_message,
-            parse_image_ref,
-        )
-
-        pod_info = investigation.evidence.k8s.pod_info if isinstance(investigation.evidence.k8s.pod_info, dict) else {}
-        container_statuses = pod_info.get("container_statuses") if isinstance(pod_info, dict) else None
+        from agent.image_pull import classify_pull_error, extract_image_from_message, parse_image_ref
+
+        # Type-checked once; everything below is plain .get() on a dict
+        pod_info = investigation.evidence.k8s.pod_info
+        if not isinstance(pod_info, dict):
+            pod_info = {}
+        container_statuses = pod_info.get("container_statuses")
         waiting_msg = None
         waiting_reason = None
         waiting_container = None
         if isinstance(container_statuses, list):
-            for cs in container_statuses:
-                if not isinstance(cs, dict):
-                    continue
-                state = cs.get("state") if isinstance(cs.get("state"), dict) else {}
-                waiting = state.get("waiting") if isinstance(state.get("waiting"), dict) else None
-                if not isinstance(waiting, dict):
-                    continue
-                r = str(waiting.get("reason") or "")
-                if r in ("ImagePullBackOff", "ErrImagePull"):
-                    waiting_reason = r
-                    waiting_container = cs.get("name")
-                    waiting_msg = str(waiting.get("message") or "")
-                    break
+            # First container stuck pulling its image; stops at the first hit
+            hit = next(filter(None, map(_image_pull_waiting, container_statuses)), None)
+            if hit is not None:
+                waiting_container, waiting = hit
+                waiting_reason = str(waiting.get("reason"))
+                waiting_msg = str(waiting.get("message") or "")
 
         if waiting_reason:
             # Best-effort image ref: prefer waiting message; fallback to pod spec container image.
             image = extract_image_from_message(waiting_msg or "")
-            if not image and isinstance(pod_info, dict):
+            if not image:
                 for c in pod_info.get("containers") or []:
                     if not isinstance(c, dict):
                         continue
@@ -61,17 +126,17 @@ def collect_pod_not_healthy(investigation: Investigation) -> None:
             bucket, bucket_ev = classify_pull_error(waiting_msg or "")
 
             ns = investigation.target.namespace or ""
-            sa_name = (pod_info.get("service_account_name") if isinstance(pod_info, dict) else None) or None
+            sa_name = pod_info.get("service_account_name") or None
             sa_info = None
             if sa_name and ns:
                 try:
-                    sa_info = get_service_account_info(ns, str(sa_name))
+                    sa_info = _service_account_info(ns, str(sa_name))
                 except Exception:
                     sa_info = None
 
             ecr_check = None
             if img_ref.is_ecr and img_ref.ecr_region and img_ref.repository:
-                ecr_check = ecr_describe_image(
+                ecr_check = _ecr_describe_image(
                     region=img_ref.ecr_region,
                     repository=img_ref.repository,
                     tag=img_ref.tag,
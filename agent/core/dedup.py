@@ -1,21 +1,27 @@
 from __future__ import annotations
 
-import hashlib
-import json
 from datetime import datetime, timezone
+from functools import lru_cache
+from hashlib import sha256 as _sha256
+from json.encoder import encode_basestring_ascii as _js
 from typing import Any, Dict, Optional, Tuple
 
 from agent.core.targets import extract_target_container
 from agent.pipeline.families import detect_family
 
 # Families where pod labels are commonly scrape metadata (avoid treating pod as incident identity).
-_POD_IDENTITY_EXCLUDED_FAMILIES: set[str] = {
-    "target_down",
-    "k8s_rollout_health",
-    "observability_pipeline",
-    "meta",
-    "job_failed",  # KubeJobFailed alerts have incorrect pod label (kube-state-metrics scraper)
-}
+_POD_IDENTITY_EXCLUDED_FAMILIES: frozenset[str] = frozenset(
+    {
+        "target_down",
+        "k8s_rollout_health",
+        "observability_pipeline",
+        "meta",
+        "job_failed",  # KubeJobFailed alerts have incorrect pod label (kube-state-metrics scraper)
+    }
+)
+
+
+_UTC = timezone.utc
 
 
 def utcnow() -> datetime:
@@ -37,7 +43,18 @@ def detect_family_for_labels(labels: Dict[str, Any]) -> str:
     if not isinstance(labels, dict):
         return "generic"
     try:
-        return detect_family(labels, playbook=None)
+        alertname = str(labels.get("alertname") or "")
+    except Exception:
+        return "generic"
+    return _detect_family_for_alertname(alertname)
+
+
+@lru_cache(maxsize=4096)
+def _detect_family_for_alertname(alertname: str) -> str:
+    # With playbook=None, alertname is the only label detect_family reads, and the family rules are static,
+    # so webhook bursts for the same alert resolve their family once.
+    try:
+        return detect_family({"alertname": alertname}, playbook=None)
     except Exception:
         return "generic"
 
@@ -50,10 +67,14 @@ def compute_utc_bucket_start(*, now: datetime, hours: int = 4) -> datetime:
     """
     if hours <= 0:
         raise ValueError("hours must be > 0")
-    if now.tzinfo is None:
+    if now.tzinfo is _UTC:
+        # Common case (callers pass utcnow()): no conversion needed
+        now_utc = now
+    elif now.tzinfo is None:
         # Treat naive values as UTC to keep behavior deterministic.
-        now = now.replace(tzinfo=timezone.utc)
-    now_utc = now.astimezone(timezone.utc)
+        now_utc = now.replace(tzinfo=_UTC)
+    else:
+        now_utc = now.astimezone(_UTC)
     bucket_hour = (now_utc.hour // hours) * hours
     return now_utc.replace(hour=bucket_hour, minute=0, second=0, microsecond=0)
 
@@ -62,12 +83,28 @@ def format_bucket_label(bucket_start_utc: datetime) -> str:
     """
     Format bucket start as YYYYMMDDHH (UTC).
     """
-    if bucket_start_utc.tzinfo is None:
-        bucket_start_utc = bucket_start_utc.replace(tzinfo=timezone.utc)
-    t = bucket_start_utc.astimezone(timezone.utc)
+    if bucket_start_utc.tzinfo is _UTC or bucket_start_utc.tzinfo is None:
+        # Naive values are treated as UTC
+        t = bucket_start_utc
+    else:
+        t = bucket_start_utc.astimezone(_UTC)
     return t.strftime("%Y%m%d%H")
 
 
+def _epoch_hour(now: datetime) -> int:
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=_UTC)
+    return int(now.timestamp() // 3600)
+
+
+@lru_cache(maxsize=64)
+def _bucket_label(epoch_hour: int, hours: int) -> str:
+    # Every alert within the same UTC hour shares a bucket label, so the datetime work runs once per hour.
+    # Errors (hours <= 0) raise and are not cached.
+    hour_start = datetime.fromtimestamp(epoch_hour * 3600, _UTC)
+    return format_bucket_label(compute_utc_bucket_start(now=hour_start, hours=hours))
+
+
 def compute_utc_hour_bucket_label(*, now: datetime) -> str:
     """
     UTC hour bucket label (YYYYMMDDHH).
@@ -86,7 +123,23 @@ def compute_queue_msg_id_for_workload_hour(
     wk = (workload_key or "").strip() or "unknown"
     hb = (hour_bucket or "").strip() or "unknown"
     raw = f"{wk}:{hb}".encode("utf-8")
-    return hashlib.sha256(raw).hexdigest()
+    return _sha256(raw).hexdigest()
+
+
+# Label keys tried in order; the first truthy value wins
+_POD_KEYS = ("pod", "pod_name", "podName", "kubernetes_pod_name")
+_NAMESPACE_KEYS = ("namespace", "Namespace", "kubernetes_namespace_name", "k8s_namespace", "kube_namespace")
+_SERVICE_KEYS = ("service", "kubernetes_service_name")
+# Labels at least one of which a non-fingerprint dedup identity needs
+_IDENTITY_LABEL_KEYS = frozenset(_POD_KEYS + _SERVICE_KEYS + ("job_name",))
+
+
+def _first_label(labels: Dict[str, Any], keys: Tuple[str, ...]) -> str:
+    for k in keys:
+        v = labels.get(k)
+        if v:
+            return v.strip() if isinstance(v, str) else _safe_str(v)
+    return ""
 
 
 def _extract_pod_namespace(labels: Dict[str, Any]) -> Tuple[str, str]:
@@ -94,26 +147,11 @@ def _extract_pod_namespace(labels: Dict[str, Any]) -> Tuple[str, str]:
     Conservative extraction: only use explicit pod/namespace labels; never infer.
     Mirrors `agent.providers.alertmanager_provider.extract_pod_info_from_alert` behavior.
     """
-    pod = (
-        labels.get("pod")
-        or labels.get("pod_name")
-        or labels.get("podName")
-        or labels.get("kubernetes_pod_name")
-        or None
-    )
-    namespace = (
-        labels.get("namespace")
-        or labels.get("Namespace")
-        or labels.get("kubernetes_namespace_name")
-        or labels.get("k8s_namespace")
-        or labels.get("kube_namespace")
-        or None
-    )
-    return _safe_str(pod), _safe_str(namespace)
+    return _first_label(labels, _POD_KEYS), _first_label(labels, _NAMESPACE_KEYS)
 
 
 def _extract_service(labels: Dict[str, Any]) -> str:
-    return _safe_str(labels.get("service") or labels.get("kubernetes_service_name"))
+    return _first_label(labels, _SERVICE_KEYS)
 
 
 def compute_dedup_key(
@@ -144,41 +182,37 @@ def compute_dedup_key(
 
     family = detect_family_for_labels(labs)
 
-    cluster = _safe_str(labs.get("cluster")) or _safe_str(env_cluster) or "unknown"
-
-    bucket_start = compute_utc_bucket_start(now=now, hours=bucket_hours)
-    bucket = format_bucket_label(bucket_start)
-
-    pod, namespace = _extract_pod_namespace(labs)
-    service = _extract_service(labs)
+    bucket = _bucket_label(_epoch_hour(now), bucket_hours)
 
+    # The key hashes canonical JSON (sorted keys, compact separators, ASCII escapes) built by hand: identical
+    # to json.dumps(..., sort_keys=True, separators=(",", ":")) output, so existing keys stay stable.
     kind = "fingerprint"
-    identity: Dict[str, str] = {"fingerprint": fp or "unknown"}
-
-    # Special case: job_failed family uses job_name for identity (KubeJobFailed alerts)
-    # Only use this path if job_name and namespace are available.
-    job_name = _safe_str(labs.get("job_name")) if family == "job_failed" else ""
-    if job_name and namespace and family == "job_failed":
-        kind = "job"
-        identity = {"cluster": cluster, "namespace": namespace, "job_name": job_name}
-    elif pod and namespace and family not in _POD_IDENTITY_EXCLUDED_FAMILIES:
-        kind = "pod"
-        identity = {"cluster": cluster, "namespace": namespace, "pod": pod}
-    elif service:
-        kind = "service"
-        identity = {"cluster": cluster, "service": service}
-
-    payload = {
-        "v": 1,
-        "bucket_hours": int(bucket_hours),
-        "bucket": bucket,
-        "alertname": a,
-        "family": family,
-        "kind": kind,
-        "identity": identity,
-    }
-    raw = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
-    return hashlib.sha256(raw).hexdigest()
+    identity = f'{{"fingerprint":{_js(fp or "unknown")}}}'
+
+    # Alerts without any pod/service/job label (blackbox, external exporters) always use fingerprint identity
+    if not labs.keys().isdisjoint(_IDENTITY_LABEL_KEYS):
+        cluster = _safe_str(labs.get("cluster")) or _safe_str(env_cluster) or "unknown"
+        pod, namespace = _extract_pod_namespace(labs)
+        service = _extract_service(labs)
+
+        # Special case: job_failed family uses job_name for identity (KubeJobFailed alerts)
+        # Only use this path if job_name and namespace are available.
+        job_name = _safe_str(labs.get("job_name")) if family == "job_failed" else ""
+        if job_name and namespace and family == "job_failed":
+            kind = "job"
+            identity = f'{{"cluster":{_js(cluster)},"job_name":{_js(job_name)},"namespace":{_js(namespace)}}}'
+        elif pod and namespace and family not in _POD_IDENTITY_EXCLUDED_FAMILIES:
+            kind = "pod"
+            identity = f'{{"cluster":{_js(cluster)},"namespace":{_js(namespace)},"pod":{_js(pod)}}}'
+        elif service:
+            kind = "service"
+            identity = f'{{"cluster":{_js(cluster)},"service":{_js(service)}}}'
+
+    raw = (
+        f'{{"alertname":{_js(a)},"bucket":{_js(bucket)},"bucket_hours":{int(bucket_hours)},'
+        f'"family":{_js(family)},"identity":{identity},"kind":{_js(kind)},"v":1}}'
+    ).encode("utf-8")
+    return _sha256(raw).hexdigest()
 
 
 def compute_rollout_workload_key(
@@ -217,16 +251,11 @@ def compute_rollout_workload_key(
         container = extract_target_container(labs)
         container = (container or "").strip() or None
 
-    payload = {
-        "v": 1,
-        "scope": "workload",
-        "alertname": (alertname or "").strip() or "Unknown",
-        "family": family,
-        "cluster": cluster,
-        "namespace": namespace,
-        "workload_kind": wk,
-        "workload_name": wn,
-        "container": container,
-    }
-    raw = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
-    return hashlib.sha256(raw).hexdigest()
+    # Canonical JSON built by hand, in sorted key order (same bytes as json.dumps with sort_keys=True)
+    raw = (
+        f'{{"alertname":{_js((alertname or "").strip() or "Unknown")},"cluster":{_js(cluster)},'
+        f'"container":{_js(container) if container is not None else "null"},"family":{_js(family)},'
+        f'"namespace":{_js(namespace)},"scope":"workload","v":1,'
+        f'"workload_kind":{_js(wk)},"workload_name":{_js(wn)}}}'
+    ).encode("utf-8")
+    return _sha256(raw).hexdigest()
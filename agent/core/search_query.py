@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import re
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import DefaultDict, Dict, List, Optional
 
 
 @dataclass(frozen=True)
@@ -38,37 +40,35 @@ _KEY_ALIASES: Dict[str, str] = {
 
 
 def _normalize_key(k: str) -> Optional[str]:
+    # Fast path: keys are usually typed as a lowercase alias already
+    norm = _KEY_ALIASES.get(k)
+    if norm is not None:
+        return norm
     kk = (k or "").strip().lower()
     if not kk:
         return None
     return _KEY_ALIASES.get(kk)
 
 
-def _consume_quoted(s: str, i: int) -> Tuple[Optional[str], int]:
-    """
-    Consume a quoted value starting at index i (s[i] is quote char).
-    Returns (value, next_index).
-    """
-    if i >= len(s):
-        return None, i
-    q = s[i]
-    if q not in ("'", '"'):
-        return None, i
-    i += 1
-    out: List[str] = []
-    while i < len(s):
-        ch = s[i]
-        if ch == q:
-            return "".join(out), i + 1
-        # minimal escape handling for \" and \'
-        if ch == "\\" and i + 1 < len(s) and s[i + 1] in ("\\", q):
-            out.append(s[i + 1])
-            i += 2
-            continue
-        out.append(ch)
-        i += 1
-    # Unterminated quote: treat as no-quote and let caller fall back.
-    return None, i
+# Quoted bodies honour only \\ and \<quote> escapes. Possessive repeats so an escaped closing quote is never
+# re-read as the terminator (an unterminated quote must not match).
+_QUOTED = r"""(?:"(?P<dq>(?:\\[\\"]|[^"])*+)"|'(?P<sq>(?:\\[\\']|[^'])*+)')"""
+_QUOTED_RE = re.compile(_QUOTED)
+_DQ_ESCAPE_RE = re.compile(r'\\([\\"])')
+_SQ_ESCAPE_RE = re.compile(r"\\([\\'])")
+
+# One scanner step: skip whitespace, read a word up to whitespace or ':'. For `key:` also capture the raw value up
+# to whitespace (lookahead, not consumed) and, if it is one, the quoted value.
+_STEP_RE = re.compile(rf"\s*(?P<word>[^\s:]*)(?:(?P<colon>:)(?=(?P<raw>\S*)){_QUOTED}?)?")
+
+
+def _unquote(dq: Optional[str], sq: Optional[str]) -> Optional[str]:
+    """Unescaped body of a matched double- or single-quoted value, or None if neither matched."""
+    if dq is not None:
+        return _DQ_ESCAPE_RE.sub(r"\1", dq) if "\\" in dq else dq
+    if sq is not None:
+        return _SQ_ESCAPE_RE.sub(r"\1", sq) if "\\" in sq else sq
+    return None
 
 
 def parse_search_query(q: str) -> ParsedSearchQuery:
@@ -85,17 +85,14 @@ def parse_search_query(q: str) -> ParsedSearchQuery:
     - Unknown keys are treated as plain tokens (the whole `k:v` is tokenized).
     """
     s = (q or "").strip()
-    filters: Dict[str, List[str]] = {}
+    filters: DefaultDict[str, List[str]] = defaultdict(list)
     tokens: List[str] = []
 
-    i = 0
-    n = len(s)
-
     def _push_filter(key: str, val: str) -> None:
         v = (val or "").strip()
         if not v:
             return
-        filters.setdefault(key, []).append(v)
+        filters[key].append(v)
 
     def _push_token(tok: str) -> None:
         t = (tok or "").strip()
@@ -103,60 +100,44 @@ def parse_search_query(q: str) -> ParsedSearchQuery:
             return
         tokens.append(t)
 
-    while i < n:
-        # skip whitespace
-        while i < n and s[i].isspace():
-            i += 1
-        if i >= n:
-            break
-
-        # Read a "word" up to whitespace, but allow key:value with quoted value.
-        # First read potential key
-        start = i
-        while i < n and not s[i].isspace() and s[i] != ":":
-            i += 1
-
-        # If this isn't key:value, treat as token word (maybe quoted)
-        if i >= n or s[i] != ":":
-            # handle quoted token
-            if s[start] in ("'", '"'):
-                v, j = _consume_quoted(s, start)
-                if v is not None:
-                    _push_token(v)
-                    i = j
+    pos = 0
+    n = len(s)
+    while pos < n:
+        m = _STEP_RE.match(s, pos)
+        assert m is not None  # every part of the step pattern is optional
+        word, colon, raw_val, dq, sq = m.groups()
+
+        # Not key:value => token word (maybe quoted)
+        if colon is None:
+            if word[:1] in ("'", '"'):
+                qm = _QUOTED_RE.match(s, m.start(1))
+                if qm is not None:
+                    _push_token(_unquote(*qm.groups()) or "")
+                    pos = qm.end()
                     continue
-            # consume until whitespace
-            while i < n and not s[i].isspace():
-                i += 1
-            _push_token(s[start:i])
+            _push_token(word)
+            pos = m.end()
             continue
 
         # We have something like key:
-        raw_key = s[start:i]
-        norm_key = _normalize_key(raw_key)
-        i += 1  # skip ':'
-        if i >= n:
+        value_start = m.end(2)
+        if value_start >= n:
             # trailing "k:" -> ignore
             break
+        norm_key = _normalize_key(word)
 
-        # Parse value (quoted or until whitespace)
-        if s[i] in ("'", '"'):
-            v, j = _consume_quoted(s, i)
-            if v is not None and norm_key:
-                _push_filter(norm_key, v)
-                i = j
-                continue
-            # quote couldn't be consumed; fall back to raw tokenization
-
-        v_start = i
-        while i < n and not s[i].isspace():
-            i += 1
-        raw_val = s[v_start:i]
+        quoted = _unquote(dq, sq)
+        if quoted is not None and norm_key:
+            _push_filter(norm_key, quoted)
+            pos = m.end()
+            continue
 
+        # Not quoted, unterminated quote, or unknown key: the raw value runs up to whitespace
+        pos = value_start + len(raw_val)
         if norm_key:
             _push_filter(norm_key, raw_val)
         else:
             # unknown key => treat whole thing as a token
-            _push_token(f"{raw_key}:{raw_val}")
+            _push_token(f"{word}:{raw_val}")
 
-    return ParsedSearchQuery(filters=filters, tokens=tokens)
+    return ParsedSearchQuery(filters=dict(filters), tokens=tokens)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Tuple
 
 
@@ -14,7 +15,13 @@ def parse_time_window(time_window: str) -> Tuple[datetime, datetime]:
         (start_time, end_time) where end_time is now (UTC, timezone-aware).
     """
     end_time = datetime.now(timezone.utc)
+    return end_time - _parse_window_delta(time_window), end_time
 
+
+@lru_cache(maxsize=128)
+def _parse_window_delta(time_window: str) -> timedelta:
+    # Only the duration is cached; the window itself is relative to "now" on every call.
+    # Callers use a handful of window strings, and invalid ones raise (and are not cached).
     hours = 0
     minutes = 0
 
@@ -28,5 +35,4 @@ def parse_time_window(time_window: str) -> Tuple[datetime, datetime]:
     else:
         raise ValueError(f"Invalid time window format: {time_window}")
 
-    start_time = end_time - timedelta(hours=hours, minutes=minutes)
-    return start_time, end_time
+    return timedelta(hours=hours, minutes=minutes)
@@ -73,6 +73,42 @@ def _alert_label_views(investigation: Investigation) -> Tuple[Dict[str, Any], Di
     return _clean(core), _clean(source)
 
 
+def analysis_to_json_dict(investigation: Investigation) -> Dict[str, Any]:
+    """
+    Return only the `analysis` slice of the analysis-mode dump.
+
+    Callers that just need the refreshed analysis (e.g. chat reruns) use this to skip serializing
+    alert/target/evidence views they would throw away.
+    """
+    return {
+        "features": (
+            investigation.analysis.features.model_dump(mode="json") if investigation.analysis.features else None
+        ),
+        "scores": investigation.analysis.scores.model_dump(mode="json") if investigation.analysis.scores else None,
+        "verdict": investigation.analysis.verdict.model_dump(mode="json") if investigation.analysis.verdict else None,
+        "change": investigation.analysis.change.model_dump(mode="json") if investigation.analysis.change else None,
+        "noise": investigation.analysis.noise.model_dump(mode="json") if investigation.analysis.noise else None,
+        "decision": (
+            investigation.analysis.decision.model_dump(mode="json") if investigation.analysis.decision else None
+        ),
+        "enrichment": (
+            investigation.analysis.enrichment.model_dump(mode="json") if investigation.analysis.enrichment else None
+        ),
+        "hypotheses": [h.model_dump(mode="json") for h in (investigation.analysis.hypotheses or [])],
+        # Avoid noisy defaults for capacity (only show recommendations/rightsizing when present).
+        "capacity": (
+            investigation.analysis.capacity.model_dump(mode="json", exclude_none=True, exclude_defaults=True)
+            if investigation.analysis.capacity
+            else None
+        ),
+        "rca": (
+            investigation.analysis.rca.model_dump(mode="json") if getattr(investigation.analysis, "rca", None) else None
+        ),
+        "llm": investigation.analysis.llm.model_dump(mode="json") if investigation.analysis.llm else None,
+        "debug": investigation.analysis.debug.model_dump(mode="json") if investigation.analysis.debug else None,
+    }
+
+
 def investigation_to_json_dict(investigation: Investigation, *, mode: DumpMode = "analysis") -> Dict[str, Any]:
     if mode == "investigation":
         # Pydantic v2: mode="json" produces JSON-serializable types.
@@ -133,36 +169,6 @@ def investigation_to_json_dict(investigation: Investigation, *, mode: DumpMode =
                 else None
             ),
         },
-        "analysis": {
-            "features": (
-                investigation.analysis.features.model_dump(mode="json") if investigation.analysis.features else None
-            ),
-            "scores": investigation.analysis.scores.model_dump(mode="json") if investigation.analysis.scores else None,
-            "verdict": (
-                investigation.analysis.verdict.model_dump(mode="json") if investigation.analysis.verdict else None
-            ),
-            "change": investigation.analysis.change.model_dump(mode="json") if investigation.analysis.change else None,
-            "noise": investigation.analysis.noise.model_dump(mode="json") if investigation.analysis.noise else None,
-            "decision": (
-                investigation.analysis.decision.model_dump(mode="json") if investigation.analysis.decision else None
-            ),
-            "enrichment": (
-                investigation.analysis.enrichment.model_dump(mode="json") if investigation.analysis.enrichment else None
-            ),
-            "hypotheses": [h.model_dump(mode="json") for h in (investigation.analysis.hypotheses or [])],
-            # Avoid noisy defaults for capacity (only show recommendations/rightsizing when present).
-            "capacity": (
-                investigation.analysis.capacity.model_dump(mode="json", exclude_none=True, exclude_defaults=True)
-                if investigation.analysis.capacity
-                else None
-            ),
-            "rca": (
-                investigation.analysis.rca.model_dump(mode="json")
-                if getattr(investigation.analysis, "rca", None)
-                else None
-            ),
-            "llm": investigation.analysis.llm.model_dump(mode="json") if investigation.analysis.llm else None,
-            "debug": investigation.analysis.debug.model_dump(mode="json") if investigation.analysis.debug else None,
-        },
+        "analysis": analysis_to_json_dict(investigation),
         "errors": list(investigation.errors or []),
     }
@@ -3,6 +3,7 @@
 import threading
 import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Protocol, runtime_checkable
 
 _boto3_clients: Dict[str, Any] = {}
@@ -119,8 +120,14 @@ class DefaultAwsProvider:
         return lookup_cloudtrail_events(region, start_time, end_time, resource_ids, max_results)
 
 
+@lru_cache(maxsize=1)
 def get_aws_provider() -> AwsProvider:
-    """Factory function for AWS provider (allows future swapping)."""
+    """
+    Factory function for AWS provider (allows future swapping).
+
+    The default provider is stateless (boto3 clients are cached per service+region in
+    `_get_boto3_client`), so a single shared instance serves every region.
+    """
     return DefaultAwsProvider()
 
 
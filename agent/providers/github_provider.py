@@ -7,6 +7,7 @@ Supports GitHub App authentication with installation tokens.
 from __future__ import annotations
 
 import os
+import threading
 import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Protocol
@@ -212,9 +213,10 @@ class DefaultGitHubProvider:
         self.private_key = os.getenv("GITHUB_APP_PRIVATE_KEY", "").replace("\\n", "\n")
         self.installation_id = os.getenv("GITHUB_APP_INSTALLATION_ID", "") or os.getenv("GITHUB_INSTALLATION_ID", "")
 
-        # Token cache
+        # Token cache (the lock keeps concurrent collector threads from minting a token each)
         self._installation_token: Optional[str] = None
         self._token_expires_at: Optional[datetime] = None
+        self._token_lock = threading.Lock()
 
     def _generate_jwt(self) -> str:
         """
@@ -249,10 +251,24 @@ class DefaultGitHubProvider:
             Exception if token retrieval fails
         """
         # Check if cached token is still valid (refresh 5 minutes before expiry)
+        token = self._cached_installation_token()
+        if token:
+            return token
+
+        with self._token_lock:
+            # Another thread may have refreshed the token while we waited
+            token = self._cached_installation_token()
+            if token:
+                return token
+            return self._refresh_installation_token()
+
+    def _cached_installation_token(self) -> Optional[str]:
         if self._installation_token and self._token_expires_at:
             if datetime.now(timezone.utc) < (self._token_expires_at - timedelta(minutes=5)):
                 return self._installation_token
+        return None
 
+    def _refresh_installation_token(self) -> str:
         # Generate new installation token
         if not self.installation_id:
             raise ValueError("GITHUB_APP_INSTALLATION_ID required")
@@ -2,6 +2,8 @@
 
 import os
 import threading
+from collections import deque
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Protocol, Tuple, runtime_checkable
 
 _core_v1_api = None
@@ -10,6 +12,10 @@ _batch_v1_api = None
 _config_loaded = False
 _init_lock = threading.Lock()
 
+_LOG_STREAM_CHUNK_BYTES = 64 * 1024
+# Longer log lines keep only their last this-many bytes, so one huge line cannot grow the read buffer unbounded.
+_LOG_LINE_MAX_BYTES = 64 * 1024
+
 
 def _apply_ssl_config(client_module) -> None:
     """Disable SSL verification if K8S_VERIFY_SSL=false.
@@ -106,8 +112,13 @@ class DefaultK8sProvider:
         )
 
 
+@lru_cache(maxsize=1)
 def get_k8s_provider() -> K8sProvider:
-    """Seam for swapping provider implementations later (e.g., MCP-backed)."""
+    """
+    Seam for swapping provider implementations later (e.g., MCP-backed).
+
+    The default provider is stateless (API clients are module-level singletons), so one shared instance is reused.
+    """
     return DefaultK8sProvider()
 
 
@@ -917,6 +928,10 @@ def read_pod_log(
 
     Returns:
         Raw log text, or None if logs are unavailable (pod deleted, no previous instance, etc.)
+
+    The response body is streamed and only the last `tail_lines` lines are retained. Lines longer than
+    `_LOG_LINE_MAX_BYTES` are cut to their trailing bytes, so peak memory stays around
+    `tail_lines * _LOG_LINE_MAX_BYTES` even for pathological single-line output.
     """
     try:
         v1 = _get_core_v1()
@@ -925,9 +940,32 @@ def read_pod_log(
             "namespace": namespace,
             "previous": previous,
             "tail_lines": tail_lines,
+            "_preload_content": False,
         }
         if container:
             kwargs["container"] = container
-        return v1.read_namespaced_pod_log(**kwargs)
+        resp = v1.read_namespaced_pod_log(**kwargs)
+        try:
+            return _read_log_tail(resp.stream(_LOG_STREAM_CHUNK_BYTES), tail_lines)
+        finally:
+            resp.release_conn()
     except Exception:
         return None
+
+
+def _read_log_tail(chunks, max_lines: int) -> str:
+    """Join a stream of byte chunks into text, keeping only the last `max_lines` lines.
+
+    Each line is capped at its last `_LOG_LINE_MAX_BYTES` bytes; the unfinished line carried between
+    chunks is capped the same way, so the buffering stays linear in the stream size.
+    """
+    tail: deque = deque(maxlen=max(1, max_lines))
+    pending = b""
+    for chunk in chunks:
+        pending += chunk
+        *complete, pending = pending.split(b"\n")
+        tail.extend(line[-_LOG_LINE_MAX_BYTES:] for line in complete)
+        pending = pending[-_LOG_LINE_MAX_BYTES:]
+    if pending:
+        tail.append(pending)
+    return b"\n".join(tail).decode("utf-8", errors="replace")
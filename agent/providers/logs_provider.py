@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import json
 from datetime import datetime
+from functools import lru_cache
 from heapq import heappush, heappushpop
 from typing import Any, Dict, List, Literal, Optional, Protocol, Tuple, TypedDict, runtime_checkable
 
@@ -31,6 +32,9 @@ class LogFetchResult(TypedDict):
 
 @runtime_checkable
 class LogsProvider(Protocol):
+    # Whether `use_regex=True` pod patterns are honoured; callers skip regex-only queries when False.
+    supports_regex: bool
+
     def fetch_recent_logs(
         self,
         pod_name: str,
@@ -40,10 +44,14 @@ class LogsProvider(Protocol):
         limit: int = 400,
         container: Optional[str] = None,
         use_regex: bool = False,
+        label_selectors: Optional[Dict[str, str]] = None,
     ) -> LogFetchResult: ...
 
 
 class DefaultLogsProvider:
+    # Both backends (LogQL `=~`, LogsQL `~`) accept regex stream matchers.
+    supports_regex = True
+
     def fetch_recent_logs(
         self,
         pod_name: str,
@@ -53,6 +61,7 @@ class DefaultLogsProvider:
         limit: int = 400,
         container: Optional[str] = None,
         use_regex: bool = False,
+        label_selectors: Optional[Dict[str, str]] = None,
     ) -> LogFetchResult:
         return fetch_recent_logs(
             pod_name=pod_name,
@@ -62,11 +71,17 @@ class DefaultLogsProvider:
             limit=limit,
             container=container,
             use_regex=use_regex,
+            label_selectors=label_selectors,
         )
 
 
+@lru_cache(maxsize=1)
 def get_logs_provider() -> LogsProvider:
-    """Seam for swapping provider implementations later (e.g., MCP-backed)."""
+    """
+    Seam for swapping provider implementations later (e.g., MCP-backed).
+
+    The default provider is stateless (LOGS_URL/LOGS_BACKEND are read per fetch), so one shared instance is reused.
+    """
     return DefaultLogsProvider()
 
 
@@ -91,6 +106,14 @@ def _detect_backend(logs_url: str) -> Literal["loki", "victorialogs"]:
     return "victorialogs"
 
 
+def _label_selector_attempts(
+    namespace: str, container: Optional[str], label_selectors: Dict[str, str]
+) -> List[Dict[str, str]]:
+    """Equality-only attempts for indexed label selectors (with container first, when given)."""
+    base = {"namespace": namespace, **label_selectors}
+    return ([{**base, "container": container}] if container else []) + [base]
+
+
 def fetch_recent_logs(
     pod_name: str,
     namespace: str,
@@ -99,6 +122,7 @@ def fetch_recent_logs(
     limit: int = 400,
     container: Optional[str] = None,
     use_regex: bool = False,
+    label_selectors: Optional[Dict[str, str]] = None,
 ) -> LogFetchResult:
     """
     Fetch recent logs from VictoriaLogs (LogsQL) or Loki (LogQL) for a pod.
@@ -115,6 +139,9 @@ def fetch_recent_logs(
         use_regex: If True, treat pod_name as a regex pattern.
                    For Loki: uses =~ operator ({pod=~"pattern"})
                    For VictoriaLogs: uses re() function (pod:re("pattern"))
+        label_selectors: Optional equality matchers on indexed labels (e.g. {"job_name": "etl-123"}).
+                   When set they replace the pod matchers, so the backend resolves streams from
+                   its label index instead of expanding a pod regex.
 
     Returns:
         Dict with:
@@ -163,6 +190,7 @@ def fetch_recent_logs(
             container=container,
             timeout_s=timeout_s,
             use_regex=use_regex,
+            label_selectors=label_selectors,
         )
     else:
         return _fetch_from_victorialogs(
@@ -175,6 +203,7 @@ def fetch_recent_logs(
             container=container,
             timeout_s=timeout_s,
             use_regex=use_regex,
+            label_selectors=label_selectors,
         )
 
 
@@ -188,6 +217,7 @@ def _fetch_from_loki(
     container: Optional[str],
     timeout_s: float,
     use_regex: bool = False,
+    label_selectors: Optional[Dict[str, str]] = None,
 ) -> LogFetchResult:
     """
     Loki implementation (LogQL syntax).
@@ -354,6 +384,9 @@ def _fetch_from_loki(
         # Use regex for pod-related fields
         regex_fields = {"pod", "k8s_pod", "pod_name"}
 
+    if label_selectors:
+        attempts, regex_fields = _label_selector_attempts(namespace, container, label_selectors), set()
+
     for labels in attempts:
         logql = _labels_to_logql(labels, regex_fields=regex_fields)
         if first_query is None:
@@ -397,6 +430,7 @@ def _fetch_from_victorialogs(
     container: Optional[str],
     timeout_s: float,
     use_regex: bool = False,
+    label_selectors: Optional[Dict[str, str]] = None,
 ) -> LogFetchResult:
     """VictoriaLogs implementation (LogsQL syntax)."""
 
@@ -571,6 +605,9 @@ def _fetch_from_victorialogs(
         # Use regex for pod-related fields
         regex_fields = {"pod", "k8s_pod"}
 
+    if label_selectors:
+        attempts, regex_fields = _label_selector_attempts(namespace, container, label_selectors), set()
+
     for labels in attempts:
         logsql = _labels_to_logsql(labels, regex_fields=regex_fields)
         if first_query is None:
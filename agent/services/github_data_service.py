@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -34,6 +35,11 @@ def _safe_error_message(err: Exception) -> str:
     return redact_text(str(err), redact_infrastructure=False)[:300]
 
 
+def _markdown_docs(doc_files: List[str], max_docs: int) -> List[str]:
+    """Markdown entries of a docs/ listing, capped after filtering so non-.md files don't use up the budget."""
+    return [f for f in doc_files if f.endswith(".md")][:max_docs]
+
+
 class GitHubDataService:
     """Read-only service for GitHub metadata + content access."""
 
@@ -194,13 +200,12 @@ class GitHubDataService:
 
             try:
                 doc_files = git_cache.list_dir(mirror_path, ref=mirror_ref, dir_path="docs")
-                for file in doc_files[:max_docs]:
-                    if file.endswith(".md"):
-                        try:
-                            content = git_cache.read_file(mirror_path, ref=mirror_ref, file_path=f"docs/{file}")
-                            docs.append({"path": f"docs/{file}", "content": content})
-                        except Exception:
-                            continue
+                for file in _markdown_docs(doc_files, max_docs):
+                    try:
+                        content = git_cache.read_file(mirror_path, ref=mirror_ref, file_path=f"docs/{file}")
+                        docs.append({"path": f"docs/{file}", "content": content})
+                    except Exception:
+                        continue
             except Exception:
                 mirror_docs_failed = True
         except Exception as e:
@@ -221,14 +226,19 @@ class GitHubDataService:
 
             if not docs and mirror_docs_failed:
                 try:
-                    doc_files = github.list_directory(repo=repo, path="docs", ref=api_ref)
-                    for file in doc_files[:max_docs]:
-                        if file.endswith(".md"):
-                            try:
-                                content = github.get_file_contents(repo=repo, path=f"docs/{file}", ref=api_ref)
-                                docs.append({"path": f"docs/{file}", "content": content})
-                            except Exception:
-                                continue
+                    doc_files = _markdown_docs(github.list_directory(repo=repo, path="docs", ref=api_ref), max_docs)
+
+                    def _fetch_doc(file: str) -> Optional[Dict[str, str]]:
+                        try:
+                            content = github.get_file_contents(repo=repo, path=f"docs/{file}", ref=api_ref)
+                        except Exception:
+                            return None
+                        return {"path": f"docs/{file}", "content": content}
+
+                    # Each REST read is a separate round-trip; fetch them concurrently (map keeps listing order).
+                    if doc_files:
+                        with ThreadPoolExecutor(max_workers=len(doc_files)) as pool:
+                            docs.extend(doc for doc in pool.map(_fetch_doc, doc_files) if doc is not None)
                     if docs:
                         source_parts.append("rest")
                 except Exception:
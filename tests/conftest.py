@@ -51,3 +51,29 @@ def _stub_jetstream_client_for_unit_tests(monkeypatch: pytest.MonkeyPatch) -> No
         return _NoopQueueClient()
 
     monkeypatch.setattr("agent.queue.nats_jetstream.get_client_from_env", _fake_get_client_from_env)
+
+
+@pytest.fixture(autouse=True)
+def _reset_github_catalog_cache() -> None:
+    """Parsed catalogs and repo existence checks are cached per process; tests that mock them need a clean slate."""
+    from agent.collectors import github_context
+
+    github_context._CATALOG_CACHE.clear()
+    github_context._repo_exists_cached.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_pod_not_healthy_caches() -> None:
+    """Service account / ECR lookups behind image-pull diagnostics are cached per process."""
+    from agent.collectors import pod_not_healthy
+
+    pod_not_healthy._service_account_info_cached.cache_clear()
+    pod_not_healthy._ecr_describe_image_cached.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_ksm_rollout_cache() -> None:
+    """kube-state-metrics rollout reads are cached per 15s bucket."""
+    from agent.collectors import nonpod_baseline
+
+    nonpod_baseline._ksm_scalar_cached.cache_clear()
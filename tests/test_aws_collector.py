@@ -142,6 +142,16 @@ def test_deduplicates_resource_ids():
     assert metadata["ec2_instances"] == ["i-abc123"]  # Deduplicated
 
 
+def test_ignores_label_values_without_aws_id_prefix():
+    """Non-AWS values in ID labels (e.g. Prometheus host:port instances) are ignored."""
+    investigation = _make_investigation(labels={"instance": "10.0.0.1:9100", "volume_id": "pvc-123"})
+
+    metadata = extract_aws_metadata_from_investigation(investigation)
+
+    assert metadata["ec2_instances"] == []
+    assert metadata["ebs_volumes"] == []
+
+
 def test_default_region_from_env(monkeypatch):
     """Default region comes from AWS_REGION env var."""
     monkeypatch.setenv("AWS_REGION", "eu-west-1")
@@ -256,8 +266,13 @@ def test_collect_aws_evidence_continues_on_error(mock_aws_provider, monkeypatch)
     assert any("ec2:" in err for err in result["errors"])
 
 
-def test_collect_aws_evidence_returns_empty_when_no_resources():
+def test_collect_aws_evidence_returns_empty_when_no_resources(monkeypatch):
     """AWS evidence collection returns empty dicts when no resources found."""
+
+    def _unexpected_provider():
+        raise AssertionError("AWS provider should not be created without AWS resources")
+
+    monkeypatch.setattr("agent.collectors.aws_context.get_aws_provider", _unexpected_provider)
     investigation = _make_investigation(labels={})
 
     result = collect_aws_evidence(investigation)
@@ -0,0 +1,54 @@
+"""Tests for the chat tool dispatch table in agent/chat/tools.py."""
+
+from __future__ import annotations
+
+from agent.authz.policy import ActionPolicy, ChatPolicy
+from agent.chat.runtime import _allowed_tools
+from agent.chat.tools import _TOOL_HANDLERS, _TOOL_PREFIX_HANDLERS, run_tool
+
+
+def _has_handler(tool: str) -> bool:
+    return tool in _TOOL_HANDLERS or any(tool.startswith(p) for p, _ in _TOOL_PREFIX_HANDLERS)
+
+
+def test_every_allowed_tool_has_a_handler() -> None:
+    policy = ChatPolicy(
+        enabled=True,
+        allow_promql=True,
+        allow_k8s_read=True,
+        allow_k8s_events=True,
+        allow_logs_query=True,
+        allow_memory_read=True,
+        allow_report_rerun=True,
+        allow_argocd_read=True,
+        allow_aws_read=True,
+        allow_github_read=True,
+        allow_exec_read=True,
+    )
+    tools = _allowed_tools(policy, ActionPolicy(enabled=True))
+    assert tools
+    assert [t for t in tools if not _has_handler(t)] == []
+
+
+def test_unknown_tool_is_rejected() -> None:
+    res = run_tool(
+        policy=ChatPolicy(enabled=True),
+        action_policy=None,
+        tool="nope.nothing",
+        args={},
+        analysis_json={},
+    )
+    assert res.ok is False
+    assert res.error == "unknown_tool"
+
+
+def test_prefix_handler_dispatches_namespaced_tools() -> None:
+    res = run_tool(
+        policy=ChatPolicy(enabled=True, allow_argocd_read=True),
+        action_policy=None,
+        tool="argocd.app_status",
+        args={},
+        analysis_json={},
+    )
+    assert res.ok is False
+    assert res.error == "argocd_not_implemented"
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+
+def _investigation():
+    from agent.core.models import AlertInstance, Investigation, TargetRef, TimeWindow
+
+    now = datetime(2025, 1, 2, 0, 0, 0, tzinfo=timezone.utc)
+    return Investigation(
+        alert=AlertInstance(
+            fingerprint="fp",
+            labels={"alertname": "CPUThrottlingHigh", "namespace": "ns1", "pod": "p1", "container": "app"},
+            annotations={},
+        ),
+        time_window=TimeWindow(window="30m", start_time=now - timedelta(minutes=30), end_time=now),
+        target=TargetRef(target_type="pod", namespace="ns1", pod="p1"),
+    )
+
+
+def test_collect_cpu_throttling_runs_query_alongside_baseline(monkeypatch: pytest.MonkeyPatch) -> None:
+    from agent.collectors import cpu_throttling
+
+    calls = []
+
+    def fake_baseline(investigation, *, events_limit: int = 20) -> None:  # type: ignore[no-untyped-def]
+        calls.append(("baseline", events_limit))
+
+    def fake_query(pod, namespace, start_time, end_time, container=None):  # type: ignore[no-untyped-def]
+        calls.append(("throttling", pod, namespace, container))
+        return {"throttling_percentage": []}
+
+    monkeypatch.setattr(cpu_throttling, "collect_pod_baseline", fake_baseline)
+    monkeypatch.setattr(cpu_throttling, "query_cpu_throttling", fake_query)
+
+    inv = _investigation()
+    cpu_throttling.collect_cpu_throttling(inv)
+
+    assert inv.target.playbook == "cpu_throttling"
+    assert inv.evidence.metrics.throttling_data == {"throttling_percentage": []}
+    assert ("baseline", 20) in calls
+    assert ("throttling", "p1", "ns1", "app") in calls
+
+
+def test_collect_cpu_throttling_records_query_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    from agent.collectors import cpu_throttling
+
+    def fake_query(*args, **kwargs):  # type: ignore[no-untyped-def]
+        raise RuntimeError("prom down")
+
+    monkeypatch.setattr(cpu_throttling, "collect_pod_baseline", lambda inv, events_limit=20: None)
+    monkeypatch.setattr(cpu_throttling, "query_cpu_throttling", fake_query)
+
+    inv = _investigation()
+    cpu_throttling.collect_cpu_throttling(inv)
+
+    assert inv.evidence.metrics.throttling_data is None
+    assert any("Failed to query throttling: prom down" in e for e in inv.errors)
@@ -147,6 +147,34 @@ class TestCrashloopCollector:
         prev_errors = inv.meta.get("previous_logs_parsed_errors")
         assert prev_errors is not None or inv.meta.get("previous_container_logs") is not None
 
+    def test_parse_previous_logs_keeps_most_recent_lines(self):
+        """Oversized previous logs are bounded to the most recent lines before parsing."""
+        from agent.collectors.crashloop import _PREVIOUS_LOG_MAX_LINES, _parse_previous_logs
+
+        inv = _make_investigation()
+        lines = ["ERROR: early failure"] + ["INFO: ok", "   "] * _PREVIOUS_LOG_MAX_LINES + ["FATAL: late failure"]
+        inv.meta["previous_container_logs"] = "\n".join(lines)
+
+        _parse_previous_logs(inv)
+
+        messages = [e["message"] for e in inv.meta.get("previous_logs_parsed_errors", [])]
+        assert any("late failure" in m for m in messages)
+        assert not any("early failure" in m for m in messages)
+
+    def test_parse_previous_logs_skips_whitespace_only_blob(self):
+        """Whitespace-only previous logs are skipped without parsing."""
+        from agent.collectors.crashloop import _parse_previous_logs
+
+        inv = _make_investigation()
+        inv.meta["previous_container_logs"] = "\n  \n\t\n"
+
+        with patch("agent.collectors.crashloop.parse_log_entries") as mock_parse:
+            _parse_previous_logs(inv)
+
+        mock_parse.assert_not_called()
+        assert "previous_logs_parsed_errors" not in inv.meta
+        assert inv.errors == []
+
     def test_detects_liveness_probe_failure(self):
         """Test probe failure detection from events."""
         inv = _make_investigation()
@@ -137,3 +137,83 @@ def test_dedup_key_changes_across_4h_buckets() -> None:
     # Next bucket (04:00-07:59)
     k3 = compute_dedup_key(alertname="CrashLoop", labels=labels, fingerprint="fp", now=_dt(2026, 1, 2, 4, 0, 0))
     assert k1 != k3
+
+
+def test_dedup_keys_hash_canonical_sorted_json() -> None:
+    # Keys are persisted as queue msg-ids: the hashed bytes must stay json.dumps(sort_keys=True) compatible.
+    import hashlib
+    import json
+
+    from agent.core.dedup import compute_rollout_workload_key
+
+    def digest(payload: dict) -> str:
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+    labels = {"cluster": 'c"é', "namespace": "ns", "pod": "p1", "container": "app"}
+    key = compute_dedup_key(alertname="CrashLoop", labels=labels, fingerprint="fp", now=_dt(2026, 1, 2, 5))
+    family = detect_family_for_labels(labels)
+    assert key == digest(
+        {
+            "v": 1,
+            "bucket_hours": 4,
+            "bucket": "2026010204",
+            "alertname": "CrashLoop",
+            "family": family,
+            "kind": "pod",
+            "identity": {"cluster": 'c"é', "namespace": "ns", "pod": "p1"},
+        }
+    )
+
+    owner_chain = {"workload": {"kind": "Deployment", "name": "api"}}
+    for include_container, container in ((True, "app"), (False, None)):
+        wk = compute_rollout_workload_key(
+            alertname="CrashLoop", labels=labels, owner_chain=owner_chain, include_container=include_container
+        )
+        assert wk == digest(
+            {
+                "v": 1,
+                "scope": "workload",
+                "alertname": "CrashLoop",
+                "family": family,
+                "cluster": 'c"é',
+                "namespace": "ns",
+                "workload_kind": "Deployment",
+                "workload_name": "api",
+                "container": container,
+            }
+        )
+
+
+def test_detect_family_for_labels_resolves_each_alertname_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    from agent.core import dedup
+
+    calls = []
+
+    def fake_detect_family(labels, playbook):  # type: ignore[no-untyped-def]
+        calls.append(dict(labels))
+        return "crashloop"
+
+    dedup._detect_family_for_alertname.cache_clear()
+    monkeypatch.setattr(dedup, "detect_family", fake_detect_family)
+    try:
+        assert detect_family_for_labels({"alertname": "CrashLoop", "pod": "a"}) == "crashloop"
+        assert detect_family_for_labels({"alertname": "CrashLoop", "pod": "b"}) == "crashloop"
+        assert calls == [{"alertname": "CrashLoop"}]
+    finally:
+        dedup._detect_family_for_alertname.cache_clear()
+
+
+def test_dedup_key_bucket_is_timezone_independent() -> None:
+    from datetime import timedelta
+
+    labels = {"alertname": "CrashLoop", "cluster": "c1", "namespace": "ns", "pod": "p1"}
+    utc = _dt(2026, 1, 2, 7, 59, 59)
+    ist = utc.astimezone(timezone(timedelta(hours=5, minutes=30)))
+    naive = utc.replace(tzinfo=None)
+    keys = {
+        compute_dedup_key(alertname="CrashLoop", labels=labels, fingerprint="fp", now=now, bucket_hours=5)
+        for now in (utc, ist, naive, _dt(2026, 1, 2, 5, 0, 0))
+    }
+    assert len(keys) == 1
+    with pytest.raises(ValueError):
+        compute_dedup_key(alertname="CrashLoop", labels=labels, fingerprint="fp", now=utc, bucket_hours=0)
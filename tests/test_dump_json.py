@@ -45,6 +45,11 @@ def test_investigation_to_json_dict_analysis_mode_contains_features_scores_verdi
     # Hypotheses are part of the stable analysis contract (may be empty).
     assert "hypotheses" in out["analysis"]
 
+    # The analysis-only helper (used by chat reruns) must match the embedded slice.
+    from agent.dump import analysis_to_json_dict
+
+    assert analysis_to_json_dict(investigation) == out["analysis"]
+
 
 def test_dump_includes_alert_core_and_source_labels() -> None:
     from datetime import datetime, timedelta
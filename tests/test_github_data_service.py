@@ -136,3 +136,26 @@ def test_workflow_runs_defaults_to_failed_jobs_mode():
 
     assert out["source"] == "api"
     provider.get_workflow_runs.assert_called_once_with(repo="acme/repo", since=since, limit=5, jobs_mode="failed")
+
+
+def test_readme_and_docs_rest_filters_markdown_before_capping():
+    svc = GitHubDataService()
+    cache = MagicMock()
+    cache.ensure_mirror.side_effect = RuntimeError("clone failed")
+
+    provider = MagicMock()
+    provider.list_directory.return_value = ["img.png", "a.md", "diagram.svg", "b.md", "c.md", "broken.md"]
+
+    def get_file_contents(repo, path, ref="main"):  # type: ignore[no-untyped-def]
+        if path == "docs/broken.md":
+            raise Exception("404")
+        return f"content of {path}"
+
+    provider.get_file_contents.side_effect = get_file_contents
+
+    with patch("agent.providers.git_mirror_provider.get_git_mirror_cache", return_value=cache):
+        with patch("agent.providers.github_provider.get_github_provider", return_value=provider):
+            out = svc.readme_and_docs(repo="acme/repo", max_docs=3)
+
+    assert [d["path"] for d in out["docs"]] == ["docs/a.md", "docs/b.md", "docs/c.md"]
+    assert out["docs"][0]["content"] == "content of docs/a.md"
@@ -16,6 +16,7 @@ from agent.collectors.github_context import (
     _extract_base_service_name,
     _is_valid_repo_format,
     discover_github_repo,
+    discover_github_repo_with_method,
 )
 
 
@@ -103,6 +104,45 @@ def test_discover_from_naming_convention_strips_pod_hash(monkeypatch):
     assert repo == "myorg/auth-service"
 
 
+def test_discover_from_naming_convention_prefers_candidate_order(monkeypatch):
+    """Step 3: Concurrent existence checks still return the highest-priority existing candidate."""
+    monkeypatch.setenv("GITHUB_DEFAULT_ORG", "myorg")
+    existing = {"myorg/order-processing", "myorg/order-processing-service"}
+    github = MagicMock()
+    github.repo_exists.side_effect = lambda repo: repo in existing
+
+    with patch("agent.providers.github_provider.get_github_provider", return_value=github):
+        repo = _discover_from_naming_convention("order-processing-executor")
+
+    assert repo == "myorg/order-processing"
+
+
+def test_discover_from_naming_convention_caches_repo_exists(monkeypatch):
+    """Step 3: Repeated discovery of the same workload reuses existence checks."""
+    monkeypatch.setenv("GITHUB_DEFAULT_ORG", "myorg")
+    github = MagicMock()
+    github.repo_exists.return_value = True
+
+    with patch("agent.providers.github_provider.get_github_provider", return_value=github):
+        assert _discover_from_naming_convention("payment-service") == "myorg/payment-service"
+        assert _discover_from_naming_convention("payment-service") == "myorg/payment-service"
+
+    github.repo_exists.assert_called_once_with("myorg/payment-service")
+
+
+def test_discover_from_naming_convention_retries_failed_repo_check(monkeypatch):
+    """Step 3: A failed existence check is not cached, so the next discovery re-checks the repo."""
+    monkeypatch.setenv("GITHUB_DEFAULT_ORG", "myorg")
+    github = MagicMock()
+    github.repo_exists.side_effect = [False, True]
+
+    with patch("agent.providers.github_provider.get_github_provider", return_value=github):
+        assert _discover_from_naming_convention("payment-service") == "myorg/payment-service"  # unverified fallback
+        assert _discover_from_naming_convention("payment-service") == "myorg/payment-service"
+
+    assert github.repo_exists.call_count == 2
+
+
 def test_discover_from_naming_convention_no_org(monkeypatch):
     """Step 3: Returns None if GITHUB_DEFAULT_ORG not set."""
     monkeypatch.delenv("GITHUB_DEFAULT_ORG", raising=False)
@@ -334,6 +374,27 @@ def test_discover_github_repo_returns_none_if_all_fail(monkeypatch):
     assert repo is None
 
 
+def test_discover_github_repo_with_method_reports_step(monkeypatch):
+    """Discovery chain: the matching step is reported alongside the repo."""
+    monkeypatch.setenv("GITHUB_DEFAULT_ORG", "myorg")
+
+    inv = _mock_investigation(workload_name="test-service", alert_labels={"github_repo": "myorg/alert-service"})
+    inv.evidence.k8s.owner_chain = None
+
+    assert discover_github_repo_with_method(inv) == ("myorg/alert-service", "alert_label")
+
+
+def test_discover_github_repo_with_method_returns_none_pair(monkeypatch):
+    """Discovery chain: (None, None) when nothing matches."""
+    monkeypatch.delenv("GITHUB_DEFAULT_ORG", raising=False)
+
+    inv = _mock_investigation(workload_name="unknown-service")
+    inv.evidence.k8s.owner_chain = None
+
+    with patch("pathlib.Path.exists", return_value=False):
+        assert discover_github_repo_with_method(inv) == (None, None)
+
+
 def test_extract_base_service_name():
     """Helper: Extract base service name from pod name."""
     assert _extract_base_service_name("auth-service-abc123") == "auth-service"
@@ -373,6 +434,17 @@ def test_extract_base_service_name_cronjob_spawned_job_pod():
     assert _extract_base_service_name("my-batch-1708199999-0-x7k9m") == "my-batch"
 
 
+def test_extract_base_service_name_layers_apply_in_sequence():
+    """Helper: Suffix layers are stripped in sequence, not by a single alternation.
+
+    A one-pass alternation would stop after the first layer and leave the
+    CronJob timestamp behind on plain CronJob pods (<cronjob>-<timestamp>-<hash>).
+    """
+    assert _extract_base_service_name("nightly-report-28512345-zq7xk") == "nightly-report"
+    # All-digit pod suffix is still a Job pod, not a Job instance
+    assert _extract_base_service_name("job-58002-0-12345") == "job"
+
+
 def test_is_valid_repo_format():
     """Helper: Validate repo format."""
     assert _is_valid_repo_format("myorg/myrepo") is True
@@ -382,3 +454,62 @@ def test_is_valid_repo_format():
     assert _is_valid_repo_format("") is False
     assert _is_valid_repo_format("/no-org") is False
     assert _is_valid_repo_format("no-repo/") is False
+
+
+def test_load_yaml_catalog_reuses_parse_until_file_changes(tmp_path):
+    """Helper: Catalog parses are cached per path and invalidated by mtime changes."""
+    import os
+
+    from agent.collectors.github_context import _load_yaml_catalog
+
+    path = tmp_path / "catalog.yaml"
+    path.write_text('services:\n  a:\n    github_repo: "org/a"\n')
+
+    first = _load_yaml_catalog(path)
+    assert first.raw == {"services": {"a": {"github_repo": "org/a"}}}
+    assert _load_yaml_catalog(path) is first
+
+    path.write_text('services:\n  b:\n    github_repo: "org/b"\n')
+    st = path.stat()
+    os.utime(path, (st.st_atime, st.st_mtime + 10))
+    assert _load_yaml_catalog(path).raw == {"services": {"b": {"github_repo": "org/b"}}}
+
+    assert _load_yaml_catalog(tmp_path / "missing.yaml") is None
+
+
+def test_catalog_section_index_is_case_insensitive():
+    """Helper: Catalog sections are indexed by lowercased entry name at load time."""
+    from agent.collectors.github_context import _Catalog
+
+    catalog = _Catalog.from_raw({"services": {"Auth-Service": {"github_repo": "org/auth"}}, "version": 1})
+
+    assert catalog.section("services") == {"auth-service": {"github_repo": "org/auth"}}
+    assert catalog.section("third_party_services") == {}
+
+
+def test_strip_workload_suffix():
+    """Helper: Workload-type suffix is stripped only when it is the last segment."""
+    from agent.collectors.github_context import _strip_workload_suffix
+
+    assert _strip_workload_suffix("order-processing-executor") == "order-processing"
+    assert _strip_workload_suffix("nightly-cronjob") == "nightly"
+    assert _strip_workload_suffix("auth-service") is None
+    assert _strip_workload_suffix("jobrunner") is None
+
+
+def test_catalog_indexes_third_party_repos():
+    """Helper: Third-party repos are collected into a set at load time."""
+    from agent.collectors.github_context import _Catalog
+
+    catalog = _Catalog.from_raw(
+        {
+            "third_party_services": {
+                "coredns": {"github_repo": "coredns/coredns"},
+                "redis": {"github_repo": "redis/redis"},
+                "broken": "not-a-mapping",
+            }
+        }
+    )
+
+    assert catalog.third_party_repos == {"coredns/coredns", "redis/redis"}
+    assert _Catalog.from_raw({"services": {"a": {"github_repo": "org/a"}}}).third_party_repos == frozenset()
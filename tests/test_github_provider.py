@@ -144,6 +144,25 @@ def test_github_provider_refreshes_expired_token(mock_github_env):
             assert provider._installation_token == "ghs_new_token_xyz789"
 
 
+def test_github_provider_mints_one_token_under_concurrency(mock_github_env):
+    """Concurrent callers share a single installation-token refresh."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    provider = DefaultGitHubProvider()
+
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"token": "ghs_shared", "expires_at": "2099-01-01T00:00:00Z"}
+    mock_response.raise_for_status = MagicMock()
+
+    with patch("jwt.encode", return_value="mocked.jwt.token"):
+        with patch("requests.post", return_value=mock_response) as mock_post:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                tokens = list(pool.map(lambda _: provider._get_installation_token(), range(8)))
+
+    assert tokens == ["ghs_shared"] * 8
+    mock_post.assert_called_once()
+
+
 def test_github_provider_make_request_uses_auth(mock_github_env):
     """Provider adds authentication headers to requests."""
     provider = DefaultGitHubProvider()
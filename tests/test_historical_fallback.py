@@ -0,0 +1,147 @@
+"""Unit tests for the historical fallback helpers."""
+
+from __future__ import annotations
+
+from agent.collectors.historical_fallback import _extract_pod_name_from_alert
+
+
+def test_extract_pod_name_from_summary():
+    alert = {"annotations": {"summary": "Pod batch-etl-job-57438-0-lmwj3 failed"}}
+    assert _extract_pod_name_from_alert(alert) == "batch-etl-job-57438-0-lmwj3"
+
+
+def test_extract_pod_name_kubernetes_pod_backticks():
+    alert = {"annotations": {"description": "Kubernetes pod `myapp-6d4b8c9f7-xk5p2` is crash looping"}}
+    assert _extract_pod_name_from_alert(alert) == "myapp-6d4b8c9f7-xk5p2"
+
+
+def test_extract_pod_name_skips_non_pod_words():
+    # The first "pod" mention is followed by a plain word; a later mention carries the name.
+    alert = {"annotations": {"message": "The pod is failing; see pod: worker-abc12 for details"}}
+    assert _extract_pod_name_from_alert(alert) == "worker-abc12"
+
+
+def test_extract_pod_name_missing():
+    assert _extract_pod_name_from_alert({"annotations": {"summary": "Job failed"}}) is None
+    assert _extract_pod_name_from_alert({"annotations": None}) is None
+    assert _extract_pod_name_from_alert(object()) is None
+
+
+def test_extract_pod_name_prefers_field_order_and_does_not_span_fields():
+    alert = {
+        "annotations": {
+            "summary": "Restarted pod",
+            "description": "worker-abc12 restarted; pod: api-server-1",
+            "message": "pod: late-match-xyz",
+        }
+    }
+    assert _extract_pod_name_from_alert(alert) == "api-server-1"
+
+
+def _job_investigation():
+    from datetime import datetime, timezone
+
+    from agent.core.models import AlertInstance, Investigation, TargetRef, TimeWindow
+
+    now = datetime(2026, 2, 18, 10, 5, tzinfo=timezone.utc)
+    return Investigation(
+        alert=AlertInstance(fingerprint="fp", labels={}, annotations={}),
+        time_window=TimeWindow(window="1h", start_time=now, end_time=now),
+        target=TargetRef(
+            target_type="pod", namespace="batch", pod="etl-57438-0-lmwj3", workload_kind="Job", workload_name="etl"
+        ),
+    )
+
+
+def test_collect_logs_prefers_job_label_then_falls_back_to_regex():
+    from unittest.mock import MagicMock, patch
+
+    from agent.collectors.historical_fallback import _collect_logs_with_regex
+
+    provider = MagicMock()
+    provider.fetch_recent_logs.side_effect = [
+        {"entries": [], "status": "empty", "reason": "empty", "backend": "loki", "query_used": "q1"},
+        {"entries": [{"message": "boom"}], "status": "ok", "reason": "ok", "backend": "loki", "query_used": "q2"},
+    ]
+    inv = _job_investigation()
+
+    with patch("agent.collectors.historical_fallback.get_logs_provider", return_value=provider):
+        _collect_logs_with_regex(inv)
+
+    first, second = provider.fetch_recent_logs.call_args_list
+    assert first.kwargs["label_selectors"] == {"job_name": "etl"}
+    assert second.kwargs["use_regex"] is True
+    assert second.kwargs["pod_name"] == "etl-57438-0.*"
+    assert inv.evidence.logs.logs_query == "q2"
+    assert inv.meta["historical_logs_collected"] is True
+    assert inv.meta["historical_logs_selector"] == "pod_regex"
+
+
+def test_collect_logs_falls_back_to_regex_when_job_label_query_errors():
+    from unittest.mock import MagicMock, patch
+
+    from agent.collectors.historical_fallback import _collect_logs_with_regex
+
+    provider = MagicMock()
+    provider.fetch_recent_logs.side_effect = [
+        {"entries": [], "status": "unavailable", "reason": "timeout", "backend": "loki", "query_used": "q1"},
+        {"entries": [{"message": "boom"}], "status": "ok", "reason": "ok", "backend": "loki", "query_used": "q2"},
+    ]
+    inv = _job_investigation()
+
+    with patch("agent.collectors.historical_fallback.get_logs_provider", return_value=provider):
+        _collect_logs_with_regex(inv)
+
+    assert provider.fetch_recent_logs.call_count == 2
+    assert inv.evidence.logs.logs == [{"message": "boom"}]
+    assert inv.meta["historical_logs_selector"] == "pod_regex"
+
+
+def test_collect_logs_uses_job_label_result_when_present():
+    from unittest.mock import MagicMock, patch
+
+    from agent.collectors.historical_fallback import _collect_logs_with_regex
+
+    provider = MagicMock()
+    provider.fetch_recent_logs.return_value = {
+        "entries": [{"message": "boom"}],
+        "status": "ok",
+        "reason": "ok",
+        "backend": "loki",
+        "query_used": '{namespace="batch", job_name="etl"}',
+    }
+    inv = _job_investigation()
+
+    with patch("agent.collectors.historical_fallback.get_logs_provider", return_value=provider):
+        _collect_logs_with_regex(inv)
+
+    provider.fetch_recent_logs.assert_called_once()
+    assert inv.evidence.logs.logs == [{"message": "boom"}]
+    assert inv.meta["historical_logs_selector"] == "job_name"
+
+
+def test_extract_pod_prefix_drops_last_segment():
+    from agent.collectors.historical_fallback import _extract_pod_prefix
+
+    assert _extract_pod_prefix("batch-etl-job-57438-0-lmwj3") == "batch-etl-job-57438-0"
+    assert _extract_pod_prefix("myapp-6d4b8c9f7-xk5p2") == "myapp-6d4b8c9f7"
+    assert _extract_pod_prefix("standalone") == "standalone"
+    assert _extract_pod_prefix("-leading") == "-leading"
+
+
+def test_collect_logs_skips_regex_query_when_provider_lacks_support():
+    from unittest.mock import MagicMock, patch
+
+    from agent.collectors.historical_fallback import _collect_logs_with_regex
+
+    provider = MagicMock()
+    provider.supports_regex = False
+    inv = _job_investigation()
+    inv.target.workload_kind = None
+
+    with patch("agent.collectors.historical_fallback.get_logs_provider", return_value=provider):
+        _collect_logs_with_regex(inv)
+
+    provider.fetch_recent_logs.assert_not_called()
+    assert inv.meta["historical_logs_skipped"] == "no_regex_support"
+    assert inv.evidence.logs.logs_status is None
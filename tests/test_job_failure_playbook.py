@@ -584,3 +584,184 @@ def test_job_failure_report_content_quality(
     assert hasattr(investigation.analysis.features, "job_metrics")
     assert investigation.analysis.features.job_metrics.get("service_account") == "app-service-account"
     assert investigation.analysis.features.job_metrics.get("exit_code") == 1
+
+
+def _aws_validation_investigation(messages):
+    now = datetime(2026, 2, 18, 10, 5, tzinfo=timezone.utc)
+    inv = Investigation(
+        alert=AlertInstance(fingerprint="fp", labels={"alertname": "KubeJobFailed"}, annotations={}),
+        time_window=TimeWindow(window="1h", start_time=now, end_time=now),
+        target=TargetRef(target_type="pod", namespace="batch", workload_kind="Job", workload_name="etl"),
+        evidence=Evidence(),
+    )
+    inv.evidence.logs.parsed_errors = [{"message": m} for m in messages]
+    return inv
+
+
+def test_validate_aws_resources_skips_logs_without_s3_tokens(monkeypatch):
+    """AWS validation is skipped when no error mentions S3/bucket/botocore."""
+    from agent.collectors.job_failure import _validate_aws_resources
+
+    monkeypatch.setenv("AWS_EVIDENCE_ENABLED", "true")
+    inv = _aws_validation_investigation(["ERROR: connection refused", "FATAL: 403 Forbidden from upstream"])
+
+    with patch("agent.providers.aws_s3_validator.check_s3_bucket_exists") as mock_check:
+        _validate_aws_resources(inv)
+
+    mock_check.assert_not_called()
+    assert not inv.evidence.aws.metadata
+
+
+def test_validate_aws_resources_checks_bucket_from_s3_error(monkeypatch):
+    """A 403 on a named bucket triggers S3 validation for that bucket."""
+    from agent.collectors.job_failure import _validate_aws_resources
+
+    monkeypatch.setenv("AWS_EVIDENCE_ENABLED", "true")
+    inv = _aws_validation_investigation(["ERROR: 403 Forbidden accessing S3 bucket: my-data-bucket"])
+
+    with patch("agent.providers.aws_s3_validator.check_s3_bucket_exists", return_value={"exists": True}) as mock_check:
+        _validate_aws_resources(inv)
+
+    mock_check.assert_called_once_with("my-data-bucket")
+    assert inv.evidence.aws.metadata["s3_validation"] == {"exists": True}
+
+
+def test_most_recent_picks_newest_pod_and_tolerates_missing_timestamp():
+    from agent.collectors.job_failure import _most_recent
+
+    pods = [
+        {"metadata": {"name": "old", "creationTimestamp": "2026-02-18T10:00:05Z"}},
+        {"metadata": {"name": "unknown", "creationTimestamp": None}},
+        {"metadata": {"name": "new", "creationTimestamp": "2026-02-18T10:02:10Z"}},
+    ]
+    assert _most_recent(pods)["metadata"]["name"] == "new"
+
+
+def test_job_rollout_status_fetched_once(
+    mock_k8s_provider, mock_workload_rollout_status, mock_get_events, mock_gather_pod_context, mock_fetch_recent_logs
+):
+    """Step 1 and Step 2 share one Job status read, and it is handed to the pod context gatherer."""
+    investigation = Investigation(
+        alert=AlertInstance(fingerprint="fp", labels={"alertname": "KubeJobFailed"}, annotations={}),
+        target=TargetRef(target_type="workload", namespace="default", workload_kind="Job", workload_name="test-job"),
+        time_window=TimeWindow(
+            window="1h",
+            start_time=datetime(2026, 2, 18, 9, 5, 0, tzinfo=timezone.utc),
+            end_time=datetime(2026, 2, 18, 10, 5, 0, tzinfo=timezone.utc),
+        ),
+        evidence=Evidence(),
+    )
+    mock_k8s_provider.list_pods.return_value = [
+        {"metadata": {"name": "test-job-abc12", "creationTimestamp": "2026-02-18T10:00:05Z"}},
+    ]
+
+    investigate_job_failure_playbook(investigation)
+
+    mock_workload_rollout_status.assert_called_once_with(namespace="default", kind="Job", name="test-job")
+    assert investigation.evidence.k8s.rollout_status["name"] == "test-job"
+    assert mock_gather_pod_context.call_args.kwargs["rollout_status"] == investigation.evidence.k8s.rollout_status
+
+
+def test_aws_signal_messages_keeps_only_token_bearing_messages():
+    from agent.collectors.job_failure import _aws_signal_messages
+
+    parsed = [{"message": "connection refused"}, {"message": None}, {"message": "NoSuchBucket: S3 bucket: a"}]
+    parsed += [{"message": f"botocore ClientError {i}"} for i in range(50)]
+
+    out = _aws_signal_messages(parsed)
+
+    assert out[0] == "NoSuchBucket: S3 bucket: a"
+    assert len(out) == 51
+
+
+def test_validate_aws_resources_detects_s3_error_after_capped_bucket_mentions(monkeypatch):
+    """An S3 error past the bucket-name cap still triggers validation; the bucket comes from the first mentions."""
+    from agent.collectors.job_failure import _AWS_SIGNAL_MAX_MESSAGES, _validate_aws_resources
+
+    monkeypatch.setenv("AWS_EVIDENCE_ENABLED", "true")
+    messages = [f"ERROR: uploading to bucket: foo (attempt {i})" for i in range(_AWS_SIGNAL_MAX_MESSAGES)]
+    messages.append("ERROR: 403 Forbidden from s3")
+    inv = _aws_validation_investigation(messages)
+
+    with patch("agent.providers.aws_s3_validator.check_s3_bucket_exists", return_value={"exists": True}) as mock_check:
+        _validate_aws_resources(inv)
+
+    mock_check.assert_called_once_with("foo")
+    assert inv.evidence.aws.metadata["s3_validation"] == {"exists": True}
+
+
+def test_validate_aws_resources_finds_bucket_named_before_status(monkeypatch):
+    """The bucket name is extracted even when it precedes the 403/Forbidden status in the message."""
+    from agent.collectors.job_failure import _validate_aws_resources
+
+    monkeypatch.setenv("AWS_EVIDENCE_ENABLED", "true")
+    inv = _aws_validation_investigation(["Upload to bucket: raw-events failed: 403 Forbidden (s3)"])
+
+    with patch("agent.providers.aws_s3_validator.check_s3_bucket_exists", return_value={"exists": True}) as mock_check:
+        _validate_aws_resources(inv)
+
+    mock_check.assert_called_once_with("raw-events")
+
+
+def test_validate_aws_resources_runs_s3_and_irsa_checks(monkeypatch):
+    """S3 and IRSA validation both contribute metadata; a failing IRSA lookup is reported without losing S3."""
+    from agent.collectors.job_failure import _validate_aws_resources
+
+    monkeypatch.setenv("AWS_EVIDENCE_ENABLED", "true")
+    inv = _aws_validation_investigation(["ERROR: 403 Forbidden accessing S3 bucket: my-data-bucket"])
+    inv.evidence.k8s.pod_info = {"service_account_name": "etl-sa"}
+
+    with (
+        patch(
+            "agent.providers.aws_s3_validator.check_s3_bucket_exists",
+            return_value={"exists": True, "error_code": "403"},
+        ),
+        patch("agent.providers.aws_s3_validator.get_s3_bucket_location", return_value={"region": "eu-west-1"}),
+        patch("agent.collectors.job_failure.get_service_account_info", side_effect=RuntimeError("sa boom")) as sa,
+    ):
+        _validate_aws_resources(inv)
+
+    sa.assert_called_once_with("batch", "etl-sa")
+    assert inv.evidence.aws.metadata["s3_validation"]["error_code"] == "403"
+    assert inv.evidence.aws.metadata["s3_bucket_region"] == "eu-west-1"
+    assert inv.errors == ["AWS IAM validation failed: sa boom"]
+
+
+def test_job_events_kept_alongside_pod_events(
+    mock_k8s_provider, mock_workload_rollout_status, mock_get_events, mock_gather_pod_context, mock_fetch_recent_logs
+):
+    """Job events from Step 2.5 are merged after the pod events, not overwritten by them."""
+    investigation = Investigation(
+        alert=AlertInstance(fingerprint="fp", labels={"alertname": "KubeJobFailed"}, annotations={}),
+        target=TargetRef(target_type="workload", namespace="default", workload_kind="Job", workload_name="test-job"),
+        time_window=TimeWindow(
+            window="1h",
+            start_time=datetime(2026, 2, 18, 9, 5, 0, tzinfo=timezone.utc),
+            end_time=datetime(2026, 2, 18, 10, 5, 0, tzinfo=timezone.utc),
+        ),
+        evidence=Evidence(),
+    )
+    mock_k8s_provider.list_pods.return_value = [
+        {"metadata": {"name": "test-job-abc12", "creationTimestamp": "2026-02-18T10:00:05Z"}},
+    ]
+
+    investigate_job_failure_playbook(investigation)
+
+    reasons = [e["reason"] for e in investigation.evidence.k8s.pod_events]
+    assert reasons == ["Failed", "BackoffLimitExceeded"]
+    mock_get_events.assert_called_once()
+
+
+def test_validate_aws_resources_never_runs_regexes_without_signal_tokens(monkeypatch):
+    """Errors lacking s3/bucket/botocore exit on the token scan, before any text is joined or searched."""
+    from agent.collectors import job_failure
+
+    monkeypatch.setenv("AWS_EVIDENCE_ENABLED", "true")
+    s3_re = MagicMock()
+    monkeypatch.setattr(job_failure, "_S3_ERR_RE", s3_re)
+    inv = _aws_validation_investigation([f"ERROR: 403 Forbidden from upstream {i}" for i in range(100)])
+
+    job_failure._validate_aws_resources(inv)
+
+    s3_re.search.assert_not_called()
+    assert not inv.evidence.aws.metadata
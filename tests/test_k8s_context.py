@@ -0,0 +1,82 @@
+"""Unit tests for the shared K8s pod context gatherer."""
+
+from __future__ import annotations
+
+import pytest
+
+
+def test_gather_pod_context_collects_all_sections(monkeypatch: pytest.MonkeyPatch) -> None:
+    from agent.collectors import k8s_context
+
+    monkeypatch.setattr(k8s_context, "get_pod_info", lambda pod, ns: {"name": pod})
+    monkeypatch.setattr(k8s_context, "get_pod_conditions", lambda pod, ns: [{"type": "Ready"}])
+    monkeypatch.setattr(
+        k8s_context, "get_pod_events", lambda pod, ns, limit=20: [{"reason": "BackOff", "limit": limit}]
+    )
+    monkeypatch.setattr(
+        k8s_context,
+        "get_pod_owner_chain",
+        lambda pod, ns: {"workload": {"kind": "Deployment", "name": "api"}},
+    )
+    monkeypatch.setattr(
+        k8s_context,
+        "get_workload_rollout_status",
+        lambda *, namespace, kind, name: {"kind": kind, "name": name},
+    )
+
+    ctx = k8s_context.gather_pod_context("api-123", "ns1", events_limit=7)
+
+    assert ctx["pod_info"] == {"name": "api-123"}
+    assert ctx["pod_conditions"] == [{"type": "Ready"}]
+    assert ctx["pod_events"] == [{"reason": "BackOff", "limit": 7}]
+    assert ctx["rollout_status"] == {"kind": "Deployment", "name": "api"}
+    assert ctx["errors"] == []
+
+
+def test_gather_pod_context_reports_errors_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    from agent.collectors import k8s_context
+
+    def boom(name):  # type: ignore[no-untyped-def]
+        def _raise(*args, **kwargs):  # type: ignore[no-untyped-def]
+            raise RuntimeError(name)
+
+        return _raise
+
+    monkeypatch.setattr(k8s_context, "get_pod_info", boom("info"))
+    monkeypatch.setattr(k8s_context, "get_pod_conditions", lambda pod, ns: [])
+    monkeypatch.setattr(k8s_context, "get_pod_events", boom("events"))
+    monkeypatch.setattr(k8s_context, "get_pod_owner_chain", boom("owner"))
+    monkeypatch.setattr(k8s_context, "get_workload_rollout_status", boom("rollout"))
+
+    ctx = k8s_context.gather_pod_context("api-123", "ns1")
+
+    assert ctx["pod_info"] is None
+    assert ctx["pod_events"] == []
+    assert ctx["owner_chain"] is None
+    assert ctx["rollout_status"] is None
+    assert ctx["errors"] == ["pod_info: info", "pod_events: events", "owner_chain: owner"]
+
+
+def test_gather_pod_context_reuses_matching_rollout_status(monkeypatch: pytest.MonkeyPatch) -> None:
+    from agent.collectors import k8s_context
+
+    calls = []
+    monkeypatch.setattr(k8s_context, "get_pod_info", lambda pod, ns: None)
+    monkeypatch.setattr(k8s_context, "get_pod_conditions", lambda pod, ns: [])
+    monkeypatch.setattr(k8s_context, "get_pod_events", lambda pod, ns, limit=20: [])
+    monkeypatch.setattr(
+        k8s_context, "get_pod_owner_chain", lambda pod, ns: {"workload": {"kind": "Job", "name": "etl"}}
+    )
+    monkeypatch.setattr(
+        k8s_context,
+        "get_workload_rollout_status",
+        lambda *, namespace, kind, name: calls.append((kind, name)) or {"kind": kind, "name": name, "fresh": True},
+    )
+
+    known = {"kind": "Job", "name": "etl", "failed": 1}
+    assert k8s_context.gather_pod_context("etl-abc12", "ns1", rollout_status=known)["rollout_status"] is known
+    assert calls == []
+
+    other = {"kind": "Job", "name": "other"}
+    assert k8s_context.gather_pod_context("etl-abc12", "ns1", rollout_status=other)["rollout_status"]["fresh"]
+    assert calls == [("Job", "etl")]
@@ -0,0 +1,49 @@
+"""Tests for streamed pod log reads in the K8s provider."""
+
+from unittest.mock import MagicMock, patch
+
+
+def test_read_pod_log_streams_and_keeps_tail():
+    from agent.providers.k8s_provider import read_pod_log
+
+    with patch("agent.providers.k8s_provider._get_core_v1") as mock_core_v1:
+        mock_api = MagicMock()
+        mock_core_v1.return_value = mock_api
+        resp = MagicMock()
+        resp.stream.return_value = iter([b"line1\nli", b"ne2\nline3\n", b"line4"])
+        mock_api.read_namespaced_pod_log.return_value = resp
+
+        out = read_pod_log("p1", "ns1", container="app", previous=True, tail_lines=2)
+
+    assert out == "line3\nline4"
+    kwargs = mock_api.read_namespaced_pod_log.call_args.kwargs
+    assert kwargs["_preload_content"] is False
+    assert kwargs["container"] == "app"
+    assert kwargs["previous"] is True
+    resp.release_conn.assert_called_once()
+
+
+def test_read_log_tail_caps_oversize_lines():
+    from agent.providers import k8s_provider
+
+    chunks = [b"x" * 10] * 5 + [b"end\nshort\n", b"y" * 12]
+    with patch.object(k8s_provider, "_LOG_LINE_MAX_BYTES", 8):
+        out = k8s_provider._read_log_tail(iter(chunks), 10)
+
+    assert out.split("\n") == ["xxxxxend", "short", "yyyyyyyy"]
+
+
+def test_read_pod_log_returns_none_on_error():
+    from agent.providers.k8s_provider import read_pod_log
+
+    with patch("agent.providers.k8s_provider._get_core_v1") as mock_core_v1:
+        mock_core_v1.return_value.read_namespaced_pod_log.side_effect = RuntimeError("gone")
+        assert read_pod_log("p1", "ns1", previous=True) is None
+
+
+def test_get_k8s_provider_returns_shared_instance():
+    from agent.providers.k8s_provider import DefaultK8sProvider, get_k8s_provider
+
+    provider = get_k8s_provider()
+    assert isinstance(provider, DefaultK8sProvider)
+    assert get_k8s_provider() is provider
@@ -0,0 +1,141 @@
+"""Unit tests for deterministic log severity parsing."""
+
+from agent.collectors.log_parser import _classify_severity, parse_log_entries
+
+
+def test_classify_severity_matches_each_level():
+    assert _classify_severity("FATAL: cannot open config") == ("FATAL", "FATAL")
+    assert _classify_severity("PANIC in worker goroutine") == ("EXCEPTION", "PANIC")
+    assert _classify_severity("Traceback (most recent call last):") == ("EXCEPTION", "Traceback")
+    assert _classify_severity("level=error msg=boom") == ("ERROR", "error")
+
+
+def test_classify_severity_rejects_lines_without_keywords():
+    assert _classify_severity('level=info msg="processed batch 12"') == (None, "")
+    # Keyword present but not as a whole word: falls through to the regexes and still rejects
+    assert _classify_severity("errorless run completed") == (None, "")
+
+
+def test_parse_log_entries_stops_at_limit():
+    entries = [{"message": "ok"}] * 3 + [{"message": f"ERROR {i}"} for i in range(10)]
+
+    result = parse_log_entries(entries, limit=4)
+
+    assert [e["line_number"] for e in result["parsed_errors"]] == [3, 4, 5, 6]
+    assert result["metadata"]["total_lines"] == 13
+    assert result["metadata"]["error_count"] == 4
+
+
+def test_classify_severity_keeps_priority_over_position():
+    # The ERROR keyword comes first, but FATAL/EXCEPTION patterns still win, as with per-pattern searches
+    assert _classify_severity("error: worker crashed, FATAL shutdown") == ("FATAL", "FATAL")
+    assert _classify_severity("Error while handling request: Exception raised") == ("EXCEPTION", "Exception")
+    assert _classify_severity("Exception in handler, critical path aborted") == ("FATAL", "critical")
+
+
+def test_extract_message_and_timestamp_field_fallbacks():
+    from agent.collectors.log_parser import _extract_message, _extract_timestamp
+
+    assert _extract_message({"message": "m", "_msg": "other"}) == "m"
+    assert _extract_message({"message": None, "_msg": "vl"}) == "vl"
+    assert _extract_message({"log": ["first", "second"]}) == "first"
+    assert _extract_message({"level": "info"}) == "{'level': 'info'}"
+    assert _extract_timestamp({"_time": "2026-02-18T10:00:00Z"}) == "2026-02-18T10:00:00Z"
+    assert _extract_timestamp({}) == ""
+
+
+def test_parse_log_entries_large_batches_use_batch_prefilter():
+    clean = [{"message": f"level=info n={i}", "timestamp": str(i)} for i in range(200)]
+
+    result = parse_log_entries(clean)
+    assert result["parsed_errors"] == []
+    assert result["metadata"]["total_lines"] == 200
+
+    result = parse_log_entries(clean + [{"message": "level=error boom", "timestamp": "t-err"}])
+    assert [(e["line_number"], e["timestamp"]) for e in result["parsed_errors"]] == [(200, "t-err")]
+
+
+def test_parse_log_entries_truncates_and_handles_zero_limit():
+    long_line = "ERROR " + "x" * 20
+
+    result = parse_log_entries([{"message": long_line}], max_message_length=10)
+    assert result["parsed_errors"][0]["message"] == "ERROR xxxx... (truncated)"
+
+    assert parse_log_entries([{"message": "ERROR boom"}], limit=0)["parsed_errors"] == []
+
+
+def test_exception_indicators_regex_matches_each_indicator():
+    from agent.collectors.log_parser import _EXCEPTION_INDICATORS_RE
+
+    for line in (
+        "ValueError Exception: bad input",
+        "Traceback (most recent call last):",
+        "panic: nil map",
+        "at com.example.Foo.bar(Foo.java:10)",
+        "first line\n    at frame",
+        "Caused by: java.io.IOException",
+    ):
+        assert _EXCEPTION_INDICATORS_RE.search(line), line
+    assert not _EXCEPTION_INDICATORS_RE.search("level=info msg=ok")
+
+
+def test_summarize_parsed_errors_counts_and_top_examples():
+    from agent.collectors.log_parser import summarize_parsed_errors
+
+    errors = [
+        {"severity": "ERROR", "message": "db timeout", "timestamp": "t1"},
+        {"severity": "FATAL", "message": "x" * 200, "timestamp": ""},
+        {"severity": "ERROR", "message": "retry failed"},
+    ]
+
+    assert summarize_parsed_errors([]) == "No ERROR/FATAL/Exception patterns found in logs."
+    assert summarize_parsed_errors(errors, top_n=2).splitlines() == [
+        "Found 3 error patterns:",
+        "- 1 FATAL patterns",
+        "- 2 ERROR patterns",
+        "",
+        "Top 2 examples:",
+        "- [ERROR] [t1] db timeout",
+        "- [FATAL] " + "x" * 150 + "...",
+    ]
+
+
+def test_message_extractor_binds_batch_field_and_matches_generic_extraction():
+    from agent.collectors.log_parser import _extract_message, _message_extractor
+
+    assert _message_extractor({"message": "m"}) is _extract_message
+    assert _message_extractor({"log": ["a"]}) is _extract_message
+
+    extract = _message_extractor({"_msg": "first"})
+    assert extract is not _extract_message
+    for entry in (
+        {"_msg": "vl"},
+        {"_msg": "vl", "message": "wins"},
+        {"_msg": None, "msg": "fallback"},
+        {"text": "t"},
+    ):
+        assert extract(entry) == _extract_message(entry)
+
+
+def test_literal_severity_matching_agrees_with_severity_patterns():
+    from agent.collectors.log_parser import SEVERITY_PATTERNS
+
+    def reference(message):  # type: ignore[no-untyped-def]
+        for pattern, severity in SEVERITY_PATTERNS:
+            match = pattern.search(message)
+            if match:
+                return severity, match.group(0)
+        return None, ""
+
+    for line in (
+        "2026-02-18T10:00:00Z level=error msg=request failed",
+        "errorless run, then ERROR_CODE=5 and finally Error.",
+        "panic: nil map",
+        "panic:boom in worker",
+        "Critical_section entered; critical path done",
+        "java.lang.IllegalStateException: boom",
+        "café-error déjàFATAL fatalé FATAL",
+        "Traceback (most recent call last):",
+        "error",
+    ):
+        assert _classify_severity(line) == reference(line), line
@@ -496,3 +496,73 @@ def test_loki_fallback_with_container():
         # Verify successful result
         assert result["status"] == "ok"
         assert 'container="mysql"' in result["query_used"]
+
+
+def test_loki_label_selectors_replace_pod_regex():
+    """Indexed label selectors should produce a single equality LogQL selector (no pod regex)."""
+    from agent.providers.logs_provider import _fetch_from_loki
+
+    start = datetime.now() - timedelta(hours=1)
+    end = datetime.now()
+
+    with patch("agent.providers.logs_provider.requests.get") as mock_get:
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "data": {"result": [{"stream": {"namespace": "batch"}, "values": [[str(int(end.timestamp() * 1e9)), "x"]]}]}
+        }
+        mock_get.return_value = mock_response
+
+        result = _fetch_from_loki(
+            logs_url="http://loki:3100",
+            pod_name="etl-.*",
+            namespace="batch",
+            start_time=start,
+            end_time=end,
+            limit=100,
+            container=None,
+            timeout_s=10.0,
+            use_regex=True,
+            label_selectors={"job_name": "etl-123"},
+        )
+
+        mock_get.assert_called_once()
+        assert mock_get.call_args[1]["params"]["query"] == '{namespace="batch", job_name="etl-123"}'
+        assert result["status"] == "ok"
+
+
+def test_victorialogs_label_selectors_use_exact_match():
+    """VictoriaLogs label selectors should be exact field matches."""
+    from agent.providers.logs_provider import _fetch_from_victorialogs
+
+    start = datetime.now() - timedelta(hours=1)
+    end = datetime.now()
+
+    with patch("agent.providers.logs_provider.requests.get") as mock_get:
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = ""
+        mock_get.return_value = mock_response
+
+        result = _fetch_from_victorialogs(
+            logs_url="http://victorialogs:9428",
+            pod_name="etl-.*",
+            namespace="batch",
+            start_time=start,
+            end_time=end,
+            limit=100,
+            container=None,
+            timeout_s=10.0,
+            label_selectors={"job_name": "etl-123"},
+        )
+
+        assert result["status"] == "empty"
+        assert result["query_used"] == 'namespace:"batch" AND job_name:"etl-123"'
+
+
+def test_get_logs_provider_returns_shared_instance():
+    from agent.providers.logs_provider import DefaultLogsProvider, get_logs_provider
+
+    provider = get_logs_provider()
+    assert isinstance(provider, DefaultLogsProvider)
+    assert get_logs_provider() is provider
@@ -0,0 +1,159 @@
+"""Unit tests for the non-pod baseline collector helpers."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+
+def test_rollout_status_from_kube_state_metrics_deployment(monkeypatch: pytest.MonkeyPatch) -> None:
+    from agent.collectors import nonpod_baseline
+
+    values = {
+        "kube_deployment_status_replicas": "3",
+        "kube_deployment_status_replicas_ready": "2",
+        "kube_deployment_status_replicas_updated": "3",
+        "kube_deployment_status_observed_generation": "7",
+    }
+    seen = []
+
+    def fake_query(query, at):  # type: ignore[no-untyped-def]
+        seen.append(query)
+        metric = query.split("{", 1)[0]
+        if metric not in values:
+            return []
+        return [{"metric": {}, "value": [0, values[metric]]}]
+
+    monkeypatch.setattr(nonpod_baseline, "query_prometheus_instant", fake_query)
+
+    rs = nonpod_baseline._rollout_status_from_kube_state_metrics(
+        namespace="prod", kind="Deployment", name="api", at=datetime(2026, 2, 18, tzinfo=timezone.utc)
+    )
+
+    assert rs == {
+        "kind": "Deployment",
+        "name": "api",
+        "replicas": 3,
+        "ready_replicas": 2,
+        "updated_replicas": 3,
+        "unavailable_replicas": None,
+        "observed_generation": 7,
+        "source": "kube_state_metrics",
+    }
+    assert 'kube_deployment_status_replicas{namespace="prod",deployment="api"}' in seen
+    assert len(seen) == 5
+
+
+def test_rollout_status_from_kube_state_metrics_job_and_unknown_kind(monkeypatch: pytest.MonkeyPatch) -> None:
+    from agent.collectors import nonpod_baseline
+
+    def fake_query(query, at):  # type: ignore[no-untyped-def]
+        if query.startswith("kube_job_status_failed"):
+            raise RuntimeError("prom down")
+        return [{"metric": {}, "value": [0, "1"]}]
+
+    monkeypatch.setattr(nonpod_baseline, "query_prometheus_instant", fake_query)
+
+    rs = nonpod_baseline._rollout_status_from_kube_state_metrics(namespace="b", kind="Job", name="etl", at=None)
+    assert rs == {
+        "kind": "Job",
+        "name": "etl",
+        "failed": None,
+        "active": 1,
+        "succeeded": 1,
+        "source": "kube_state_metrics",
+    }
+
+    assert (
+        nonpod_baseline._rollout_status_from_kube_state_metrics(namespace="b", kind="CronJob", name="x", at=None)
+        is None
+    )
+
+
+def test_collect_nonpod_baseline_runs_prom_queries_and_records_failures(monkeypatch: pytest.MonkeyPatch) -> None:
+    from agent.collectors import nonpod_baseline
+    from agent.core.models import AlertInstance, Investigation, TimeWindow
+
+    seen = []
+
+    def fake_query(query, at):  # type: ignore[no-untyped-def]
+        seen.append(query)
+        if "service=" in query:
+            raise RuntimeError("timeout")
+        # sum(up == 0) of a healthy job is an empty vector, so only the total series comes back
+        return [{"metric": {"tarka_baseline": "up_job_total"}, "value": [0, "4"]}]
+
+    monkeypatch.setattr(nonpod_baseline, "query_prometheus_instant", fake_query)
+    now = datetime(2026, 2, 18, tzinfo=timezone.utc)
+    inv = Investigation(
+        alert=AlertInstance(fingerprint="fp", labels={"job": "api", "namespace": "prod", "service": "api-svc"}),
+        time_window=TimeWindow(window="1h", start_time=now, end_time=now),
+    )
+
+    nonpod_baseline.collect_nonpod_baseline(inv)
+
+    # One round-trip per selector: down and total are combined
+    assert len(seen) == 2
+    assert seen[0] == (
+        'label_replace(sum(up{job="api"} == 0), "tarka_baseline", "up_job_down", "", "")'
+        ' or label_replace(count(up{job="api"}), "tarka_baseline", "up_job_total", "", "")'
+    )
+    baseline = inv.evidence.metrics.prom_baseline
+    assert baseline["up_job_down"] == []
+    assert baseline["up_job_total"] == [{"metric": {}, "value": [0, "4"]}]
+    assert baseline["up_service_down"] == baseline["up_service_total"] == []
+    assert list(baseline["queries_used"]) == ["up_job_down", "up_job_total", "up_service_down", "up_service_total"]
+    assert inv.errors == [
+        "Prometheus baseline (up_service_down) failed: timeout",
+        "Prometheus baseline (up_service_total) failed: timeout",
+    ]
+
+
+def test_collect_nonpod_baseline_queries_only_missing_half_separately(monkeypatch: pytest.MonkeyPatch) -> None:
+    from agent.collectors import nonpod_baseline
+    from agent.core.models import AlertInstance, Investigation, TimeWindow
+
+    seen = []
+
+    def fake_query(query, at):  # type: ignore[no-untyped-def]
+        seen.append(query)
+        return [{"metric": {}, "value": [0, "1"]}]
+
+    monkeypatch.setattr(nonpod_baseline, "query_prometheus_instant", fake_query)
+    now = datetime(2026, 2, 18, tzinfo=timezone.utc)
+    inv = Investigation(
+        alert=AlertInstance(fingerprint="fp", labels={"job": "api"}),
+        time_window=TimeWindow(window="1h", start_time=now, end_time=now),
+    )
+    inv.evidence.metrics.prom_baseline = {"up_job_down": []}  # type: ignore[attr-defined]
+
+    nonpod_baseline.collect_nonpod_baseline(inv)
+
+    assert seen == ['count(up{job="api"})']
+    assert inv.evidence.metrics.prom_baseline["up_job_total"] == [{"metric": {}, "value": [0, "1"]}]
+
+
+def test_rollout_status_from_kube_state_metrics_escapes_and_caches(monkeypatch: pytest.MonkeyPatch) -> None:
+    from agent.collectors import nonpod_baseline
+
+    seen = []
+
+    def fake_query(query, at):  # type: ignore[no-untyped-def]
+        seen.append((query, at))
+        return [{"metric": {}, "value": [0, "1"]}]
+
+    monkeypatch.setattr(nonpod_baseline, "query_prometheus_instant", fake_query)
+    at = datetime(2026, 2, 18, 10, 0, 7, tzinfo=timezone.utc)
+
+    nonpod_baseline._rollout_status_from_kube_state_metrics(namespace="b", kind="Job", name='etl"}or{x="', at=at)
+    assert seen[0][0].endswith('{namespace="b",job_name="etl\\"}or{x=\\""}')
+    # Evaluated at the start of the 15s bucket
+    assert {a for _, a in seen} == {datetime(2026, 2, 18, 10, 0, 0, tzinfo=timezone.utc)}
+
+    # Same bucket: served from cache; next bucket: queried again
+    nonpod_baseline._rollout_status_from_kube_state_metrics(namespace="b", kind="Job", name='etl"}or{x="', at=at)
+    assert len(seen) == 3
+    later = datetime(2026, 2, 18, 10, 0, 15, tzinfo=timezone.utc)
+    nonpod_baseline._rollout_status_from_kube_state_metrics(namespace="b", kind="Job", name='etl"}or{x="', at=later)
+    assert len(seen) == 6
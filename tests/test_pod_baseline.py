@@ -0,0 +1,89 @@
+"""Unit tests for the shared pod baseline collector."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from agent.core.models import AlertInstance, Investigation, TargetRef, TimeWindow
+
+
+def _investigation() -> Investigation:
+    now = datetime(2026, 2, 18, 10, 0, tzinfo=timezone.utc)
+    return Investigation(
+        alert=AlertInstance(fingerprint="fp", labels={"container": "app"}, annotations={}),
+        time_window=TimeWindow(window="1h", start_time=now, end_time=now),
+        target=TargetRef(target_type="pod", namespace="prod", pod="api-123"),
+    )
+
+
+def test_collect_pod_baseline_applies_results_and_errors_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    from agent.collectors import pod_baseline
+
+    def boom(*args, **kwargs):  # type: ignore[no-untyped-def]
+        raise RuntimeError("prom down")
+
+    monkeypatch.setattr(
+        pod_baseline,
+        "gather_pod_context",
+        lambda pod, ns, events_limit, rollout_status: {"pod_info": {"name": pod}, "errors": ["owner_chain: x"]},
+    )
+    monkeypatch.setattr(pod_baseline, "query_pod_not_healthy", boom)
+    monkeypatch.setattr(pod_baseline, "query_pod_restarts", lambda *a, **kw: {"restarts": 2})
+    monkeypatch.setattr(pod_baseline, "query_cpu_usage_and_limits", boom)
+    monkeypatch.setattr(pod_baseline, "query_memory_usage_and_limits", lambda **kw: {"container": kw["container"]})
+    monkeypatch.setattr(
+        pod_baseline,
+        "fetch_recent_logs",
+        lambda *a, **kw: {"entries": [{"message": "ERROR boom"}], "status": "ok", "backend": "loki"},
+    )
+
+    inv = _investigation()
+    pod_baseline.collect_pod_baseline(inv)
+
+    assert inv.evidence.k8s.pod_info == {"name": "api-123"}
+    assert inv.evidence.metrics.pod_phase_signal is None
+    assert inv.evidence.metrics.restart_data == {"restarts": 2}
+    assert inv.evidence.metrics.memory_metrics == {"container": "app"}
+    assert inv.evidence.logs.logs_status == "ok"
+    assert inv.evidence.logs.parsed_errors[0]["severity"] == "ERROR"
+    assert inv.errors == [
+        "K8s context: owner_chain: x",
+        "Failed to query pod phase signal: prom down",
+        "Failed to query CPU metrics: prom down",
+    ]
+
+
+def test_collect_pod_baseline_skips_existing_evidence(monkeypatch: pytest.MonkeyPatch) -> None:
+    from agent.collectors import pod_baseline
+
+    def unexpected(*args, **kwargs):  # type: ignore[no-untyped-def]
+        raise AssertionError("should not be called")
+
+    for name in (
+        "gather_pod_context",
+        "query_pod_not_healthy",
+        "query_pod_restarts",
+        "query_cpu_usage_and_limits",
+        "query_memory_usage_and_limits",
+    ):
+        monkeypatch.setattr(pod_baseline, name, unexpected)
+
+    def logs_down(*args, **kwargs):  # type: ignore[no-untyped-def]
+        raise OSError("x")
+
+    monkeypatch.setattr(pod_baseline, "fetch_recent_logs", logs_down)
+
+    inv = _investigation()
+    inv.evidence.k8s.pod_info = {"name": "cached"}
+    inv.evidence.metrics.pod_phase_signal = {}
+    inv.evidence.metrics.restart_data = {}
+    inv.evidence.metrics.cpu_metrics = {}
+    inv.evidence.metrics.memory_metrics = {}
+
+    pod_baseline.collect_pod_baseline(inv)
+
+    assert inv.evidence.k8s.pod_info == {"name": "cached"}
+    assert inv.evidence.logs.logs_status == "unavailable"
+    assert inv.errors == ["Failed to fetch logs: x"]
@@ -0,0 +1,71 @@
+"""Unit tests for the cached lookups behind image-pull diagnostics."""
+
+from __future__ import annotations
+
+import pytest
+
+
+def test_service_account_info_cached_per_ttl_bucket(monkeypatch: pytest.MonkeyPatch) -> None:
+    from agent.collectors import pod_not_healthy
+
+    calls = []
+
+    def fake_sa_info(ns, name):  # type: ignore[no-untyped-def]
+        calls.append((ns, name))
+        return {"name": name, "annotations": {}}
+
+    monkeypatch.setattr(pod_not_healthy, "get_service_account_info", fake_sa_info)
+
+    assert pod_not_healthy._service_account_info_cached("prod", "api", 1) == {"name": "api", "annotations": {}}
+    pod_not_healthy._service_account_info_cached("prod", "api", 1)
+    pod_not_healthy._service_account_info_cached("prod", "api", 2)
+
+    assert calls == [("prod", "api"), ("prod", "api")]
+
+
+def test_service_account_info_returns_independent_copies(monkeypatch: pytest.MonkeyPatch) -> None:
+    from agent.collectors import pod_not_healthy
+
+    calls = []
+
+    def fake_sa_info(ns, name):  # type: ignore[no-untyped-def]
+        calls.append((ns, name))
+        return {"name": name, "annotations": {"team": "core"}, "image_pull_secrets": ["regcred"]}
+
+    monkeypatch.setattr(pod_not_healthy, "get_service_account_info", fake_sa_info)
+
+    first = pod_not_healthy._service_account_info("prod", "api")
+    first["annotations"]["team"] = "mutated"
+    first["image_pull_secrets"].append("other")
+
+    second = pod_not_healthy._service_account_info("prod", "api")
+    assert second == {"name": "api", "annotations": {"team": "core"}, "image_pull_secrets": ["regcred"]}
+    assert len(calls) == 1
+
+
+def test_ecr_describe_image_caches_only_definitive_results(monkeypatch: pytest.MonkeyPatch) -> None:
+    from agent import image_pull
+    from agent.collectors import pod_not_healthy
+
+    statuses = iter(["skipped_no_creds", "exists", "error"])
+    calls = []
+
+    def fake_describe(**kwargs):  # type: ignore[no-untyped-def]
+        calls.append(kwargs)
+        return {"status": next(statuses)}
+
+    monkeypatch.setattr(image_pull, "ecr_describe_image", fake_describe)
+    kwargs = {"region": "us-east-1", "repository": "app", "tag": "v1", "digest": None, "registry_id": None}
+
+    assert pod_not_healthy._ecr_describe_image(**kwargs)["status"] == "skipped_no_creds"
+    assert pod_not_healthy._ecr_describe_image(**kwargs)["status"] == "exists"
+    cached = pod_not_healthy._ecr_describe_image(**kwargs)
+    assert cached["status"] == "exists"
+    assert len(calls) == 2
+
+    # Callers get a copy, mutating it does not poison the cache
+    cached["status"] = "mutated"
+    assert pod_not_healthy._ecr_describe_image(**kwargs)["status"] == "exists"
+
+    assert pod_not_healthy._ecr_describe_image(**{**kwargs, "tag": "v2"})["status"] == "error"
+    assert len(calls) == 3
@@ -231,3 +231,21 @@ def test_report_contains_enrichment_section_snapshot() -> None:
     # Snapshot files may end with extra trailing newlines depending on editor behavior.
     # Ignore trailing whitespace/newlines but keep exact section body stable.
     assert sec.rstrip() == fixture.rstrip()
+
+
+def test_image_pull_waiting_picks_first_pulling_container() -> None:
+    from agent.collectors.pod_not_healthy import _image_pull_waiting
+
+    statuses = [
+        "garbage",
+        {"name": "init", "state": "bogus"},
+        {"name": "app", "state": {"waiting": {"reason": "CrashLoopBackOff"}}},
+        {"name": "sidecar", "state": {"waiting": {"reason": "ErrImagePull", "message": "denied"}}},
+        {"name": "other", "state": {"waiting": {"reason": "ImagePullBackOff"}}},
+    ]
+
+    assert next(filter(None, map(_image_pull_waiting, statuses)), None) == (
+        "sidecar",
+        {"reason": "ErrImagePull", "message": "denied"},
+    )
+    assert _image_pull_waiting({"name": "app", "state": {"running": {}}}) is None
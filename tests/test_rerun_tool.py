@@ -71,12 +71,8 @@ def test_rerun_investigation_with_valid_time_window(mock_policy, mock_analysis_j
         mock_investigation.time_window.window = "30m"
         mock_run.return_value = mock_investigation
 
-        with patch("agent.chat.tools.investigation_to_json_dict") as mock_json:
-            mock_json.return_value = {
-                "analysis": {
-                    "verdict": {"label": "Updated verdict"},
-                }
-            }
+        with patch("agent.chat.tools.analysis_to_json_dict") as mock_json:
+            mock_json.return_value = {"verdict": {"label": "Updated verdict"}}
 
             # Call with valid time_window
             result = run_tool(
@@ -115,9 +111,26 @@ def test_rerun_investigation_rejects_too_large_window(mock_policy, mock_analysis
             analysis_json=mock_analysis_json,
         )
 
-        # Should fail with time_window_too_large
+        # Should fail with time_window_too_large without running the pipeline
         assert result.ok is False
         assert result.error == "time_window_too_large"
+        mock_run.assert_not_called()
+
+
+def test_rerun_investigation_rejects_invalid_window(mock_policy, mock_analysis_json):
+    """Test that an unparseable time_window is rejected before running the pipeline."""
+    with patch("agent.chat.tools.run_investigation") as mock_run:
+        result = run_tool(
+            tool="rerun.investigation",
+            args={"time_window": "yesterday"},
+            policy=mock_policy,
+            action_policy=None,
+            analysis_json=mock_analysis_json,
+        )
+
+        assert result.ok is False
+        assert result.error == "time_window_invalid"
+        mock_run.assert_not_called()
 
 
 def test_rerun_investigation_tool_description_includes_parameters():
@@ -206,8 +219,8 @@ def test_rerun_investigation_preserves_original_alert_timestamp(mock_policy):
         mock_investigation.time_window.window = "30m"
         mock_run.return_value = mock_investigation
 
-        with patch("agent.chat.tools.investigation_to_json_dict") as mock_json:
-            mock_json.return_value = {"analysis": {}}
+        with patch("agent.chat.tools.analysis_to_json_dict") as mock_json:
+            mock_json.return_value = {}
 
             # Call rerun with 30m window (default: reference_time="original")
             result = run_tool(
@@ -246,8 +259,8 @@ def test_rerun_investigation_with_reference_time_original(mock_policy, mock_anal
         mock_investigation.time_window.window = "1h"
         mock_run.return_value = mock_investigation
 
-        with patch("agent.chat.tools.investigation_to_json_dict") as mock_json:
-            mock_json.return_value = {"analysis": {}}
+        with patch("agent.chat.tools.analysis_to_json_dict") as mock_json:
+            mock_json.return_value = {}
 
             result = run_tool(
                 tool="rerun.investigation",
@@ -272,8 +285,8 @@ def test_rerun_investigation_with_reference_time_now(mock_policy, mock_analysis_
         mock_investigation.time_window.window = "30m"
         mock_run.return_value = mock_investigation
 
-        with patch("agent.chat.tools.investigation_to_json_dict") as mock_json:
-            mock_json.return_value = {"analysis": {}}
+        with patch("agent.chat.tools.analysis_to_json_dict") as mock_json:
+            mock_json.return_value = {}
 
             with patch("agent.chat.tools.datetime") as mock_datetime:
                 # Mock current time
@@ -59,3 +59,21 @@ def test_unknown_key_becomes_token() -> None:
     q = parse_search_query("foo:bar ns:payments")
     assert q.filters["namespace"] == ["payments"]
     assert q.tokens == ["foo:bar"]
+
+
+def test_quoted_escapes_and_unterminated_quotes() -> None:
+    q = parse_search_query(r'pod:"api \"v2\" \\ x" svc:' + "'it\\'s' " + r'"free \"text\""')
+    assert q.filters["pod"] == ['api "v2" \\ x']
+    assert q.filters["service"] == ["it's"]
+    assert q.tokens == ['free "text"']
+
+    # Escaped closing quote leaves the quote unterminated: fall back to raw whitespace splitting
+    q = parse_search_query(r'ns:"pay\" prod')
+    assert q.filters["namespace"] == [r'"pay\"']
+    assert q.tokens == ["prod"]
+
+
+def test_unknown_key_with_quoted_value_and_trailing_key() -> None:
+    q = parse_search_query('foo:"a b" ns:')
+    assert q.filters == {}
+    assert q.tokens == ['foo:"a', 'b"']
@@ -0,0 +1,40 @@
+"""Unit tests for shared time window parsing."""
+
+from __future__ import annotations
+
+from datetime import timedelta, timezone
+
+import pytest
+
+from agent.core.time_window import parse_time_window
+
+
+@pytest.mark.parametrize(
+    "window,expected",
+    [
+        ("1h", timedelta(hours=1)),
+        ("30m", timedelta(minutes=30)),
+        ("2h30m", timedelta(hours=2, minutes=30)),
+        ("2h30", timedelta(hours=2, minutes=30)),
+    ],
+)
+def test_parse_time_window_durations(window: str, expected: timedelta) -> None:
+    start, end = parse_time_window(window)
+    assert end.tzinfo is timezone.utc
+    assert end - start == expected
+
+
+def test_parse_time_window_is_relative_to_now_on_every_call() -> None:
+    from agent.core import time_window
+
+    _, end1 = parse_time_window("5m")
+    _, end2 = parse_time_window("5m")
+    assert end2 >= end1
+    assert time_window._parse_window_delta.cache_info().hits >= 1
+
+
+def test_parse_time_window_rejects_invalid_format() -> None:
+    with pytest.raises(ValueError, match="Invalid time window format"):
+        parse_time_window("1d")
+    with pytest.raises(ValueError):
+        parse_time_window("xh")